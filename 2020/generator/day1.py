@@ -0,0 +1,19 @@
+# Size of an actual input
+N_EXPENSES = 200
+
+
+def generate(rng, scale=1.0, target_expense=2020):
+    n_expenses = max(5, round(N_EXPENSES * scale))
+
+    # The only pair and triplet summing to the target: the other expenses are greater
+    pair_expense = rng.randrange(1, target_expense // 2)
+    triplet_expenses = [rng.randrange(1, target_expense // 3) for _ in range(2)]
+    triplet_expenses.append(target_expense - sum(triplet_expenses))
+    expenses = [pair_expense, target_expense - pair_expense] + triplet_expenses
+    expenses.extend(
+        rng.randrange(target_expense + 1, 100 * target_expense)
+        for _ in range(n_expenses - len(expenses))
+    )
+
+    rng.shuffle(expenses)
+    return [str(expense) for expense in expenses]
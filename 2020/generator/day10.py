@@ -0,0 +1,13 @@
+# Size of an actual input
+N_ADAPTERS = 100
+
+
+def generate(rng, scale=1.0):
+    adapters = []
+    jolt = 0
+    for _ in range(max(1, round(N_ADAPTERS * scale))):
+        jolt += rng.choices([1, 3], weights=[2, 1])[0]
+        adapters.append(jolt)
+
+    rng.shuffle(adapters)
+    return [str(adapter) for adapter in adapters]
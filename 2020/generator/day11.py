@@ -0,0 +1,106 @@
+import numpy as np
+
+
+# Size of an actual input
+N_ROWS, N_COLUMNS = 90, 98
+FLOOR_DENSITY = 0.15
+# Density of floor when redrawing the cycling seats
+REDRAW_FLOOR_DENSITY = 0.05
+# Rounds after which the seats still changing are considered to be cycling
+MAX_N_ROUNDS = 1000
+
+DIRECTIONS = [(x, y) for x in range(-1, 2) for y in range(-1, 2) if not x == y == 0]
+
+
+def find_neighbour_seats(seat_layout, is_first_visible):
+    """Index of the neighbour seat of each seat, in each direction.
+
+    The neighbour is the adjacent seat (part 1), or the first visible seat (part 2).
+    Without any, it is the number of seats: the index of a seat never occupied.
+    """
+    seats = {
+        (row_idx, col_idx): seat_idx
+        for seat_idx, (row_idx, col_idx) in enumerate(
+            (row_idx, col_idx)
+            for row_idx, row in enumerate(seat_layout)
+            for col_idx, is_seat in enumerate(row)
+            if is_seat
+        )
+    }
+    neighbour_seats = np.full((len(seats), len(DIRECTIONS)), len(seats))
+    for (row_idx, col_idx), seat_idx in seats.items():
+        for direction_idx, (d_row, d_col) in enumerate(DIRECTIONS):
+            next_row_idx, next_col_idx = row_idx + d_row, col_idx + d_col
+            while (
+                is_first_visible
+                and 0 <= next_row_idx < len(seat_layout)
+                and 0 <= next_col_idx < len(seat_layout[0])
+                and (next_row_idx, next_col_idx) not in seats
+            ):
+                next_row_idx, next_col_idx = next_row_idx + d_row, next_col_idx + d_col
+            neighbour_seat_idx = seats.get((next_row_idx, next_col_idx))
+            if neighbour_seat_idx is not None:
+                neighbour_seats[seat_idx, direction_idx] = neighbour_seat_idx
+    return neighbour_seats
+
+
+def find_cycling_seats(neighbour_seats, max_occupied_neighbours):
+    """Index of the seats changing forever (none when the seating stabilizes).
+
+    The seating either stabilizes, or ends up alternating between two states.
+    """
+    # With an additional seat never occupied: where there is no neighbour
+    is_occupied = np.full(len(neighbour_seats) + 1, False)
+    prev_is_occupied = is_occupied[:-1].copy()
+    for _ in range(MAX_N_ROUNDS):
+        n_occupied_neighbours = np.sum(is_occupied[neighbour_seats], axis=1)
+        new_is_occupied = np.where(
+            is_occupied[:-1],
+            n_occupied_neighbours < max_occupied_neighbours,
+            n_occupied_neighbours == 0,
+        )
+        is_changed = new_is_occupied != is_occupied[:-1]
+        if not np.any(is_changed):
+            break
+        # Same state as two rounds ago: the changed seats are cycling
+        if np.array_equal(new_is_occupied, prev_is_occupied):
+            return np.flatnonzero(is_changed)
+        prev_is_occupied = is_occupied[:-1].copy()
+        is_occupied[:-1] = new_is_occupied
+    else:
+        return np.flatnonzero(is_changed)
+    return np.empty(0, dtype=np.int64)
+
+
+def generate(rng, scale=1.0, floor_char=".", empty_seat_char="L"):
+    seat_layout = [
+        [rng.random() >= FLOOR_DENSITY for _ in range(N_COLUMNS)]
+        for _ in range(max(1, round(N_ROWS * scale)))
+    ]
+    # Random layouts often make some seats cycle forever instead of stabilizing:
+    # redraw them (a few become floor) until the seating stabilizes with the rules
+    # of both parts (a lower density than the layout's: to keep most of the seats)
+    while True:
+        seats = [
+            (row_idx, col_idx)
+            for row_idx, row in enumerate(seat_layout)
+            for col_idx, is_seat in enumerate(row)
+            if is_seat
+        ]
+        cycling_seats = set(
+            find_cycling_seats(
+                find_neighbour_seats(seat_layout, is_first_visible=False), 4
+            ).tolist()
+        ) | set(
+            find_cycling_seats(
+                find_neighbour_seats(seat_layout, is_first_visible=True), 5
+            ).tolist()
+        )
+        if not cycling_seats:
+            return [
+                "".join(empty_seat_char if is_seat else floor_char for is_seat in row)
+                for row in seat_layout
+            ]
+        for seat_idx in sorted(cycling_seats):
+            row_idx, col_idx = seats[seat_idx]
+            seat_layout[row_idx][col_idx] = rng.random() >= REDRAW_FLOOR_DENSITY
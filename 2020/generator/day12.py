@@ -0,0 +1,14 @@
+# Size of an actual input
+N_INSTRUCTIONS = 780
+
+
+def generate(rng, scale=1.0):
+    input_lines = []
+    for _ in range(max(1, round(N_INSTRUCTIONS * scale))):
+        action = rng.choice("NESWLRFF")
+        if action in "LR":
+            value = rng.choice([90, 180, 270])
+        else:
+            value = rng.randint(1, 100)
+        input_lines.append("{}{}".format(action, value))
+    return input_lines
@@ -0,0 +1,29 @@
+# Size of an actual input
+N_BUSES = 9
+N_POSITIONS_PER_BUS = 8
+
+
+def get_primes(n_primes, min_prime=11):
+    primes = []
+    candidate = min_prime
+    while len(primes) < n_primes:
+        if all(
+            candidate % divisor != 0 for divisor in range(2, int(candidate**0.5) + 1)
+        ):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def generate(rng, scale=1.0, unavailable_char="x"):
+    n_buses = max(2, round(N_BUSES * scale))
+    n_positions = N_POSITIONS_PER_BUS * n_buses
+
+    # The bus IDs are pairwise coprime: the buses can be synchronized
+    bus_ids = rng.sample(get_primes(10 * n_buses), n_buses)
+    bus_positions = [0] + sorted(rng.sample(range(1, n_positions), n_buses - 1))
+    schedule = [unavailable_char] * n_positions
+    for bus_position, bus_id in zip(bus_positions, bus_ids):
+        schedule[bus_position] = str(bus_id)
+
+    return [str(rng.randint(10**5, 10**7)), ",".join(schedule)]
@@ -0,0 +1,19 @@
+# Size of an actual input
+N_MASKS = 100
+N_BITS = 36
+# Bound the number of memory addresses written by a masked instruction
+MAX_N_FLOATING_BITS = 9
+
+
+def generate(rng, scale=1.0, unchanged_char="X"):
+    input_lines = []
+    for _ in range(max(1, round(N_MASKS * scale))):
+        mask = [rng.choice("01") for _ in range(N_BITS)]
+        for i in rng.sample(range(N_BITS), rng.randint(1, MAX_N_FLOATING_BITS)):
+            mask[i] = unchanged_char
+        input_lines.append("mask = {}".format("".join(mask)))
+        for _ in range(rng.randint(1, 6)):
+            input_lines.append(
+                "mem[{}] = {}".format(rng.randrange(2**16), rng.randrange(2**30))
+            )
+    return input_lines
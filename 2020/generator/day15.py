@@ -0,0 +1,9 @@
+# Size of an actual input
+N_INITIAL_NUMBERS = 6
+
+
+def generate(rng, scale=1.0):
+    # The number of rounds to play is fixed: the scale barely changes the solving time
+    n_initial_numbers = max(1, round(N_INITIAL_NUMBERS * scale))
+    initial_numbers = rng.sample(range(3 * n_initial_numbers + 15), n_initial_numbers)
+    return [",".join(str(initial_number) for initial_number in initial_numbers)]
@@ -0,0 +1,58 @@
+# Size of an actual input
+N_TICKETS = 240
+
+FIELDS = [
+    "departure location", "departure station", "departure platform",
+    "departure track", "departure date", "departure time", "arrival location",
+    "arrival station", "arrival platform", "arrival track", "class", "duration",
+    "price", "route", "row", "seat", "train", "type", "wagon", "zone",
+]  # fmt: skip
+# Values are split into bands, one per field
+MIN_VALUE, BAND_WIDTH = 25, 40
+INVALID_TICKET_RATIO = 0.25
+
+
+def generate(rng, scale=1.0):
+    n_fields = len(FIELDS)
+    max_value = MIN_VALUE + n_fields * BAND_WIDTH - 1
+
+    # The k-th field is valid for the bands [k, n_fields): the positions can be
+    # found by elimination, since the k-th field only gets values of the bands >= k
+    input_lines = []
+    for k, field in enumerate(FIELDS):
+        split_value = rng.randint(MIN_VALUE + k * BAND_WIDTH, max_value - 1)
+        input_lines.append(
+            "{}: {}-{} or {}-{}".format(
+                field,
+                MIN_VALUE + k * BAND_WIDTH,
+                split_value,
+                split_value + 1,
+                max_value,
+            )
+        )
+    field_order = rng.sample(range(n_fields), n_fields)
+
+    def generate_ticket(is_valid=True, is_first_band=False):
+        ticket = [
+            rng.randint(
+                MIN_VALUE + k * BAND_WIDTH,
+                MIN_VALUE + (k + 1 if is_first_band else n_fields) * BAND_WIDTH - 1,
+            )
+            for k in field_order
+        ]
+        if not is_valid:
+            ticket[rng.randrange(n_fields)] = rng.choice(
+                [rng.randint(0, MIN_VALUE - 1), rng.randint(max_value + 1, 999)]
+            )
+        return ",".join(str(value) for value in ticket)
+
+    input_lines.extend(
+        ["", "your ticket:", generate_ticket(is_first_band=True), "", "nearby tickets:"]
+    )
+    # Every position gets a value of the first band of its field
+    input_lines.append(generate_ticket(is_first_band=True))
+    for _ in range(max(1, round(N_TICKETS * scale)) - 1):
+        input_lines.append(
+            generate_ticket(is_valid=rng.random() > INVALID_TICKET_RATIO)
+        )
+    return input_lines
@@ -0,0 +1,9 @@
+# Size of an actual input
+N_ROWS, N_COLUMNS = 8, 8
+
+
+def generate(rng, scale=1.0, active_char="#", inactive_char="."):
+    return [
+        "".join(rng.choice([active_char, inactive_char]) for _ in range(N_COLUMNS))
+        for _ in range(max(1, round(N_ROWS * scale)))
+    ]
@@ -0,0 +1,23 @@
+# Size of an actual input
+N_EXPRESSIONS = 380
+MAX_DEPTH = 3
+
+
+def generate_expression(rng, depth=0):
+    operands = []
+    for _ in range(rng.randint(2, 6)):
+        if (depth < MAX_DEPTH) and (rng.random() < 0.25):
+            operands.append("({})".format(generate_expression(rng, depth + 1)))
+        else:
+            operands.append(str(rng.randint(1, 9)))
+
+    expression = operands[0]
+    for operand in operands[1:]:
+        expression += " {} {}".format(rng.choice("+*"), operand)
+    return expression
+
+
+def generate(rng, scale=1.0):
+    return [
+        generate_expression(rng) for _ in range(max(1, round(N_EXPRESSIONS * scale)))
+    ]
@@ -0,0 +1,80 @@
+# Size of an actual input
+N_MESSAGES = 400
+# Length of the messages matching the rules 42 and 31
+SUB_MESSAGE_LEN = 8
+# Rules 0, 8 and 11 refer to the rules 42 and 31
+MIN_N_RULES = 43
+
+
+def generate_partition(rng, rules, length):
+    # Pair of rules partitioning all the messages of the given length
+    if length == 1:
+        return rng.sample(["a", "b"], 2)
+
+    split_length = rng.randint(1, length - 1)
+    first_rule_1, second_rule_1 = generate_partition(rng, rules, split_length)
+    first_rule_2, second_rule_2 = generate_partition(rng, rules, length - split_length)
+    rules.append([[first_rule_1, first_rule_2], [second_rule_1, second_rule_2]])
+    if rng.random() < 0.5:
+        # Independent sub-rules matching the same messages
+        first_rule_1, second_rule_1 = generate_partition(rng, rules, split_length)
+    rules.append([[first_rule_1, second_rule_2], [second_rule_1, first_rule_2]])
+    return rng.sample([len(rules) - 2, len(rules) - 1], 2)
+
+
+def generate_message(rng, rules, rule):
+    if isinstance(rule, str):
+        return rule
+    return "".join(
+        generate_message(rng, rules, sub_rule) for sub_rule in rng.choice(rules[rule])
+    )
+
+
+def generate(rng, scale=1.0):
+    # Generated rules are indexed from 1, terminal rules are 'a' and 'b'
+    rules = [None]
+    while len(rules) < MIN_N_RULES:
+        rules = [None]
+        rule_42, rule_31 = generate_partition(rng, rules, SUB_MESSAGE_LEN)
+
+    # Relabel the rules randomly, while reserving the labels of the rule tree root
+    n_rules = len(rules) + 4
+    free_labels = [label for label in range(n_rules) if label not in (0, 8, 11, 42, 31)]
+    rng.shuffle(free_labels)
+    labels = {"a": free_labels.pop(), "b": free_labels.pop(), rule_42: 42, rule_31: 31}
+    for rule in range(1, len(rules)):
+        if rule not in labels:
+            labels[rule] = free_labels.pop()
+
+    rule_lines = [
+        "0: 8 11",
+        "8: 42",
+        "11: 42 31",
+        '{}: "a"'.format(labels["a"]),
+        '{}: "b"'.format(labels["b"]),
+    ]
+    for rule in range(1, len(rules)):
+        rule_lines.append(
+            "{}: {}".format(
+                labels[rule],
+                " | ".join(
+                    " ".join(str(labels[sub_rule]) for sub_rule in sub_rules)
+                    for sub_rules in rules[rule]
+                ),
+            )
+        )
+    rng.shuffle(rule_lines)
+
+    messages = []
+    for _ in range(max(1, round(N_MESSAGES * scale))):
+        # Valid messages for the updated rules 8 and 11 match: 42{n_42} 31{n_31},
+        # with n_42 > n_31 > 0
+        n_42 = rng.randint(1, 6)
+        n_31 = rng.randint(0, 5)
+        messages.append(
+            "".join(
+                [generate_message(rng, rules, rule_42) for _ in range(n_42)]
+                + [generate_message(rng, rules, rule_31) for _ in range(n_31)]
+            )
+        )
+    return rule_lines + [""] + messages
@@ -0,0 +1,21 @@
+import string
+
+
+# Size of an actual input
+N_PASSWORDS = 1000
+
+
+def generate(rng, scale=1.0):
+    input_lines = []
+    for _ in range(max(1, round(N_PASSWORDS * scale))):
+        lower_bound = rng.randint(1, 10)
+        upper_bound = rng.randint(lower_bound + 1, 20)
+        target_char = rng.choice(string.ascii_lowercase[:8])
+        password = "".join(
+            rng.choice(string.ascii_lowercase[:8])
+            for _ in range(rng.randint(upper_bound, 20))
+        )
+        input_lines.append(
+            "{}-{} {}: {}".format(lower_bound, upper_bound, target_char, password)
+        )
+    return input_lines
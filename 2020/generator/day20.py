@@ -0,0 +1,119 @@
+# Size of an actual input
+N_TILES_SIDE = 12
+MIN_TILE_LEN = 10
+PIXEL_1_DENSITY = 0.3
+
+MONSTER_PATTERN = [
+    "..................#.",
+    "#....##....##....###",
+    ".#..#..#..#..#..#...",
+]
+
+
+def rotate(tile):
+    # Rotate by 90 degrees clockwise
+    return ["".join(line[j] for line in reversed(tile)) for j in range(len(tile[0]))]
+
+
+def generate_pixels(rng, n_pixels, pixel_0=".", pixel_1="#"):
+    return "".join(
+        pixel_1 if rng.random() < PIXEL_1_DENSITY else pixel_0 for _ in range(n_pixels)
+    )
+
+
+def generate_image(rng, image_len, pixel_0=".", pixel_1="#"):
+    image = [
+        list(generate_pixels(rng, image_len, pixel_0, pixel_1))
+        for _ in range(image_len)
+    ]
+
+    # Sea monsters do not overlap
+    monster_pixels = [
+        (i, j)
+        for i, line in enumerate(MONSTER_PATTERN)
+        for j, pixel in enumerate(line)
+        if pixel == "#"
+    ]
+    monster_height, monster_width = len(MONSTER_PATTERN), len(MONSTER_PATTERN[0])
+    taken_pixels = set()
+    for _ in range(image_len**2 // 400):
+        i = rng.randrange(image_len - monster_height + 1)
+        j = rng.randrange(image_len - monster_width + 1)
+        pixels = [(i + di, j + dj) for di, dj in monster_pixels]
+        if not taken_pixels.intersection(pixels):
+            taken_pixels.update(pixels)
+            for i_pixel, j_pixel in pixels:
+                image[i_pixel][j_pixel] = pixel_1
+    return image
+
+
+def generate(rng, scale=1.0, pixel_0=".", pixel_1="#"):
+    n_tiles_side = max(3, round(N_TILES_SIDE * scale**0.5))
+
+    # Tiles are larger when needed for the borders to match a single other tile
+    n_borders = 2 * n_tiles_side * (n_tiles_side + 1)
+    tile_len = MIN_TILE_LEN
+    while 2 ** (tile_len - 2) < 8 * n_borders:
+        tile_len += 1
+
+    # Pixels at the corners of the tiles, shared with their neighbors
+    corners = [
+        generate_pixels(rng, n_tiles_side + 1, pixel_0, pixel_1)
+        for _ in range(n_tiles_side + 1)
+    ]
+    used_borders = set()
+
+    def generate_border(first_corner, last_corner):
+        while True:
+            border = first_corner + generate_pixels(rng, tile_len - 2) + last_corner
+            if (border not in used_borders) and (border != border[::-1]):
+                used_borders.update([border, border[::-1]])
+                return border
+
+    horizontal_borders = [
+        [generate_border(corners[i][j], corners[i][j + 1]) for j in range(n_tiles_side)]
+        for i in range(n_tiles_side + 1)
+    ]
+    vertical_borders = [
+        [
+            generate_border(corners[i][j], corners[i + 1][j])
+            for j in range(n_tiles_side + 1)
+        ]
+        for i in range(n_tiles_side)
+    ]
+
+    image = generate_image(rng, n_tiles_side * (tile_len - 2), pixel_0, pixel_1)
+    tile_ids = rng.sample(
+        range(1000, 10000 * (1 + n_tiles_side**2 // 1000)), n_tiles_side**2
+    )
+
+    input_lines = []
+    for i in range(n_tiles_side):
+        for j in range(n_tiles_side):
+            tile = [horizontal_borders[i][j]]
+            for k in range(1, tile_len - 1):
+                image_row = image[i * (tile_len - 2) + k - 1]
+                tile.append(
+                    vertical_borders[i][j][k]
+                    + "".join(image_row[j * (tile_len - 2) : (j + 1) * (tile_len - 2)])
+                    + vertical_borders[i][j + 1][k]
+                )
+            tile.append(horizontal_borders[i + 1][j])
+
+            # Random orientation of the tile
+            if rng.random() < 0.5:
+                tile = tile[::-1]
+            for _ in range(rng.randrange(4)):
+                tile = rotate(tile)
+            input_lines.append("Tile {}:".format(tile_ids[i * n_tiles_side + j]))
+            input_lines.extend(tile)
+            input_lines.append("")
+
+    # The tiles are given in random order
+    tile_len_lines = tile_len + 2
+    tiles = [
+        input_lines[k : k + tile_len_lines]
+        for k in range(0, len(input_lines), tile_len_lines)
+    ]
+    rng.shuffle(tiles)
+    return [line for tile in tiles for line in tile][:-1]
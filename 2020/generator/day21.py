@@ -0,0 +1,64 @@
+import string
+
+
+# Size of an actual input
+N_FOODS = 40
+N_INGREDIENTS = 200
+
+ALLERGENS = ["dairy", "eggs", "fish", "nuts", "peanuts", "sesame", "shellfish", "soy"]
+
+
+def generate_ingredient(rng):
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 8)))
+
+
+def is_solvable(foods):
+    allergen_to_ingredients = {}
+    for ingredients, allergens in foods:
+        for allergen in allergens:
+            allergen_to_ingredients.setdefault(allergen, set(ingredients))
+            allergen_to_ingredients[allergen].intersection_update(ingredients)
+
+    # Match the allergens to the ingredients by elimination
+    while allergen_to_ingredients:
+        confirmed_allergens = [
+            allergen
+            for allergen, ingredients in allergen_to_ingredients.items()
+            if len(ingredients) == 1
+        ]
+        if not confirmed_allergens:
+            return False
+        for allergen in confirmed_allergens:
+            ingredient = allergen_to_ingredients.pop(allergen).pop()
+            for ingredients in allergen_to_ingredients.values():
+                ingredients.discard(ingredient)
+    return True
+
+
+def generate(rng, scale=1.0):
+    n_ingredients = max(len(ALLERGENS) + 1, round(N_INGREDIENTS * scale))
+    ingredients = set()
+    while len(ingredients) < n_ingredients:
+        ingredients.add(generate_ingredient(rng))
+    ingredients = rng.sample(sorted(ingredients), n_ingredients)
+    allergen_to_ingredient = dict(zip(ALLERGENS, ingredients))
+
+    # Foods are added until the allergens can be matched to their ingredient
+    foods = []
+    while (len(foods) < max(1, round(N_FOODS * scale))) or (not is_solvable(foods)):
+        food_ingredients = rng.sample(
+            ingredients, rng.randint(n_ingredients // 6, n_ingredients // 3)
+        )
+        # Allergens are not always listed
+        food_allergens = [
+            allergen
+            for allergen, ingredient in allergen_to_ingredient.items()
+            if (ingredient in food_ingredients) and (rng.random() < 0.6)
+        ]
+        if food_allergens:
+            foods.append((food_ingredients, food_allergens))
+
+    return [
+        "{} (contains {})".format(" ".join(food_ingredients), ", ".join(food_allergens))
+        for food_ingredients, food_allergens in foods
+    ]
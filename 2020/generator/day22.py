@@ -0,0 +1,13 @@
+# Size of an actual input
+N_CARDS = 50
+
+
+def generate(rng, scale=1.0):
+    n_cards = 2 * max(1, round(N_CARDS * scale / 2))
+    cards = rng.sample(range(1, n_cards + 1), n_cards)
+    return (
+        ["Player 1:"]
+        + [str(card) for card in cards[: n_cards // 2]]
+        + ["", "Player 2:"]
+        + [str(card) for card in cards[n_cards // 2 :]]
+    )
@@ -0,0 +1,3 @@
+# The number of cups and of moves are fixed: the scale is ignored
+def generate(rng, scale=1.0):  # pylint: disable=unused-argument
+    return ["".join(rng.sample("123456789", 9))]
@@ -0,0 +1,11 @@
+# Size of an actual input
+N_TILES = 350
+
+SUPPORTED_DIRECTIONS = ["e", "se", "sw", "w", "nw", "ne"]
+
+
+def generate(rng, scale=1.0):
+    return [
+        "".join(rng.choice(SUPPORTED_DIRECTIONS) for _ in range(rng.randint(10, 25)))
+        for _ in range(max(1, round(N_TILES * scale)))
+    ]
@@ -0,0 +1,11 @@
+# Size of an actual input
+LOOP_SIZE = 5 * 10**6
+
+
+def generate(rng, scale=1.0, subject_number=7, base=20201227):
+    # The loop sizes are bounded by the order of the subject number
+    max_loop_size = min(max(2, round(LOOP_SIZE * scale)), base - 2)
+    return [
+        str(pow(subject_number, rng.randint(max_loop_size // 2, max_loop_size), base))
+        for _ in range(2)
+    ]
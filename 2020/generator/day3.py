@@ -0,0 +1,13 @@
+# Size of an actual input
+N_ROWS, N_COLUMNS = 323, 31
+TREE_DENSITY = 0.2
+
+
+def generate(rng, scale=1.0, tree_char="#", open_char="."):
+    return [
+        "".join(
+            tree_char if rng.random() < TREE_DENSITY else open_char
+            for _ in range(N_COLUMNS)
+        )
+        for _ in range(max(2, round(N_ROWS * scale)))
+    ]
@@ -0,0 +1,54 @@
+# Size of an actual input
+N_PASSPORTS = 290
+
+EYE_COLORS = ["amb", "blu", "brn", "gry", "grn", "hzl", "oth"]
+
+
+def generate_field_value(
+    rng, field, is_valid
+):  # pylint: disable=too-many-return-statements
+    if field in ("byr", "iyr", "eyr"):
+        valid_ranges = {"byr": (1920, 2002), "iyr": (2010, 2020), "eyr": (2020, 2030)}
+        start, end = valid_ranges[field]
+        return str(rng.randint(start, end) if is_valid else rng.randint(1900, 2040))
+    if field == "hgt":
+        if is_valid:
+            unit = rng.choice(["cm", "in"])
+            return "{}{}".format(
+                rng.randint(150, 193) if unit == "cm" else rng.randint(59, 76), unit
+            )
+        return "{}{}".format(rng.randint(40, 250), rng.choice(["cm", "in"]))
+    if field == "hcl":
+        digits = "0123456789abcdef" if is_valid else "0123456789abcdefz"
+        return "#" + "".join(rng.choice(digits) for _ in range(6))
+    if field == "ecl":
+        return rng.choice(EYE_COLORS if is_valid else EYE_COLORS + ["xry", "zzz"])
+    if field == "pid":
+        return "".join(rng.choice("0123456789") for _ in range(9 if is_valid else 10))
+    # Optional field
+    return str(rng.randint(50, 350))
+
+
+def generate(rng, scale=1.0):
+    fields = ["byr", "iyr", "eyr", "hgt", "hcl", "ecl", "pid", "cid"]
+
+    input_lines = []
+    for _ in range(max(1, round(N_PASSPORTS * scale))):
+        passport_fields = [
+            field for field in fields if (field == "cid") or rng.random() < 0.95
+        ]
+        rng.shuffle(passport_fields)
+        entries = [
+            "{}:{}".format(
+                field, generate_field_value(rng, field, is_valid=rng.random() < 0.95)
+            )
+            for field in passport_fields
+        ]
+        # Split the entries of a passport over several lines
+        while entries:
+            n_entries = rng.randint(1, 4)
+            input_lines.append(" ".join(entries[:n_entries]))
+            entries = entries[n_entries:]
+        input_lines.append("")
+    input_lines.pop()
+    return input_lines
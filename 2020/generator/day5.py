@@ -0,0 +1,27 @@
+# Size of an actual input
+N_SEATS = 850
+# All the seats of the plane: the size of the input is bounded
+N_ROWS, N_COLUMNS = 128, 8
+
+
+def seat_id_to_boarding_pass(seat_id):
+    row, column = divmod(seat_id, N_COLUMNS)
+    return "{:07b}".format(row).replace("0", "F").replace("1", "B") + "{:03b}".format(
+        column
+    ).replace("0", "L").replace("1", "R")
+
+
+def generate(rng, scale=1.0):
+    n_seats = min(max(3, round(N_SEATS * scale)), N_ROWS * N_COLUMNS - 1)
+
+    # Consecutive seats, except for the missing one (which is not at the ends)
+    first_seat_id = rng.randint(0, N_ROWS * N_COLUMNS - 1 - n_seats)
+    missing_seat_id = rng.randint(first_seat_id + 1, first_seat_id + n_seats - 1)
+    seat_ids = [
+        seat_id
+        for seat_id in range(first_seat_id, first_seat_id + n_seats + 1)
+        if seat_id != missing_seat_id
+    ]
+
+    rng.shuffle(seat_ids)
+    return [seat_id_to_boarding_pass(seat_id) for seat_id in seat_ids]
@@ -0,0 +1,21 @@
+import string
+
+
+# Size of an actual input
+N_GROUPS = 490
+
+
+def generate(rng, scale=1.0):
+    input_lines = []
+    for _ in range(max(1, round(N_GROUPS * scale))):
+        # Questions to which everyone in the group answered "yes"
+        common_answers = rng.sample(string.ascii_lowercase, rng.randint(0, 5))
+        for _ in range(rng.randint(1, 5)):
+            answers = set(common_answers)
+            answers.update(rng.sample(string.ascii_lowercase, rng.randint(0, 10)))
+            if not answers:
+                answers.add(rng.choice(string.ascii_lowercase))
+            input_lines.append("".join(rng.sample(sorted(answers), len(answers))))
+        input_lines.append("")
+    input_lines.pop()
+    return input_lines
@@ -0,0 +1,60 @@
+# Size of an actual input
+N_BAGS = 594
+LEVEL_SIZE = 60
+# Bound the depth of the recursions of the solver
+MAX_N_LEVELS = 500
+
+ADJECTIVES = [
+    "bright", "clear", "dark", "dim", "dotted", "drab", "dull", "faded", "light",
+    "mirrored", "muted", "pale", "plaid", "posh", "shiny", "striped", "vibrant",
+    "wavy",
+]  # fmt: skip
+COLORS = [
+    "aqua", "beige", "black", "blue", "bronze", "brown", "chartreuse", "coral",
+    "crimson", "cyan", "fuchsia", "gold", "gray", "green", "indigo", "lavender",
+    "lime", "magenta", "maroon", "olive", "orange", "plum", "purple", "red", "salmon",
+    "silver", "tan", "teal", "tomato", "turquoise", "violet", "white", "yellow",
+]  # fmt: skip
+
+
+def format_bag(bag, quantity=1):
+    return "{} {} bag{}".format(quantity, bag, "" if quantity == 1 else "s")
+
+
+def generate(rng, scale=1.0, target_bag="shiny gold"):
+    # New adjectives are derived once all the pairs of words are used
+    n_bags = max(2, round(N_BAGS * scale))
+    n_rounds = 1 + n_bags // (len(ADJECTIVES) * len(COLORS))
+    all_bags = [
+        "{}{} {}".format(adjective, "ish" * k, color)
+        for k in range(n_rounds)
+        for adjective in ADJECTIVES
+        for color in COLORS
+    ]
+    all_bags.remove(target_bag)
+    bags = rng.sample(all_bags, n_bags - 1)
+
+    # Bags only contain bags of the next level: the rules are acyclic
+    n_levels = min(max(10, n_bags // LEVEL_SIZE), MAX_N_LEVELS)
+    levels = [[] for _ in range(n_levels)]
+    levels[n_levels - 5].append(target_bag)
+    for bag in bags:
+        levels[rng.randrange(n_levels)].append(bag)
+
+    input_lines = []
+    for depth, level in enumerate(levels):
+        deeper_bags = levels[depth + 1] if depth + 1 < n_levels else []
+        for bag in level:
+            n_children = min(rng.randint(0, 5), len(deeper_bags))
+            child_bags = [
+                format_bag(child_bag, quantity=rng.randint(1, 5))
+                for child_bag in rng.sample(deeper_bags, n_children)
+            ]
+            input_lines.append(
+                "{} bags contain {}.".format(
+                    bag, ", ".join(child_bags) if child_bags else "no other bags"
+                )
+            )
+
+    rng.shuffle(input_lines)
+    return input_lines
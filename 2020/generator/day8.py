@@ -0,0 +1,39 @@
+# Size of an actual input
+N_INSTRUCTIONS = 650
+
+
+def generate_dead_instruction(rng, i):
+    operation = rng.choice(["acc", "jmp", "nop"])
+    if operation == "jmp":
+        return operation, -rng.randint(1, i) if i > 0 else 0
+    return operation, rng.randint(-99, 99)
+
+
+def generate(rng, scale=1.0):
+    n_instructions = max(4, round(N_INSTRUCTIONS * scale))
+    # Index of the corrupted 'jmp' instruction looping back
+    i_corrupted = rng.randrange(1, n_instructions - 1)
+
+    instructions = []
+    while len(instructions) < n_instructions:
+        i = len(instructions)
+        if i == i_corrupted:
+            instructions.append(("jmp", -rng.randint(1, i)))
+            continue
+
+        operation = rng.choices(["acc", "nop", "jmp"], weights=[5, 2, 2])[0]
+        if operation == "jmp":
+            # Jump over instructions never executed by the fixed program
+            n_skipped = min(rng.randint(1, 5), n_instructions - i - 1)
+            if i < i_corrupted:
+                n_skipped = min(n_skipped, i_corrupted - i - 1)
+            instructions.append((operation, 1 + n_skipped))
+            instructions.extend(
+                generate_dead_instruction(rng, i + 1 + k) for k in range(n_skipped)
+            )
+        else:
+            instructions.append((operation, rng.randint(-99, 99)))
+
+    return [
+        "{} {:+d}".format(operation, argument) for operation, argument in instructions
+    ]
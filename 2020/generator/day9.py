@@ -0,0 +1,36 @@
+# Size of an actual input
+N_NUMBERS = 1000
+
+
+def is_sum_of_2(number, previous_numbers):
+    previous_numbers = set(previous_numbers)
+    return any(
+        (number - previous_number in previous_numbers)
+        and (2 * previous_number != number)
+        for previous_number in previous_numbers
+    )
+
+
+def generate(rng, scale=1.0, preamble_len=25):
+    n_numbers = max(preamble_len + 2, round(N_NUMBERS * scale))
+    i_invalid = rng.randrange(max(preamble_len + 1, n_numbers // 2), n_numbers)
+
+    numbers = rng.sample(range(1, 2 * preamble_len + 1), preamble_len)
+    while len(numbers) < n_numbers:
+        previous_numbers = numbers[-preamble_len:]
+        if len(numbers) == i_invalid:
+            # Sum of a contiguous range of (small) numbers, not of 2 previous numbers
+            while True:
+                start = rng.randrange(len(numbers) // 2)
+                end = rng.randint(start + 2, min(start + 20, len(numbers)))
+                invalid_number = sum(numbers[start:end])
+                if not is_sum_of_2(invalid_number, previous_numbers):
+                    break
+            numbers.append(invalid_number)
+            continue
+
+        # Sum of 2 of the smallest previous numbers: the numbers grow slowly
+        smallest_numbers = sorted(set(previous_numbers))[:5]
+        numbers.append(sum(rng.sample(smallest_numbers, 2)))
+
+    return [str(number) for number in numbers]
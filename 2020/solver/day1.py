@@ -1,14 +1,19 @@
+import math
+
 import numpy as np
 
+from common.parsing import parse_ints
+
+
+INPUT_MODE = "mmap"
 
-def main(input_lines, target_expense=2020):
-    expenses = [int(line) for line in input_lines]
 
+def main(input_bytes, target_expense=2020):
     # Complexity: N*log(N)
-    expenses.sort()
+    expenses = np.sort(parse_ints(input_bytes)).tolist()
 
-    part1_answer = np.prod(find_sum_of_2(target_expense, expenses))
-    part2_answer = np.prod(find_sum_of_3(target_expense, expenses))
+    part1_answer = math.prod(find_sum_of_2(target_expense, expenses))
+    part2_answer = math.prod(find_sum_of_3(target_expense, expenses))
     return part1_answer, part2_answer
 
 
@@ -1,11 +1,18 @@
+import numpy as np
+
+from common.parsing import parse_ints
+
+
+INPUT_MODE = "mmap"
+
+
 def main(
-    input_lines,
+    input_bytes,
     charging_outlet=0,
     device_adapter_jolt_increase=3,
     max_jolt_difference=3,
 ):
-    adapters_chain = [int(line) for line in input_lines]
-    adapters_chain.sort()
+    adapters_chain = np.sort(parse_ints(input_bytes)).tolist()
     device_adapter = adapters_chain[-1] + device_adapter_jolt_increase
 
     adapters_chain = [charging_outlet] + adapters_chain + [device_adapter]
@@ -1,18 +1,31 @@
+import functools
+
 import numpy as np
 
+from common.automaton import converge
+from common.grid import read_grid
+from common.neighbors import count_neighbors, moore_kernel
+
+
+INPUT_MODE = "mmap"
+
+NEIGHBOR_DIRECTIONS = [
+    (x, y) for x in range(-1, 2) for y in range(-1, 2) if not (x == y == 0)
+]
+
 
 def main(
-    input_lines,
+    input_bytes,
     floor_char=".",
     empty_seat_char="L",
     occupied_seat_char="#",
     visualize=False,
 ):
-    seat_layout = np.array(
-        [[(char != floor_char) for char in line.strip("\n")] for line in input_lines]
-    )
+    seat_layout = parse_seat_layout(input_bytes, floor_char)
 
-    part1_final_occupancy_grid = converge(seat_layout, part1_transition_vectorized)
+    part1_final_occupancy_grid = find_final_occupancy(
+        seat_layout, part1_transition_vectorized
+    )
     if visualize:
         visualize_occupied_seats(
             seat_layout,
@@ -22,7 +35,13 @@ def main(
             occupied_seat_char,
         )
 
-    part2_final_occupancy_grid = converge(seat_layout, part2_transition_naive)
+    part2_final_occupancy_grid = find_final_occupancy(
+        seat_layout,
+        functools.partial(
+            part2_transition_vectorized,
+            visible_seats=find_visible_seats(seat_layout, NEIGHBOR_DIRECTIONS),
+        ),
+    )
     if visualize:
         visualize_occupied_seats(
             seat_layout,
@@ -35,6 +54,15 @@ def main(
     return np.sum(part1_final_occupancy_grid), np.sum(part2_final_occupancy_grid)
 
 
+def parse_seat_layout(input_bytes, floor_char="."):
+    return read_grid(input_bytes) != ord(floor_char)
+
+
+def count_part1_occupied_seats(input_bytes, transition_method):
+    seat_layout = parse_seat_layout(input_bytes)
+    return int(np.sum(find_final_occupancy(seat_layout, transition_method)))
+
+
 def visualize_occupied_seats(
     seat_layout, occupancy_grid, floor_char, empty_seat_char, occupied_seat_char
 ):
@@ -51,31 +79,33 @@ def rule_occupied_to_empty(n_occupied_neighbors, max_neighbors=4):
     return n_occupied_neighbors >= max_neighbors
 
 
-def converge(seat_layout, transition_method):
-    occupancy_grid = np.full(seat_layout.shape, False)
-    while True:
-        new_occupancy_grid = transition_method(seat_layout, occupancy_grid)
-        if np.all(new_occupancy_grid == occupancy_grid):
-            break
-        occupancy_grid = new_occupancy_grid
-    return occupancy_grid
+def find_final_occupancy(seat_layout, transition_method):
+    """Apply the transitions to the empty seats until the occupancy no longer changes.
+
+    'transition_method(seat_layout, occupancy_grid)' returns the new occupancy grid,
+    and whether any seat changed.
+    """
+    final_occupancy_grid, _n_transitions = converge(
+        np.full(seat_layout.shape, False),
+        lambda occupancy_grid, _transition_idx: transition_method(
+            seat_layout, occupancy_grid
+        ),
+    )
+    return final_occupancy_grid
 
 
 def transition_naive(
     seat_layout, occupancy_grid, get_n_neighbors_method, max_neighbors
 ):
-    neighbor_directions = [
-        (x, y) for x in range(-1, 2) for y in range(-1, 2) if not (x == y == 0)
-    ]
-
     n_rows, n_columns = seat_layout.shape
     new_occupancy_grid = np.full(seat_layout.shape, False)
+    has_changed = False
     for row in range(n_rows):
         for column in range(n_columns):
             if not seat_layout[row, column]:
                 continue
             n_occupied_neighbors = get_n_neighbors_method(
-                seat_layout, occupancy_grid, row, column, neighbor_directions
+                seat_layout, occupancy_grid, row, column, NEIGHBOR_DIRECTIONS
             )
             if not occupancy_grid[row, column]:
                 new_occupancy_grid[row, column] = rule_empty_to_occupied(
@@ -85,7 +115,9 @@ def transition_naive(
                 new_occupancy_grid[row, column] = not rule_occupied_to_empty(
                     n_occupied_neighbors, max_neighbors=max_neighbors
                 )
-    return new_occupancy_grid
+            if new_occupancy_grid[row, column] != occupancy_grid[row, column]:
+                has_changed = True
+    return new_occupancy_grid, has_changed
 
 
 def part1_transition_naive(seat_layout, occupancy_grid):
@@ -130,42 +162,86 @@ def get_n_visible_neighbors(
     return n_occupied_neighbors
 
 
-def part1_transition_vectorized(seat_layout, occupancy_grid):
-    neighbor_kernel = np.array(
-        [[True, True, True], [True, False, True], [True, True, True]]
-    )
-    n_occupied_neighbours = convolution_2d(occupancy_grid, neighbor_kernel)
+def find_visible_seats(seat_layout, neighbor_directions):
+    """Flat index of the first seat visible in each direction from each position.
+
+    'visible_seats[k, row, column]' for the k-th direction, 'seat_layout.size'
+    when there is none. Swept row by row (or column by column) against the direction:
+    the first seat visible from a position is its neighbor, if it is a seat, otherwise
+    the first seat visible from its neighbor.
+    """
+    seat_idxs = np.arange(seat_layout.size).reshape(seat_layout.shape)
+    visible_seats = np.empty((len(neighbor_directions),) + seat_layout.shape, dtype=int)
+    for k, (d_row, d_column) in enumerate(neighbor_directions):
+        if d_row != 0:
+            visible_seats[k] = sweep_visible_seats(
+                seat_layout, seat_idxs, (d_row, d_column), seat_layout.size
+            )
+        else:
+            # Swept column by column: as the rows of the transposed layout
+            visible_seats[k] = sweep_visible_seats(
+                seat_layout.T, seat_idxs.T, (d_column, d_row), seat_layout.size
+            ).T
+    return visible_seats
+
+
+def sweep_visible_seats(seats, seat_idxs, direction, no_seat_idx):
+    d_row, d_column = direction
+    n_rows, n_columns = seats.shape
+    # Padded with no seat around the layout
+    padded_seats = np.pad(seats, 1, constant_values=False)
+    padded_seat_idxs = np.pad(seat_idxs, 1, constant_values=no_seat_idx)
+    visible_seats = np.full(padded_seats.shape, no_seat_idx)
+    rows = range(1, n_rows + 1) if d_row < 0 else range(n_rows, 0, -1)
+    neighbor_columns = slice(1 + d_column, n_columns + 1 + d_column)
+    for row in rows:
+        visible_seats[row, 1:-1] = np.where(
+            padded_seats[row + d_row, neighbor_columns],
+            padded_seat_idxs[row + d_row, neighbor_columns],
+            visible_seats[row + d_row, neighbor_columns],
+        )
+    return visible_seats[1:-1, 1:-1]
+
+
+def transition_vectorized(
+    seat_layout, occupancy_grid, n_occupied_neighbours, max_neighbors
+):
     transition_empty_to_occupied = np.logical_and(
         np.logical_and(seat_layout, np.logical_not(occupancy_grid)),
         rule_empty_to_occupied(n_occupied_neighbours),
     )
     transition_occupied_to_empty = np.logical_and(
-        occupancy_grid, rule_occupied_to_empty(n_occupied_neighbours)
+        occupancy_grid,
+        rule_occupied_to_empty(n_occupied_neighbours, max_neighbors=max_neighbors),
+    )
+    # Cheaper than comparing the whole grids
+    has_changed = bool(
+        transition_empty_to_occupied.any() or transition_occupied_to_empty.any()
     )
     new_occupancy_grid = np.logical_or(
         np.logical_and(occupancy_grid, np.logical_not(transition_occupied_to_empty)),
         transition_empty_to_occupied,
     )
-    return new_occupancy_grid
+    return new_occupancy_grid, has_changed
 
 
-def convolution_2d(matrix, kernel):
-    matrix_height, matrix_length = matrix.shape
-    kernel_heigth, kernel_length = kernel.shape
+def part1_transition_vectorized(seat_layout, occupancy_grid):
+    n_occupied_neighbours = count_neighbors(occupancy_grid, moore_kernel(2))
+    return transition_vectorized(seat_layout, occupancy_grid, n_occupied_neighbours, 4)
 
-    start_row, start_column = kernel_heigth // 2, kernel_length // 2
-    matrix_padded = np.full(
-        (matrix_height + kernel_heigth, matrix_length + kernel_length), 0
-    )
-    matrix_padded[
-        start_row : matrix_height + start_row,
-        start_column : matrix_length + start_column,
-    ] = matrix
-
-    result = np.full(matrix.shape, 0.0)
-    for i in range(matrix_height):
-        for j in range(matrix_length):
-            result[i, j] = np.sum(
-                kernel * matrix_padded[i : i + kernel_heigth, j : j + kernel_length]
-            )
-    return result
+
+def part2_transition_vectorized(seat_layout, occupancy_grid, visible_seats):
+    # With an additional position never occupied: where no seat is visible
+    is_occupied = np.append(occupancy_grid.ravel(), False)
+    n_occupied_neighbours = np.sum(is_occupied[visible_seats], axis=0)
+    return transition_vectorized(seat_layout, occupancy_grid, n_occupied_neighbours, 5)
+
+
+VARIANTS = {
+    "part1_transition_naive": functools.partial(
+        count_part1_occupied_seats, transition_method=part1_transition_naive
+    ),
+    "part1_transition_vectorized": functools.partial(
+        count_part1_occupied_seats, transition_method=part1_transition_vectorized
+    ),
+}
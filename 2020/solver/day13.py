@@ -1,10 +1,13 @@
+import functools
+
+
+# The naive search is intractable on the full schedule: only keep its first buses
+VARIANTS_N_BUSES = 5
+
+
 def main(input_lines, unavailable_char="x"):
     start_ts = int(input_lines[0])
-    available_buses = [
-        (i, int(bus_id))
-        for i, bus_id in enumerate(input_lines[1].split(","))
-        if (bus_id != unavailable_char)
-    ]
+    available_buses = parse_available_buses(input_lines, unavailable_char)
 
     earliest_bus_id = min(
         available_buses, key=lambda bus: get_next_bus_departure_ts(start_ts, bus[1])
@@ -19,6 +22,19 @@ def main(input_lines, unavailable_char="x"):
     return part1_answer, earliest_synchronized_departure_ts
 
 
+def parse_available_buses(input_lines, unavailable_char="x"):
+    return [
+        (i, int(bus_id))
+        for i, bus_id in enumerate(input_lines[1].split(","))
+        if (bus_id != unavailable_char)
+    ]
+
+
+def find_first_buses_synchronized_departure_ts(input_lines, find_method):
+    available_buses = parse_available_buses(input_lines)
+    return find_method(available_buses[:VARIANTS_N_BUSES])
+
+
 def get_next_bus_departure_ts(start_ts, bus_id):
     bus_departure_ts = start_ts + ((bus_id - start_ts) % bus_id)
     return bus_departure_ts
@@ -73,3 +89,15 @@ def solve_equation_diophantienne(a, b):
 
 
 # pylint: enable=invalid-name
+
+
+VARIANTS = {
+    "find_synchronized_departure_ts_naive": functools.partial(
+        find_first_buses_synchronized_departure_ts,
+        find_method=find_synchronized_departure_ts_naive,
+    ),
+    "find_synchronized_departure_ts_fast": functools.partial(
+        find_first_buses_synchronized_departure_ts,
+        find_method=find_synchronized_departure_ts_fast,
+    ),
+}
@@ -1,7 +1,11 @@
-def main(input_lines, part1_max_round=2020, part2_max_round=30000000):
-    initial_numbers = [
-        int(initial_number) for initial_number in input_lines[0].split(",")
-    ]
+from common.parsing import parse_ints
+
+
+INPUT_MODE = "mmap"
+
+
+def main(input_bytes, part1_max_round=2020, part2_max_round=30000000):
+    initial_numbers = parse_ints(input_bytes, sep=",").tolist()
 
     last_spoken = [None] * part2_max_round
     n_round = number = None
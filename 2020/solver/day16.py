@@ -1,8 +1,9 @@
 import re
 
-import intervals  # type: ignore
 import numpy as np
 
+from common.interval_set import IntervalSet
+
 
 RULE_PATTERN = re.compile(r"(?P<start>[0-9]+)-(?P<end>[0-9]+)")
 
@@ -10,18 +11,11 @@ RULE_PATTERN = re.compile(r"(?P<start>[0-9]+)-(?P<end>[0-9]+)")
 def main(input_lines):
     rules, my_ticket, other_tickets = parse_input(input_lines)
 
-    part1_answer = 0
-    i = 0
-    while i < len(other_tickets):
-        is_valid_ticket = True
-        for value in other_tickets[i]:
-            if not is_valid_value(value, rules):
-                is_valid_ticket = False
-                part1_answer += value
-        if not is_valid_ticket:
-            other_tickets.pop(i)
-        else:
-            i += 1
+    # All the values of the other tickets are checked at once
+    other_tickets = np.array(other_tickets, dtype=np.int64)
+    is_valid = is_valid_value(other_tickets, rules)
+    part1_answer = int(np.sum(other_tickets[~is_valid]))
+    other_tickets = other_tickets[np.all(is_valid, axis=1)]
 
     position_to_field = find_fields_position(rules, other_tickets)
     part2_answer = np.prod(
@@ -48,10 +42,11 @@ def parse_input(input_lines):
 
         if not is_done_rules:
             field, valid_ranges_raw = input_line.split(":")
-            rules[field] = intervals.empty()
-            for start_range, end_range in RULE_PATTERN.findall(valid_ranges_raw):
-                valid_interval = intervals.closed(int(start_range), int(end_range))
-                rules[field] = rules[field].union(valid_interval)
+            valid_ranges = RULE_PATTERN.findall(valid_ranges_raw)
+            rules[field] = IntervalSet.from_bounds(
+                [int(start_range) for start_range, _end_range in valid_ranges],
+                [int(end_range) for _start_range, end_range in valid_ranges],
+            )
 
         elif not is_done_my_ticket:
             my_ticket = [int(value) for value in input_line.split(",")]
@@ -64,26 +59,19 @@ def parse_input(input_lines):
     return rules, my_ticket, other_tickets
 
 
-def is_valid_value(value, rules):
-    for valid_interval in rules.values():
-        if value in valid_interval:
-            return True
-    return False
+def is_valid_value(values, rules):
+    """Whether each value (of an array) is valid for at least one field."""
+    return IntervalSet.empty().union(*rules.values()).contains(values)
 
 
 def find_fields_position(rules, tickets):
     fields = list(rules.keys())
-    position_to_field_hypothesis = np.full((len(tickets[0]), len(fields)), True)
+    # A field can be at a position if all the tickets' values there are valid for it
+    position_to_field_hypothesis = np.stack(
+        [np.all(rules[field].contains(tickets), axis=0) for field in fields], axis=1
+    )
     position_to_field_confirmed = {}
 
-    for ticket in tickets:
-        for position, value in enumerate(ticket):
-            field_hypothesis = np.where(position_to_field_hypothesis[position, :])[0]
-            for field_idx in field_hypothesis.tolist():
-                field = fields[field_idx]
-                if value not in rules[field]:
-                    position_to_field_hypothesis[position, field_idx] = False
-
     while np.any(position_to_field_hypothesis):
         confirmed_fields = np.where(np.sum(position_to_field_hypothesis, axis=0) == 1)[
             0
@@ -1,3 +1,4 @@
+import functools
 import itertools
 import re
 
@@ -31,6 +32,12 @@ def main(input_lines):
     return part1_answer, part2_answer
 
 
+def count_part1_valid_messages(input_lines, find_possibilities_method):
+    rules, messages = parse_input(input_lines)
+    root_rule_possibilities = set(find_possibilities_method(rules, 0))
+    return sum(message in root_rule_possibilities for message in messages)
+
+
 def parse_input(input_lines):
     rules = {}
     messages = []
@@ -154,3 +161,14 @@ def find_pattern_recursive(rules, rule_id):
         expanded_rule = "(" + expanded_rule[:-1] + ")"
     rules[rule_id] = expanded_rule
     return expanded_rule
+
+
+VARIANTS = {
+    "find_possibilities_recursive": functools.partial(
+        count_part1_valid_messages,
+        find_possibilities_method=find_possibilities_recursive,
+    ),
+    "find_possibilities": functools.partial(
+        count_part1_valid_messages, find_possibilities_method=find_possibilities
+    ),
+}
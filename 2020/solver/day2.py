@@ -1,6 +1,8 @@
 import re
 
 
+INPUT_MODE = "stream"
+
 PASSWORD_CHECK_PATTERN = re.compile(
     r"(?P<lower_bound>\d+)-(?P<upper_bound>\d+)\s(?P<target_char>[a-z]):\s(?P<password>[a-z]+)"
 )
@@ -3,7 +3,7 @@ from collections import deque
 
 import numpy as np
 
-from .day11 import convolution_2d
+from common.neighbors import count_neighbors
 
 
 MONSTER_PATTERN = [
@@ -224,7 +224,7 @@ def find_monsters(image, monster_image):
         for rotation_angle in (0, 90, 180, 270)
     ]
     for oriented_image in oriented_images:
-        matched_image = convolution_2d(oriented_image, monster_image)
+        matched_image = count_neighbors(oriented_image, monster_image)
         n_monsters = np.sum(matched_image == n_monster_pixels)
         if n_monsters != 0:
             break
@@ -1,6 +1,3 @@
-import numpy as np
-
-
 def main(input_lines):
     foods = parse_input(input_lines)
     allergen_to_ingredient, all_ingredients = match_allergen_to_ingredient(foods)
@@ -46,8 +43,8 @@ def match_allergen_to_ingredient(foods):
         all_ingredients = all_ingredients.union(ingredients)
 
     all_allergens = list(allergen_to_ingredient_hypothesis.keys())
-    confirmed_allergens = np.full((len(all_allergens),), False)
-    while not np.all(confirmed_allergens):
+    confirmed_allergens = [False] * len(all_allergens)
+    while not all(confirmed_allergens):
         for i, allergen in enumerate(all_allergens):
             if confirmed_allergens[i]:
                 continue
@@ -1,3 +1,6 @@
+import functools
+
+
 def main(input_lines, part1_n_games=100, part2_n_games=10000000, part2_n_cups=1000000):
     part1_cups = parse_input(input_lines)
     part1_answer = "".join([str(cup) for cup in play(part1_cups, part1_n_games)[1:]])
@@ -9,6 +12,11 @@ def main(input_lines, part1_n_games=100, part2_n_games=10000000, part2_n_cups=10
     return part1_answer, part2_answer
 
 
+def find_part1_answer(input_lines, play_method, n_games=100):
+    cups = parse_input(input_lines)
+    return "".join([str(cup) for cup in play_method(cups, n_games)[1:]])
+
+
 def parse_input(input_lines):
     cups = [int(char) for char in input_lines[0]]
     return cups
@@ -94,3 +102,9 @@ def find_final_cup_order_naive(cups):
     first_idx = cups.index(1)
     cups = cups[first_idx:] + cups[:first_idx]
     return cups
+
+
+VARIANTS = {
+    "play_naive": functools.partial(find_part1_answer, play_method=play_naive),
+    "play": functools.partial(find_part1_answer, play_method=play),
+}
@@ -2,10 +2,13 @@ import re
 
 import numpy as np
 
-from .day11 import convolution_2d
+from common.automaton import LifeRule, run_life
 
 
 SUPPORTED_DIRECTIONS = ["e", "se", "sw", "w", "nw", "ne"]
+# A black tile stays black with 1 or 2 adjacent black tiles,
+# a white tile is flipped to black with 2 adjacent black tiles
+EXHIBIT_RULE = LifeRule(birth=frozenset({2}), survival=frozenset({1, 2}))
 
 
 def main(input_lines, n_days=100):
@@ -13,7 +16,7 @@ def main(input_lines, n_days=100):
     initial_black_tiles = find_black_tiles(tiles_directions)
     part1_answer = len(initial_black_tiles)
 
-    part2_answer = np.sum(
+    part2_answer = len(
         finish_exhibit(initial_black_tiles, n_days, SUPPORTED_DIRECTIONS)
     )
 
@@ -66,40 +69,8 @@ def direction_to_coordinates(direction):
 
 
 def finish_exhibit(initial_black_tiles, n_days, supported_directions):
-    floor_plan = get_floor_plan(initial_black_tiles, n_days)
-    neighbor_mask = get_neighbor_mask(supported_directions)
-    for _i in range(n_days):
-        floor_plan = step(floor_plan, neighbor_mask)
-    return floor_plan
-
-
-def get_floor_plan(initial_black_tiles, n_days):
-    initial_dimensions = np.max(np.array(initial_black_tiles), axis=0) - np.min(
-        np.array(initial_black_tiles), axis=0
-    )
-    final_dimensions = initial_dimensions + 2 * (n_days + 1)
-    floor_plan = np.full(final_dimensions, False)
-    for initial_black_tile in initial_black_tiles:
-        floor_plan[
-            initial_black_tile[0] + n_days + 1, initial_black_tile[1] + n_days + 1
-        ] = True
-    return floor_plan
-
-
-def get_neighbor_mask(supported_directions):
-    neighbor_mask = np.full((3, 3), False)
-    for direction in supported_directions:
-        coordinates = direction_to_coordinates(direction)
-        neighbor_mask[coordinates[0], coordinates[1]] = True
-    return neighbor_mask
-
-
-def step(floor_plan, neighbor_mask):
-    n_neighbors = convolution_2d(floor_plan, neighbor_mask)
-    next_floor_plan = np.logical_or(
-        np.logical_and(
-            floor_plan, np.logical_not(np.logical_or(n_neighbors == 0, n_neighbors > 2))
-        ),
-        np.logical_and(np.logical_not(floor_plan), n_neighbors == 2),
-    )
-    return next_floor_plan
+    neighbor_offsets = [
+        direction_to_coordinates(direction).tolist()
+        for direction in supported_directions
+    ]
+    return run_life(initial_black_tiles, neighbor_offsets, EXHIBIT_RULE, n_days)
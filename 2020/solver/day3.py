@@ -1,9 +1,16 @@
+import numpy as np
+
+from common.grid import read_grid
+
+
+INPUT_MODE = "mmap"
+
 SLOPE = (3, 1)
 SLOPES = [(1, 1), (3, 1), (5, 1), (7, 1), (1, 2)]
 
 
-def main(input_lines, tree_char="#"):
-    tree_map = [[(char == tree_char) for char in line] for line in input_lines]
+def main(input_bytes, tree_char="#"):
+    tree_map = read_grid(input_bytes) == ord(tree_char)
 
     part1_answer = find_trees_on_slope(tree_map, *SLOPE)
 
@@ -15,11 +22,7 @@ def main(input_lines, tree_char="#"):
 
 
 def find_trees_on_slope(tree_map, right, down):
-    position = (0, 0)
-    n_trees_on_slope = 0
-    while position[1] < len(tree_map):
-        tree_row = tree_map[position[1]]
-        if tree_row[position[0] % len(tree_row)]:
-            n_trees_on_slope += 1
-        position = (position[0] + right, position[1] + down)
-    return n_trees_on_slope
+    # The positions on the slope: the map repeats itself to the right
+    row_idxs = np.arange(0, tree_map.shape[0], down)
+    col_idxs = (row_idxs // down * right) % tree_map.shape[1]
+    return int(np.count_nonzero(tree_map[row_idxs, col_idxs]))
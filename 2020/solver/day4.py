@@ -1,7 +1,5 @@
 import re
 
-import numpy as np
-
 
 PASSPORT_ENTRY_PATTERN = re.compile("(?P<field>[a-z]+):(?P<value>[a-z0-9#]+)")
 
@@ -13,29 +11,27 @@ REQUIRED_FIELDS = {
     or ((59 <= int(entry[:-2]) <= 76) and (entry[-2:] == "in")),
     "hcl": lambda entry: (len(entry) == 7)
     and (entry[0] == "#")
-    and np.all(
-        [
-            char
-            in [
-                "0",
-                "1",
-                "2",
-                "3",
-                "4",
-                "5",
-                "6",
-                "7",
-                "8",
-                "9",
-                "a",
-                "b",
-                "c",
-                "d",
-                "e",
-                "f",
-            ]
-            for char in entry[1:]
+    and all(
+        char
+        in [
+            "0",
+            "1",
+            "2",
+            "3",
+            "4",
+            "5",
+            "6",
+            "7",
+            "8",
+            "9",
+            "a",
+            "b",
+            "c",
+            "d",
+            "e",
+            "f",
         ]
+        for char in entry[1:]
     ),
     "ecl": lambda entry: entry in ["amb", "blu", "brn", "gry", "grn", "hzl", "oth"],
     "pid": lambda entry: (len(entry) == 9) and isinstance(int(entry), int),
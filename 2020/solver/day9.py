@@ -1,8 +1,13 @@
+from common.parsing import parse_ints
+
 from .day1 import find_sum_of_2
 
 
-def main(input_lines, preamble_len=25):
-    numbers = [int(line) for line in input_lines]
+INPUT_MODE = "mmap"
+
+
+def main(input_bytes, preamble_len=25):
+    numbers = parse_ints(input_bytes).tolist()
 
     number = None
     for i, number in enumerate(numbers):
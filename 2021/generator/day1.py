@@ -0,0 +1,12 @@
+# Size of an actual input
+N_MEASUREMENTS = 2000
+
+
+def generate(rng, scale=1.0):
+    depth_measurement = rng.randint(100, 200)
+    depth_measurements = []
+    for _ in range(max(1, round(N_MEASUREMENTS * scale))):
+        # The depth mostly increases
+        depth_measurement = max(0, depth_measurement + rng.randint(-10, 15))
+        depth_measurements.append(depth_measurement)
+    return [str(depth_measurement) for depth_measurement in depth_measurements]
@@ -0,0 +1,29 @@
+# Size of an actual input
+N_LINES = 100
+LINE_LEN = 100
+
+CHAR_PAIRS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+def generate(rng, scale=1.0):
+    input_lines = []
+    for _ in range(max(1, round(N_LINES * scale))):
+        line = []
+        open_chunks = []
+        while len(line) < LINE_LEN:
+            if open_chunks and (rng.random() < 0.45):
+                line.append(CHAR_PAIRS[open_chunks.pop()])
+            else:
+                open_chunks.append(rng.choice(list(CHAR_PAIRS)))
+                line.append(open_chunks[-1])
+
+        if open_chunks and (rng.random() < 0.5):
+            # Incomplete line
+            input_lines.append("".join(line))
+            continue
+        # Corrupted line: one of the closing characters is wrong
+        closing_idx = [i for i, char in enumerate(line) if char in CHAR_PAIRS.values()]
+        i = rng.choice(closing_idx)
+        line[i] = rng.choice([char for char in CHAR_PAIRS.values() if char != line[i]])
+        input_lines.append("".join(line))
+    return input_lines
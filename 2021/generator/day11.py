@@ -0,0 +1,43 @@
+# Size of an actual input
+N_ROWS, N_COLUMNS = 10, 10
+# Steps counted in the first part of the puzzle
+N_STEPS = 100
+MAX_N_STEPS = 1000
+
+
+def find_synchronized_step(grid):
+    grid = [list(row) for row in grid]
+    for i_step in range(1, MAX_N_STEPS + 1):
+        flashing_octopuses = []
+        for row_idx, row in enumerate(grid):
+            for col_idx, energy_lvl in enumerate(row):
+                row[col_idx] = energy_lvl + 1
+                if row[col_idx] == 10:
+                    flashing_octopuses.append((row_idx, col_idx))
+        n_flashes = 0
+        while flashing_octopuses:
+            row_idx, col_idx = flashing_octopuses.pop()
+            n_flashes += 1
+            for next_row_idx in range(max(0, row_idx - 1), min(len(grid), row_idx + 2)):
+                for next_col_idx in range(
+                    max(0, col_idx - 1), min(len(grid[0]), col_idx + 2)
+                ):
+                    grid[next_row_idx][next_col_idx] += 1
+                    if grid[next_row_idx][next_col_idx] == 10:
+                        flashing_octopuses.append((next_row_idx, next_col_idx))
+        for row in grid:
+            for col_idx, energy_lvl in enumerate(row):
+                if energy_lvl > 9:
+                    row[col_idx] = 0
+        if n_flashes == len(grid) * len(grid[0]):
+            return i_step
+    return None
+
+
+# Larger grids rarely synchronize: the scale is ignored
+def generate(rng, scale=1.0):  # pylint: disable=unused-argument
+    while True:
+        grid = [[rng.randint(1, 9) for _ in range(N_COLUMNS)] for _ in range(N_ROWS)]
+        synchronized_step = find_synchronized_step(grid)
+        if (synchronized_step is not None) and (synchronized_step > N_STEPS):
+            return ["".join(str(energy_lvl) for energy_lvl in row) for row in grid]
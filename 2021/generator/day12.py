@@ -0,0 +1,45 @@
+import string
+
+
+# Size of an actual input
+N_SMALL_CAVES, N_BIG_CAVES = 6, 2
+
+
+def generate_cave(rng, caves, letters):
+    while True:
+        cave = "".join(rng.choice(letters) for _ in range(2))
+        if cave not in caves:
+            return cave
+
+
+def generate(rng, scale=1.0):
+    # The number of paths grows exponentially with the number of caves
+    caves = {"start", "end"}
+    small_caves = [
+        generate_cave(rng, caves, string.ascii_lowercase)
+        for _ in range(max(1, round(N_SMALL_CAVES * scale)))
+    ]
+    caves.update(small_caves)
+    big_caves = []
+    for _ in range(max(1, round(N_BIG_CAVES * scale))):
+        big_caves.append(generate_cave(rng, caves, string.ascii_uppercase))
+        caves.add(big_caves[-1])
+
+    # Big caves are never connected to each other: the paths are finite
+    edges = set()
+    for big_cave in big_caves:
+        for small_cave in rng.sample(small_caves, min(3, len(small_caves))):
+            edges.add((big_cave, small_cave))
+    for _ in range(len(small_caves)):
+        edges.add(tuple(rng.sample(small_caves, 2)) if len(small_caves) > 1 else ())
+    edges.discard(())
+    for terminal_cave in ("start", "end"):
+        for cave in rng.sample(small_caves + big_caves, 2):
+            edges.add(
+                (terminal_cave, cave) if rng.random() < 0.5 else (cave, terminal_cave)
+            )
+
+    input_lines = ["-".join(edge) for edge in edges]
+    input_lines.sort()
+    rng.shuffle(input_lines)
+    return input_lines
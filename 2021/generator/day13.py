@@ -0,0 +1,32 @@
+# Size of an actual input
+N_DOTS = 800
+# The folded paper displays the code on 8 letters
+CODE_WIDTH, CODE_HEIGHT = 40, 6
+FOLDS = [
+    ("x", 655), ("y", 447), ("x", 327), ("y", 223), ("x", 163), ("y", 111),
+    ("x", 81), ("y", 55), ("x", 40), ("y", 27), ("y", 13), ("y", 6),
+]  # fmt: skip
+
+
+def generate(rng, scale=1.0):
+    dots = set()
+    while len(dots) < max(1, round(N_DOTS * scale)):
+        # Unfold a dot of the code: no dot is ever on a fold line
+        dot = [rng.randrange(CODE_WIDTH), rng.randrange(CODE_HEIGHT)]
+        for fold_axis, line_num in reversed(FOLDS):
+            axis = int(fold_axis == "y")
+            if rng.random() < 0.5:
+                dot[axis] = 2 * line_num - dot[axis]
+        dots.add(tuple(dot))
+
+    input_lines = ["{},{}".format(x_coord, y_coord) for x_coord, y_coord in dots]
+    input_lines.sort()
+    rng.shuffle(input_lines)
+    return (
+        input_lines
+        + [""]
+        + [
+            "fold along {}={}".format(fold_axis, line_num)
+            for fold_axis, line_num in FOLDS
+        ]
+    )
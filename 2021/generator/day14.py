@@ -0,0 +1,18 @@
+# Size of an actual input
+TEMPLATE_LEN = 20
+
+ELEMENTS = "BCFHKNOPSV"
+
+
+def generate(rng, scale=1.0):
+    template = "".join(
+        rng.choice(ELEMENTS) for _ in range(max(2, round(TEMPLATE_LEN * scale)))
+    )
+    # A rule for each pair of elements
+    rules = [
+        "{}{} -> {}".format(element_1, element_2, rng.choice(ELEMENTS))
+        for element_1 in ELEMENTS
+        for element_2 in ELEMENTS
+    ]
+    rng.shuffle(rules)
+    return [template, ""] + rules
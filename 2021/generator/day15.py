@@ -0,0 +1,9 @@
+# Size of an actual input
+N_ROWS, N_COLUMNS = 100, 100
+
+
+def generate(rng, scale=1.0):
+    return [
+        "".join(str(rng.randint(1, 9)) for _ in range(N_COLUMNS))
+        for _ in range(max(1, round(N_ROWS * scale)))
+    ]
@@ -0,0 +1,58 @@
+# Size of an actual input
+N_LITERALS = 250
+MAX_N_SUBPACKETS = 5
+
+SUM_TYPE_ID, PRODUCT_TYPE_ID, LITERAL_TYPE_ID = 0, 1, 4
+COMPARISON_TYPE_IDS = [5, 6, 7]
+
+
+def encode_literal(rng):
+    n_groups = rng.randint(1, 4)
+    bits = ""
+    for i in range(n_groups):
+        bits += "{}{:04b}".format(int(i < n_groups - 1), rng.randrange(16))
+    return bits
+
+
+def encode_packet(rng, n_literals, is_root=False):
+    version = "{:03b}".format(rng.randrange(8))
+    if n_literals == 1:
+        return version + "{:03b}".format(LITERAL_TYPE_ID) + encode_literal(rng)
+
+    # The comparison operators have exactly 2 sub-packets, the product is kept small
+    if is_root:
+        type_id = SUM_TYPE_ID
+    elif n_literals == 2:
+        type_id = rng.choice(COMPARISON_TYPE_IDS + [SUM_TYPE_ID, 2, 3])
+    else:
+        type_id = rng.choice(
+            [SUM_TYPE_ID, 2, 3] + ([PRODUCT_TYPE_ID] if n_literals <= 4 else [])
+        )
+    n_subpackets = (
+        2
+        if type_id in COMPARISON_TYPE_IDS
+        else rng.randint(2, min(MAX_N_SUBPACKETS, n_literals))
+    )
+    if is_root:
+        n_subpackets = min(max(2, n_literals // 10), 2**11 - 1)
+
+    # Split the literals between the sub-packets
+    split_idx = sorted(rng.sample(range(1, n_literals), n_subpackets - 1))
+    subpackets = "".join(
+        encode_packet(rng, end - start)
+        for start, end in zip([0] + split_idx, split_idx + [n_literals])
+    )
+    if (len(subpackets) < 2**15) and (rng.random() < 0.5):
+        length = "0{:015b}".format(len(subpackets))
+    else:
+        length = "1{:011b}".format(n_subpackets)
+    return version + "{:03b}".format(type_id) + length + subpackets
+
+
+def generate(rng, scale=1.0):
+    # The root packet sums its sub-packets
+    bits = encode_packet(rng, max(2, round(N_LITERALS * scale)), is_root=True)
+    bits += "0" * (-len(bits) % 4)
+    return [
+        "".join("{:X}".format(int(bits[i : i + 4], 2)) for i in range(0, len(bits), 4))
+    ]
@@ -0,0 +1,15 @@
+# Size of an actual input
+TARGET_AREA_MIN_X, TARGET_AREA_MIN_Y = 140, -150
+
+
+def generate(rng, scale=1.0):
+    # The probe can stop above the target area: its x-range contains a triangular number
+    x_stop = max(10, round(TARGET_AREA_MIN_X * scale * rng.uniform(1, 1.2)))
+    initial_x_speed = round((2 * x_stop) ** 0.5)
+    x_stop = initial_x_speed * (initial_x_speed + 1) // 2
+    min_x = x_stop - rng.randint(0, x_stop // 6)
+    max_x = x_stop + rng.randint(x_stop // 6, x_stop // 3)
+
+    min_y = min(-10, round(TARGET_AREA_MIN_Y * scale * rng.uniform(0.9, 1)))
+    max_y = min_y + rng.randint(-min_y // 3, -min_y // 2)
+    return ["target area: x={}..{}, y={}..{}".format(min_x, max_x, min_y, max_y)]
@@ -0,0 +1,20 @@
+# Size of an actual input
+N_NUMBERS = 100
+# Reduced snailfish numbers are nested inside at most 4 pairs
+MAX_DEPTH = 4
+
+
+def generate_snailfish_num(rng, depth=1):
+    elements = [
+        generate_snailfish_num(rng, depth + 1)
+        if (depth < MAX_DEPTH) and (rng.random() < 0.6)
+        else str(rng.randint(0, 9))
+        for _ in range(2)
+    ]
+    return "[{},{}]".format(*elements)
+
+
+def generate(rng, scale=1.0):
+    return [
+        generate_snailfish_num(rng) for _ in range(max(1, round(N_NUMBERS * scale)))
+    ]
@@ -0,0 +1,84 @@
+import itertools
+
+
+# Size of an actual input
+N_SCANNERS = 30
+N_BEACONS_PER_SCANNER = 15
+# Range of detection of the scanners
+DETECTION_RANGE = 1000
+MIN_N_MATCHING_BEACONS = 12
+
+
+def get_rotations():
+    # The 24 rotations, as signed permutations of the coordinates of determinant 1
+    rotations = []
+    for permutation in itertools.permutations(range(3)):
+        n_inversions = sum(
+            permutation[i] > permutation[j] for i in range(3) for j in range(i + 1, 3)
+        )
+        for signs in itertools.product((1, -1), repeat=3):
+            if (-1) ** n_inversions * signs[0] * signs[1] * signs[2] == 1:
+                rotations.append((permutation, signs))
+    return rotations
+
+
+def is_detected(beacon, scanner):
+    return all(abs(beacon[k] - scanner[k]) <= DETECTION_RANGE for k in range(3))
+
+
+def generate_beacon(rng, scanners):
+    # Beacon detected by all the given scanners
+    return tuple(
+        rng.randint(
+            max(scanner[k] for scanner in scanners) - DETECTION_RANGE,
+            min(scanner[k] for scanner in scanners) + DETECTION_RANGE,
+        )
+        for k in range(3)
+    )
+
+
+def generate(rng, scale=1.0):
+    scanners = [(0, 0, 0)]
+    beacons = {generate_beacon(rng, scanners) for _ in range(N_BEACONS_PER_SCANNER)}
+    for _ in range(max(2, round(N_SCANNERS * scale)) - 1):
+        # Each scanner shares enough beacons with a previous one to be located
+        previous_scanner = rng.choice(scanners)
+        scanner = tuple(
+            previous_scanner[k]
+            + rng.randint(-DETECTION_RANGE - 200, DETECTION_RANGE + 200)
+            for k in range(3)
+        )
+        if scanner in scanners:
+            continue
+        shared_beacons = {
+            beacon
+            for beacon in beacons
+            if is_detected(beacon, previous_scanner) and is_detected(beacon, scanner)
+        }
+        while len(shared_beacons) < MIN_N_MATCHING_BEACONS + rng.randint(0, 2):
+            shared_beacons.add(generate_beacon(rng, [previous_scanner, scanner]))
+        beacons.update(shared_beacons)
+        beacons.update(
+            generate_beacon(rng, [scanner]) for _ in range(N_BEACONS_PER_SCANNER)
+        )
+        scanners.append(scanner)
+
+    rotations = get_rotations()
+    input_lines = []
+    for scanner_idx, scanner in enumerate(scanners):
+        # The beacons are given relatively to the scanner, in its own orientation
+        permutation, signs = rotations[0] if scanner_idx == 0 else rng.choice(rotations)
+        input_lines.append("--- scanner {} ---".format(scanner_idx))
+        detected_beacons = [
+            beacon for beacon in beacons if is_detected(beacon, scanner)
+        ]
+        rng.shuffle(detected_beacons)
+        for beacon in detected_beacons:
+            input_lines.append(
+                ",".join(
+                    str(signs[k] * (beacon[permutation[k]] - scanner[permutation[k]]))
+                    for k in range(3)
+                )
+            )
+        input_lines.append("")
+    return input_lines[:-1]
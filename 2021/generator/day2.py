@@ -0,0 +1,18 @@
+# Size of an actual input
+N_INSTRUCTIONS = 1000
+
+
+def generate(rng, scale=1.0):
+    depth = 0
+    input_lines = []
+    for _ in range(max(1, round(N_INSTRUCTIONS * scale))):
+        direction = rng.choice(["forward", "down", "down", "up"])
+        value = rng.randint(1, 9)
+        # The submarine never goes above the surface
+        if direction == "up":
+            value = min(value, depth)
+            if value == 0:
+                direction, value = "down", rng.randint(1, 9)
+        depth += {"forward": 0, "down": value, "up": -value}[direction]
+        input_lines.append("{} {}".format(direction, value))
+    return input_lines
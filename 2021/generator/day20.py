@@ -0,0 +1,16 @@
+# Size of an actual input
+N_ROWS, N_COLUMNS = 100, 100
+ALGORITHM_LEN = 512
+
+
+def generate(rng, scale=1.0, light_pixel="#", dark_pixel="."):
+    algorithm = [rng.choice([light_pixel, dark_pixel]) for _ in range(ALGORITHM_LEN)]
+    # The infinite image cannot stay lit forever
+    if algorithm[0] == light_pixel:
+        algorithm[-1] = dark_pixel
+
+    image = [
+        "".join(rng.choice([light_pixel, dark_pixel]) for _ in range(N_COLUMNS))
+        for _ in range(max(1, round(N_ROWS * scale)))
+    ]
+    return ["".join(algorithm), ""] + image
@@ -0,0 +1,36 @@
+# Size of an actual input
+N_INIT_STEPS, N_REBOOT_STEPS = 20, 400
+INIT_HALF_SIDE, REBOOT_HALF_SIDE = 50, 100000
+
+
+def generate_cuboid(rng, half_side, max_len):
+    cuboid = []
+    for _ in range(3):
+        start = rng.randint(-half_side, half_side - 1)
+        end = min(start + rng.randint(1, max_len), half_side)
+        cuboid.append((start, end))
+    return cuboid
+
+
+def generate(rng, scale=1.0):
+    reboot_steps = []
+    # The first reboot steps are in the initialization procedure region
+    for i in range(max(1, round(N_INIT_STEPS * scale))):
+        turn_on = (i == 0) or (rng.random() < 0.7)
+        cuboid = generate_cuboid(rng, INIT_HALF_SIDE, INIT_HALF_SIDE)
+        reboot_steps.append((turn_on, cuboid))
+    # The other reboot steps are outside of it
+    while len(reboot_steps) < round((N_INIT_STEPS + N_REBOOT_STEPS) * scale):
+        turn_on = rng.random() < 0.6
+        cuboid = generate_cuboid(rng, REBOOT_HALF_SIDE, REBOOT_HALF_SIDE // 3)
+        if any(
+            (end < -INIT_HALF_SIDE) or (start > INIT_HALF_SIDE) for start, end in cuboid
+        ):
+            reboot_steps.append((turn_on, cuboid))
+
+    return [
+        "{} x={}..{},y={}..{},z={}..{}".format(
+            "on" if turn_on else "off", *[coord for span in cuboid for coord in span]
+        )
+        for turn_on, cuboid in reboot_steps
+    ]
@@ -0,0 +1,19 @@
+# Size of an actual input
+ROOM_SIZE = 2
+
+AMPHIPOD_TYPES = "ABCD"
+
+
+def generate(rng, scale=1.0):
+    # The number of states to search grows exponentially with the size of the rooms
+    room_size = max(1, round(ROOM_SIZE * scale))
+    amphipods = rng.sample(AMPHIPOD_TYPES * room_size, len(AMPHIPOD_TYPES) * room_size)
+
+    input_lines = ["#############", "#...........#"]
+    for i in range(room_size):
+        room_line = "#".join(
+            amphipods[i * len(AMPHIPOD_TYPES) : (i + 1) * len(AMPHIPOD_TYPES)]
+        )
+        input_lines.append(("###{}###" if i == 0 else "  #{}#").format(room_line))
+    input_lines.append("  #########")
+    return input_lines
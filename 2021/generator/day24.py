@@ -0,0 +1,41 @@
+# Number of digits of a model number
+N_DIGITS = 14
+
+BLOCK_PATTERN = [
+    "inp w", "mul x 0", "add x z", "mod x 26", "div z {div_z}", "add x {add_x}",
+    "eql x w", "eql x 0", "mul y 0", "add y 25", "mul y x", "add y 1", "mul z y",
+    "mul y 0", "add y w", "add y {add_y}", "mul y x", "add z y",
+]  # fmt: skip
+
+
+# The length of the model numbers is fixed: the scale is ignored
+def generate(rng, scale=1.0):  # pylint: disable=unused-argument
+    # Blocks either push their digit on the stack (z in base 26) or pop it back:
+    # the digits of a matched pair satisfy w_pop = w_push + add_y_push + add_x_pop
+    is_push = []
+    n_pushes = 0
+    for i in range(N_DIGITS):
+        can_push = n_pushes < N_DIGITS - i
+        can_pop = n_pushes > 0
+        is_push.append(can_push and (not can_pop or rng.random() < 0.5))
+        n_pushes += 1 if is_push[-1] else -1
+
+    input_lines = []
+    pushed_add_y = []
+    for push in is_push:
+        if push:
+            parameters = {
+                "div_z": 1,
+                "add_x": rng.randint(10, 15),
+                "add_y": rng.randint(1, 16),
+            }
+            pushed_add_y.append(parameters["add_y"])
+        else:
+            # The digits of the pair differ by at most 8
+            parameters = {
+                "div_z": 26,
+                "add_x": rng.randint(-8, 8) - pushed_add_y.pop(),
+                "add_y": rng.randint(1, 16),
+            }
+        input_lines.extend(line.format(**parameters) for line in BLOCK_PATTERN)
+    return input_lines
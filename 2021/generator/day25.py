@@ -0,0 +1,12 @@
+# Size of an actual input
+N_ROWS, N_COLUMNS = 137, 139
+
+
+def generate(rng, scale=1.0, empty_value=".", east_value=">", south_value="v"):
+    return [
+        "".join(
+            rng.choice([empty_value, empty_value, east_value, south_value])
+            for _ in range(N_COLUMNS)
+        )
+        for _ in range(max(1, round(N_ROWS * scale)))
+    ]
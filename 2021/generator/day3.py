@@ -0,0 +1,13 @@
+# Size of an actual input
+N_NUMBERS = 1000
+MIN_N_BITS = 12
+
+
+def generate(rng, scale=1.0):
+    n_numbers = max(2, round(N_NUMBERS * scale))
+    # The numbers are distinct: the ratings are unique
+    n_bits = max(MIN_N_BITS, (4 * n_numbers).bit_length())
+    return [
+        "{:0{}b}".format(number, n_bits)
+        for number in rng.sample(range(2**n_bits), n_numbers)
+    ]
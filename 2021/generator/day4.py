@@ -0,0 +1,24 @@
+# Size of an actual input
+N_BOARDS = 100
+BOARD_SIZE = 5
+MAX_NUMBER = 99
+
+
+def generate(rng, scale=1.0):
+    n_boards = max(1, round(N_BOARDS * scale))
+    boards = [
+        rng.sample(range(MAX_NUMBER + 1), BOARD_SIZE**2) for _ in range(n_boards)
+    ]
+    drawn_numbers = rng.sample(range(MAX_NUMBER + 1), MAX_NUMBER + 1)
+
+    input_lines = [",".join(str(number) for number in drawn_numbers)]
+    for board in boards:
+        input_lines.append("")
+        for i in range(BOARD_SIZE):
+            input_lines.append(
+                " ".join(
+                    "{:2d}".format(number)
+                    for number in board[i * BOARD_SIZE : (i + 1) * BOARD_SIZE]
+                )
+            )
+    return input_lines
@@ -0,0 +1,24 @@
+# Size of an actual input
+N_VENT_LINES = 500
+GRID_SIZE = 1000
+
+
+def generate(rng, scale=1.0):
+    input_lines = []
+    while len(input_lines) < max(1, round(N_VENT_LINES * scale)):
+        x_1, y_1 = rng.randrange(GRID_SIZE), rng.randrange(GRID_SIZE)
+        # Horizontal, vertical or diagonal at 45 degrees
+        dx, dy = rng.choice(
+            [(1, 0), (0, 1), (1, 1), (1, -1), (-1, 0), (0, -1), (-1, -1), (-1, 1)]
+        )
+        length = rng.randint(1, GRID_SIZE // 2)
+        # Clip the line inside the grid
+        while (length > 0) and not (
+            0 <= x_1 + length * dx < GRID_SIZE and 0 <= y_1 + length * dy < GRID_SIZE
+        ):
+            length -= 1
+        if length > 0:
+            input_lines.append(
+                "{},{} -> {},{}".format(x_1, y_1, x_1 + length * dx, y_1 + length * dy)
+            )
+    return input_lines
@@ -0,0 +1,11 @@
+# Size of an actual input
+N_LANTERNFISHES = 300
+
+
+def generate(rng, scale=1.0):
+    return [
+        ",".join(
+            str(rng.randint(1, 5))
+            for _ in range(max(1, round(N_LANTERNFISHES * scale)))
+        )
+    ]
@@ -0,0 +1,13 @@
+# Size of an actual input
+N_CRABS = 1000
+MAX_POSITION = 2000
+
+
+def generate(rng, scale=1.0):
+    # Most of the crabs are close to each other
+    return [
+        ",".join(
+            str(min(int(rng.expovariate(1 / 300)), MAX_POSITION))
+            for _ in range(max(1, round(N_CRABS * scale)))
+        )
+    ]
@@ -0,0 +1,27 @@
+# Size of an actual input
+N_ENTRIES = 200
+
+DIGIT_SEGMENTS = [
+    "abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf", "abcdefg",
+    "abcdfg",
+]  # fmt: skip
+
+
+def wire(rng, wiring, digit):
+    segments = [wiring[segment] for segment in DIGIT_SEGMENTS[digit]]
+    return "".join(rng.sample(segments, len(segments)))
+
+
+def generate(rng, scale=1.0):
+    input_lines = []
+    for _ in range(max(1, round(N_ENTRIES * scale))):
+        # Random wiring of the segments
+        wiring = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+        signal_patterns = [
+            wire(rng, wiring, digit) for digit in rng.sample(range(10), 10)
+        ]
+        output_digits = [wire(rng, wiring, rng.randrange(10)) for _ in range(4)]
+        input_lines.append(
+            "{} | {}".format(" ".join(signal_patterns), " ".join(output_digits))
+        )
+    return input_lines
@@ -0,0 +1,41 @@
+from collections import deque
+
+
+# Size of an actual input
+N_ROWS, N_COLUMNS = 100, 100
+# Number of points per basin
+BASIN_SIZE = 40
+MAX_HEIGHT = 9
+
+
+def generate(rng, scale=1.0):
+    n_rows = max(1, round(N_ROWS * scale))
+    n_low_points = max(1, n_rows * N_COLUMNS // BASIN_SIZE)
+
+    # Each point belongs to the basin of its closest low point
+    low_points = rng.sample(
+        [(i, j) for i in range(n_rows) for j in range(N_COLUMNS)], n_low_points
+    )
+    basins = [[None] * N_COLUMNS for _ in range(n_rows)]
+    heights = [[0] * N_COLUMNS for _ in range(n_rows)]
+    todo_points = deque()
+    for basin_idx, (i, j) in enumerate(low_points):
+        basins[i][j] = basin_idx
+        todo_points.append((i, j))
+    while todo_points:
+        i, j = todo_points.popleft()
+        for next_i, next_j in ((i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1)):
+            if (0 <= next_i < n_rows) and (0 <= next_j < N_COLUMNS):
+                if basins[next_i][next_j] is None:
+                    basins[next_i][next_j] = basins[i][j]
+                    heights[next_i][next_j] = min(heights[i][j] + 1, MAX_HEIGHT - 1)
+                    todo_points.append((next_i, next_j))
+
+    # The basins are separated by the highest points
+    for i in range(n_rows):
+        for j in range(N_COLUMNS):
+            if ((i + 1 < n_rows) and (basins[i + 1][j] != basins[i][j])) or (
+                (j + 1 < N_COLUMNS) and (basins[i][j + 1] != basins[i][j])
+            ):
+                heights[i][j] = MAX_HEIGHT
+    return ["".join(str(height) for height in row) for row in heights]
@@ -1,28 +1,33 @@
-def main(input_lines, window_size=3):
-    depth_measurements = [int(line) for line in input_lines]
+from collections import deque
 
-    part1_answer = compute_num_measurement_increases(depth_measurements)
-    # Remark: this is equivalent to:
-    # part1_answer = compute_num_window_increases(depth_measurements, 1)
-    part2_answer = compute_num_window_increases(depth_measurements, window_size)
-    return part1_answer, part2_answer
 
+INPUT_MODE = "stream"
 
-def compute_num_measurement_increases(depth_measurements):
-    num_increases = 0
-    for i, depth_measurement in enumerate(depth_measurements[:-1]):
-        if depth_measurements[i + 1] > depth_measurement:
-            num_increases += 1
-    return num_increases
+
+def main(input_lines, window_size=3):
+    depth_measurements = map(int, input_lines)
+
+    # Remark: the first part is equivalent to a window of size 1
+    part1_answer, part2_answer = compute_num_window_increases(
+        depth_measurements, (1, window_size)
+    )
+    return part1_answer, part2_answer
 
 
-def compute_num_window_increases(depth_measurements, window_size):
+def compute_num_window_increases(depth_measurements, window_sizes):
     # Since we are considering CONSECUTIVE sums (sliding window).
     # a + b + c < b + c + d is equivalent to: a < d
     # We do not need to actually compute the sums.
     # Instead we can just compare elements that are 'window_size' apart.
-    num_increases = 0
-    for i, depth_measurement in enumerate(depth_measurements[:-window_size]):
-        if depth_measurements[i + window_size] > depth_measurement:
-            num_increases += 1
+    # So only the last 'max(window_sizes)' measurements need to be kept.
+    prev_depth_measurements = deque(maxlen=max(window_sizes))
+    num_increases = [0] * len(window_sizes)
+    for depth_measurement in depth_measurements:
+        for k, window_size in enumerate(window_sizes):
+            if (
+                len(prev_depth_measurements) >= window_size
+                and depth_measurement > prev_depth_measurements[-window_size]
+            ):
+                num_increases[k] += 1
+        prev_depth_measurements.append(depth_measurement)
     return num_increases
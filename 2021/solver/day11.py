@@ -1,24 +1,32 @@
-def main(input_lines):
-    initial_state = parse_grid(input_lines)
+import numpy as np
+
+from common.grid import read_grid
+from common.neighbors import count_neighbors, moore_kernel
+
+
+INPUT_MODE = "mmap"
+
+# Above this energy level, an octopus flashes
+MAX_ENERGY_LVL = 9
+
+
+def main(input_bytes):
+    initial_state = parse_grid(input_bytes)
     part1_answer, part2_answer = simulate(initial_state)
     return part1_answer, part2_answer
 
 
-def parse_grid(input_lines):
-    grid = []
-    for input_line in input_lines:
-        grid.append([])
-        for char in input_line:
-            grid[-1].append(int(char))
+def parse_grid(input_bytes):
+    grid = (read_grid(input_bytes) - ord("0")).astype(int)
     return grid
 
 
 def simulate(state, n_steps=100):
-    n_octopuses = len(state) * len(state[0])
     i = 0
     tot_flashes_cnt, flashes_cnt = 0, 0
-    while flashes_cnt != n_octopuses:
-        flashes_cnt = step(state)
+    # Until all the octopuses flash simultaneously
+    while flashes_cnt != state.size:
+        state, flashes_cnt = step(state)
         if i < n_steps:
             tot_flashes_cnt += flashes_cnt
         i += 1
@@ -26,41 +34,14 @@ def simulate(state, n_steps=100):
 
 
 def step(state):
-    max_row, max_col = len(state), len(state[0])
-    backlog_octopuses = [
-        (row_idx, col_idx) for row_idx in range(max_row) for col_idx in range(max_col)
-    ]
-    flashed_octopuses = []
-    while len(backlog_octopuses) > 0:
-        row_idx, col_idx = backlog_octopuses.pop()
-        if (row_idx, col_idx) in flashed_octopuses:
-            continue
-        energy_lvl = state[row_idx][col_idx]
-        if energy_lvl < 9:
-            state[row_idx][col_idx] += 1
-        else:
-            state[row_idx][col_idx] = 0
-            flashed_octopuses.append((row_idx, col_idx))
-            backlog_octopuses.extend(get_neighbours(row_idx, col_idx, max_row, max_col))
-    return len(flashed_octopuses)
-
-
-def get_neighbours(row_idx, col_idx, max_row, max_col):
-    neighbours = []
-    if row_idx > 0:
-        neighbours.append((row_idx - 1, col_idx))
-    if row_idx < max_row - 1:
-        neighbours.append((row_idx + 1, col_idx))
-    if col_idx > 0:
-        neighbours.append((row_idx, col_idx - 1))
-    if col_idx < max_col - 1:
-        neighbours.append((row_idx, col_idx + 1))
-    if (row_idx > 0) and (col_idx > 0):
-        neighbours.append((row_idx - 1, col_idx - 1))
-    if (row_idx > 0) and (col_idx < max_col - 1):
-        neighbours.append((row_idx - 1, col_idx + 1))
-    if (row_idx < max_row - 1) and (col_idx > 0):
-        neighbours.append((row_idx + 1, col_idx - 1))
-    if (row_idx < max_row - 1) and (col_idx < max_col - 1):
-        neighbours.append((row_idx + 1, col_idx + 1))
-    return neighbours
+    state = state + 1
+    flashed = np.full(state.shape, False)
+    # Each flash gives energy to the neighbours: which may flash in turn
+    while True:
+        flashing = (state > MAX_ENERGY_LVL) & ~flashed
+        if not flashing.any():
+            break
+        flashed |= flashing
+        state += count_neighbors(flashing, moore_kernel(2))
+    state[flashed] = 0
+    return state, int(np.count_nonzero(flashed))
@@ -1,9 +1,17 @@
+import functools
+
+from common.search import a_star, dial
+
+
+MAX_RISK_LEVEL = 9
+
+
 def main(input_lines):
     risk_levels = parse_map(input_lines)
-    part1_answer = a_star(risk_levels)
+    part1_answer = find_lowest_total_risk(risk_levels)
 
     risk_levels_extended = extend_map(risk_levels)
-    part2_answer = a_star(risk_levels_extended)
+    part2_answer = find_lowest_total_risk(risk_levels_extended)
 
     return part1_answer, part2_answer
 
@@ -27,33 +35,38 @@ def extend_map(risk_levels, n_repeats=5):
     return risk_levels_extended
 
 
-def a_star(risk_levels):
-    # Definition of the problem variables
-    start_point = (0, 0)
-    end_point = (len(risk_levels) - 1, len(risk_levels[0]) - 1)
-
-    # Initialization
-    current_point = start_point
-    g_scores = {start_point: 0}
-    f_scores = {start_point: 0}
-
-    while current_point != end_point:
-        for neighbour in get_neighbours(
-            current_point, len(risk_levels), len(risk_levels[0])
-        ):
-            tmp_g_score = g_scores[current_point] + distance(neighbour, risk_levels)
-            if (neighbour in g_scores) and (g_scores[neighbour] <= tmp_g_score):
-                continue
-            # Update the estimates with the shortest path found
-            g_scores[neighbour] = tmp_g_score
-            f_scores[neighbour] = tmp_g_score + compute_h_score(
-                current_point, neighbour
-            )
-        # Found shortest to 'current_point'
-        current_point = min(f_scores.keys(), key=lambda point: f_scores[point])
-        f_scores.pop(current_point)
-
-    return g_scores[end_point]
+def find_lowest_total_risk(risk_levels, method="dial"):
+    n_rows, n_cols = len(risk_levels), len(risk_levels[0])
+    # The points are encoded by their index in the flattened map
+    start_idx = 0
+    end_idx = n_rows * n_cols - 1
+    # Built once: the search then only looks the moves up
+    weighted_neighbours = [
+        [
+            (distance(neighbour, risk_levels), neighbour[0] * n_cols + neighbour[1])
+            for neighbour in get_neighbours((row_idx, col_idx), n_rows, n_cols)
+        ]
+        for row_idx in range(n_rows)
+        for col_idx in range(n_cols)
+    ]
+    if method == "a_star":
+        result = a_star(
+            [start_idx],
+            weighted_neighbours.__getitem__,
+            is_goal=end_idx.__eq__,
+            heuristic=lambda point_idx: compute_h_score(
+                divmod(point_idx, n_cols), (n_rows - 1, n_cols - 1)
+            ),
+        )
+    else:
+        # The risk levels are small integers: a bucket queue instead of a heap
+        result = dial(
+            [start_idx],
+            weighted_neighbours.__getitem__,
+            max_cost=MAX_RISK_LEVEL,
+            is_goal=end_idx.__eq__,
+        )
+    return result.goal_distance
 
 
 def get_neighbours(point, max_row, max_col):
@@ -81,3 +94,13 @@ def compute_h_score(point, end_point):
     dy = abs(end_point[1] - point[1])
     # pylint: enable=invalid-name
     return dx + dy
+
+
+def find_part2_lowest_total_risk(input_lines, method):
+    return find_lowest_total_risk(extend_map(parse_map(input_lines)), method=method)
+
+
+VARIANTS = {
+    "a_star": functools.partial(find_part2_lowest_total_risk, method="a_star"),
+    "dial": functools.partial(find_part2_lowest_total_risk, method="dial"),
+}
@@ -1,69 +1,54 @@
-def main(input_lines, light_char="#"):
-    im_enhance_alg, input_im = parse_im(input_lines, light_char)
+import numpy as np
 
-    part1_answer = solve(im_enhance_alg, input_im, n_steps=2)
-    part2_answer = solve(im_enhance_alg, input_im, n_steps=50)
+from common.automaton import evolve
+from common.grid import find_blank_line, read_grid
+from common.neighbors import count_neighbors
 
-    return part1_answer, part2_answer
 
+INPUT_MODE = "mmap"
+
+# Weight of each pixel of the 3x3 square around a pixel in its enhance key:
+# the key is the binary number read from the top left pixel to the bottom right one
+ENHANCE_KEY_KERNEL = 2 ** np.arange(8, -1, -1).reshape((3, 3))
 
-def parse_im(input_lines, light_char):
-    im_enhance_alg = [int(c == light_char) for c in input_lines[0]]
-    input_im = [
-        [int(c == light_char) for c in input_line] for input_line in input_lines[2:]
-    ]
-    return im_enhance_alg, input_im
 
+def main(input_bytes, light_char="#"):
+    im_enhance_alg, input_im = parse_im(input_bytes, light_char)
 
-def binary_to_int(bin_number):
-    # Horner's method for polynomial evaluation
-    int_number = 0
-    for bit in bin_number:
-        int_number = 2 * int_number + bit
-    return int_number
+    part1_answer = solve(im_enhance_alg, input_im, n_steps=2)
+    part2_answer = solve(im_enhance_alg, input_im, n_steps=50)
 
+    return part1_answer, part2_answer
 
-def get_enhance_key(input_im, row_idx, col_idx, background_value):
-    max_row, max_col = len(input_im), len(input_im[0])
-    enhance_key = [background_value] * 9
-    if (0 < row_idx) and (0 < col_idx):
-        enhance_key[0] = input_im[row_idx - 1][col_idx - 1]
-    if (0 < row_idx) and (0 <= col_idx < max_col):
-        enhance_key[1] = input_im[row_idx - 1][col_idx]
-    if (0 < row_idx) and (col_idx < max_col - 1):
-        enhance_key[2] = input_im[row_idx - 1][col_idx + 1]
-    if (0 <= row_idx < max_row) and (0 < col_idx):
-        enhance_key[3] = input_im[row_idx][col_idx - 1]
-    if (0 <= row_idx < max_row) and (0 <= col_idx < max_col):
-        enhance_key[4] = input_im[row_idx][col_idx]
-    if (0 <= row_idx < max_row) and (col_idx < max_col - 1):
-        enhance_key[5] = input_im[row_idx][col_idx + 1]
-    if (row_idx < max_row - 1) and (0 < col_idx):
-        enhance_key[6] = input_im[row_idx + 1][col_idx - 1]
-    if (row_idx < max_row - 1) and (0 <= col_idx < max_col):
-        enhance_key[7] = input_im[row_idx + 1][col_idx]
-    if (row_idx < max_row - 1) and (col_idx < max_col - 1):
-        enhance_key[8] = input_im[row_idx + 1][col_idx + 1]
-    return enhance_key
+
+def parse_im(input_bytes, light_char):
+    # The algorithm and the image are separated by a blank line
+    im_offset = find_blank_line(input_bytes)
+    im_enhance_alg = (
+        read_grid(input_bytes, size=im_offset - 2) == ord(light_char)
+    ).ravel()
+    input_im = read_grid(input_bytes, offset=im_offset) == ord(light_char)
+    return im_enhance_alg, input_im
 
 
-def enhance(im_enhance_alg, input_im, background_value):
-    max_row, max_col = len(input_im), len(input_im[0])
-    output_im = []
-    for row_idx in range(-1, max_row + 1):
-        output_im.append([])
-        for col_idx in range(-1, max_col + 1):
-            enhance_key = get_enhance_key(input_im, row_idx, col_idx, background_value)
-            pixel_value = im_enhance_alg[binary_to_int(enhance_key)]
-            output_im[-1].append(pixel_value)
-    return output_im
+def enhance(im_enhance_alg, image, _step_idx):
+    # The infinite background of the image is uniform: as its border
+    background_value = int(image[0, 0])
+    # The image grows by one pixel on each side
+    image = np.pad(image, 1, constant_values=background_value)
+    enhance_keys = count_neighbors(
+        image, ENHANCE_KEY_KERNEL, fill_value=background_value
+    )
+    return im_enhance_alg[enhance_keys], True
 
 
 def solve(im_enhance_alg, image, n_steps=0):
-    background_value = 0
-    for _k in range(n_steps):
-        image = enhance(im_enhance_alg, image, background_value)
-        background_enhance_key = [background_value] * 9
-        background_value = im_enhance_alg[binary_to_int(background_enhance_key)]
-    num_lit_pixels = sum(map(sum, image))
+    # With a border of background (dark at first) around the image
+    image = np.pad(image, 1, constant_values=False)
+    image = evolve(
+        image,
+        lambda image, step_idx: enhance(im_enhance_alg, image, step_idx),
+        n_steps,
+    )
+    num_lit_pixels = int(np.count_nonzero(image))
     return num_lit_pixels
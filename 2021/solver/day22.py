@@ -1,17 +1,29 @@
 def main(input_lines, init_side=50):
-    reboot_steps = parse_reboot_steps(input_lines)
+    parsed = parse(input_lines, init_side=init_side)
+    return part1(parsed), part2(parsed)
 
-    equivalent_on_cuboids = reboot(reboot_steps)
 
-    part1_answer = sum(
-        map(
-            lambda cuboid: compute_volume(cuboid, init_side=init_side),
-            equivalent_on_cuboids,
-        )
-    )
-    part2_answer = sum(map(compute_volume, equivalent_on_cuboids))
+def parse(input_lines, init_side=50):
+    return parse_reboot_steps(input_lines), init_side
+
+
+def part1(parsed):
+    reboot_steps, init_side = parsed
+
+    # Only the portions of the cuboids inside the initialization region matter
+    init_cuboid = [[-init_side, init_side]] * 3
+    init_reboot_steps = [
+        (turn_on, clip(cuboid, init_cuboid))
+        for turn_on, cuboid in reboot_steps
+        if not is_outside(cuboid, init_cuboid)
+    ]
+
+    return sum(map(compute_volume, reboot(init_reboot_steps)))
+
 
-    return part1_answer, part2_answer
+def part2(parsed):
+    reboot_steps, _ = parsed
+    return sum(map(compute_volume, reboot(reboot_steps)))
 
 
 def parse_reboot_steps(input_lines):
@@ -26,20 +38,28 @@ def parse_reboot_steps(input_lines):
     return reboot_steps
 
 
-def compute_volume(cuboid, init_side=None):
+def compute_volume(cuboid):
     volume = 1
     for start_idx, end_idx in cuboid:
-        if init_side is not None:
-            start_idx = max(
-                start_idx, -init_side  # pylint: disable=invalid-unary-operand-type
-            )
-            end_idx = min(end_idx, init_side)
         if start_idx > end_idx:
             return 0
         volume *= end_idx + 1 - start_idx
     return volume
 
 
+def clip(cuboid_1, cuboid_2):
+    """Portion of cuboid 1 inside cuboid 2
+
+    Assumption: cuboid 1 and 2 intersects
+    """
+    return [
+        [max(start_idx_1, start_idx_2), min(end_idx_1, end_idx_2)]
+        for (start_idx_1, end_idx_1), (start_idx_2, end_idx_2) in zip(
+            cuboid_1, cuboid_2
+        )
+    ]
+
+
 def is_inside(cuboid_1, cuboid_2):
     """Check if cuboid 1 is inside cuboid 2"""
     for i, cuboid_1_range in enumerate(cuboid_1):
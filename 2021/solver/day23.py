@@ -1,9 +1,12 @@
+from common.search import a_star
+
+
 def main(input_lines):
     part1_initial_state = parse_burrow(input_lines)
-    part1_answer = a_star(part1_initial_state)
+    part1_answer = find_least_energy(part1_initial_state)
 
     part2_initial_state = parse_burrow(part2_update_input(input_lines))
-    part2_answer = a_star(part2_initial_state)
+    part2_answer = find_least_energy(part2_initial_state)
 
     return part1_answer, part2_answer
 
@@ -65,38 +68,24 @@ def part2_update_input(input_lines):
     return updated_input_lines
 
 
-def a_star(initial_state):
-    cost_to_states = {initial_state: 0}
-    cost_to_goal_estimates = {initial_state: initial_state.cost_to_goal_heuristic()}
+def find_least_energy(initial_state):
+    result = a_star(
+        [initial_state],
+        get_next_states,
+        is_goal=Burrow.is_end_state,
+        heuristic=Burrow.cost_to_goal_heuristic,
+        key=Burrow.encode,
+    )
+    if result.goal is None:
+        raise RuntimeError("Could not find a path to the end state")
+    return result.goal_distance
 
-    while len(cost_to_goal_estimates) > 0:
-        # Find the open state with the smallest estimated cost to goal
-        current_state, _current_cost_to_goal_estimate = min(
-            cost_to_goal_estimates.items(), key=lambda open_state: open_state[1]
-        )
-        cost_to_goal_estimates.pop(current_state)
-
-        # Close this state
-        cost_to_current_state = cost_to_states[current_state]
-        if current_state.is_end_state():
-            return cost_to_current_state
-
-        # Find the neighboring states
-        for cost, transition in current_state.get_potential_transitions():
-            new_state = current_state.copy()
-            new_state.move(*transition)
-            new_cost_to_state = cost_to_current_state + cost
-            # Add the new state to the list of open states
-            # and update the cost estimate to get to the new state (if needed)
-            if (new_state not in cost_to_states) or (
-                cost_to_states[new_state] > new_cost_to_state
-            ):
-                cost_to_states[new_state] = new_cost_to_state
-                cost_to_goal_estimates[new_state] = (
-                    new_cost_to_state + new_state.cost_to_goal_heuristic()
-                )
 
-    raise RuntimeError("Could not find a path to the end state")
+def get_next_states(state):
+    for cost, transition in state.get_potential_transitions():
+        new_state = state.copy()
+        new_state.move(*transition)
+        yield cost, new_state
 
 
 class Amphipod(object):  # pylint: disable=useless-object-inheritance
@@ -121,9 +110,12 @@ class Burrow(object):  # pylint: disable=useless-object-inheritance
         self.amphipods_positions = {}
 
     def __eq__(self, other):
-        return hash(self) == hash(other)
+        return self.encode() == other.encode()
 
     def __hash__(self):
+        return hash(self.encode())
+
+    def encode(self):
         # Two burrows are considered identical if they have the same amphipods in the same spots
         # To make the resulting state independent on the order of the steps that led to it, we need:
         # - to discard the amphipods' numbers
@@ -143,7 +135,7 @@ class Burrow(object):  # pylint: disable=useless-object-inheritance
                     all_positions.append(amphipod.a_type)
                 else:
                     all_positions.append(None)
-        return hash(tuple(all_positions))
+        return tuple(all_positions)
 
     # Remark: could be achieved with copy.deepcopy(self)
     def copy(self):
@@ -1,50 +1,52 @@
-def main(input_lines):
-    ocean_map = parse_map(input_lines)
+import numpy as np
 
-    part1_answer = converge(ocean_map)
+from common.automaton import converge
+from common.grid import read_grid
+
+
+INPUT_MODE = "mmap"
+
+
+def main(input_bytes):
+    ocean_map = parse_map(input_bytes)
+
+    part1_answer = find_stable_step(ocean_map)
     part2_answer = "unspecified"
 
     return part1_answer, part2_answer
 
 
-def parse_map(input_lines):
-    ocean_map = [list(input_line) for input_line in input_lines]
+def parse_map(input_bytes):
+    # The characters are kept as their (ASCII) codes
+    ocean_map = read_grid(input_bytes)
     return ocean_map
 
 
-def step(old_map, empty_value=".", east_value=">", south_value="v"):
-    has_moved = False
-
-    new_map = [list(row) for row in old_map]
+def move_herd(old_map, herd_value, axis, empty_value):
+    # The sea cucumbers leaving an edge of the map reappear on the opposite edge
+    is_moving = (old_map == herd_value) & (
+        np.roll(old_map, -1, axis=axis) == empty_value
+    )
+    new_map = old_map.copy()
+    new_map[is_moving] = empty_value
+    new_map[np.roll(is_moving, 1, axis=axis)] = herd_value
+    return new_map, bool(is_moving.any())
+
+
+def step(
+    old_map,
+    _step_idx,
+    empty_value=ord("."),
+    east_value=ord(">"),
+    south_value=ord("v"),
+):
     # First move the east-facing herd
-    for row_idx, row in enumerate(old_map):
-        for col_idx, value in enumerate(row):
-            prev_col_idx = col_idx - 1
-            prev_col_value = row[prev_col_idx]
-            if (value == empty_value) and (prev_col_value == east_value):
-                new_map[row_idx][prev_col_idx] = empty_value
-                new_map[row_idx][col_idx] = east_value
-                has_moved = True
-
-    old_map = new_map
-    new_map = [list(row) for row in old_map]
+    new_map, has_east_moved = move_herd(old_map, east_value, 1, empty_value)
     # Then move the (potential) south-facing herd
-    for row_idx, row in enumerate(old_map):
-        prev_row_idx = row_idx - 1
-        for col_idx, value in enumerate(row):
-            prev_row_value = old_map[prev_row_idx][col_idx]
-            if (value == empty_value) and (prev_row_value == south_value):
-                new_map[prev_row_idx][col_idx] = empty_value
-                new_map[row_idx][col_idx] = south_value
-                has_moved = True
-
-    return has_moved, new_map
-
-
-def converge(ocean_map):
-    has_moved = True
-    n_steps = 0
-    while has_moved:
-        has_moved, ocean_map = step(ocean_map)
-        n_steps += 1
+    new_map, has_south_moved = move_herd(new_map, south_value, 0, empty_value)
+    return new_map, has_east_moved or has_south_moved
+
+
+def find_stable_step(ocean_map):
+    _stable_map, n_steps = converge(ocean_map, step)
     return n_steps
@@ -1,5 +1,13 @@
-def main(input_lines):
-    internal_timer_counts = parse_internal_timers(input_lines)
+import numpy as np
+
+from common.parsing import parse_ints
+
+
+INPUT_MODE = "mmap"
+
+
+def main(input_bytes):
+    internal_timer_counts = parse_internal_timers(input_bytes)
 
     part1_answer = reproduce(internal_timer_counts, 80)
     part2_answer = reproduce(internal_timer_counts, 256)
@@ -7,12 +15,12 @@ def main(input_lines):
     return part1_answer, part2_answer
 
 
-def parse_internal_timers(input_lines):
+def parse_internal_timers(input_bytes):
     # internal_timer_counts[i] = number of lanternfishes with an internal timer of i days
-    internal_timer_counts = [0] * 9
-    for internal_timer in input_lines[0].split(","):
-        internal_timer_counts[int(internal_timer)] += 1
-    return internal_timer_counts
+    internal_timers = parse_ints(input_bytes, sep=",")
+    if np.any((internal_timers < 0) | (internal_timers > 8)):
+        raise ValueError("Internal timers are expected between 0 and 8 days")
+    return np.bincount(internal_timers, minlength=9).tolist()
 
 
 def reproduce(internal_timer_counts, n_days):
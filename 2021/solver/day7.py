@@ -1,5 +1,13 @@
-def main(input_lines):
-    horizontal_positions = parse_horizontal_position(input_lines)
+import numpy as np
+
+from common.parsing import parse_ints
+
+
+INPUT_MODE = "mmap"
+
+
+def main(input_bytes):
+    horizontal_positions = parse_horizontal_position(input_bytes)
 
     part1_answer = part1_fuel_cost(horizontal_positions)
     part2_answer = part2_fuel_cost(horizontal_positions)
@@ -7,12 +15,8 @@ def main(input_lines):
     return part1_answer, part2_answer
 
 
-def parse_horizontal_position(input_lines):
-    horizontal_positions = [
-        int(horizontal_position) for horizontal_position in input_lines[0].split(",")
-    ]
-    horizontal_positions.sort()
-    return horizontal_positions
+def parse_horizontal_position(input_bytes):
+    return np.sort(parse_ints(input_bytes, sep=",")).tolist()
 
 
 def compute_median(values):
@@ -1,3 +1,8 @@
+import operator
+
+from common.union_find import UnionFind
+
+
 def main(input_lines):
     heightmap = parse_heightmap(input_lines)
     part1_answer, part2_answer = find_basins(heightmap)
@@ -10,12 +15,10 @@ def parse_heightmap(input_lines):
 
 
 def find_basins(heightmap, max_height=9):
-    # the i-th basin is described by the tuple: (number of points, height of low point)
-    basins = []
+    # the basins are described by: their number of points, the height of their low point
+    basins = UnionFind(n_points=operator.add, min_height=min)
     # indicate to which basin the points are associated
     basins_clusters = []
-    # re-map the basins indices when merging basins
-    basins_idx_remap = {}
 
     for row_idx, row in enumerate(heightmap):
         basins_clusters.append([])
@@ -30,35 +33,31 @@ def find_basins(heightmap, max_height=9):
             for neighbour in get_processed_neighbours(row_idx, col_idx):
                 neighbour_basin = basins_clusters[neighbour[0]][neighbour[1]]
                 if neighbour_basin != -1:
-                    associated_basins.append(
-                        basins_idx_remap.get(neighbour_basin, neighbour_basin)
-                    )
+                    associated_basins.append(neighbour_basin)
 
             # Create a new basin
             if len(associated_basins) == 0:
-                basins.append([0, height])
-                basin_idx = len(basins) - 1
+                basin_idx = basins.add(n_points=1, min_height=height)
             # Associate the point with the existing basin
-            elif len(associated_basins) == 1:
+            # (merging the two existing basins now connecting through the current point)
+            else:
                 basin_idx = associated_basins[0]
-            # Merge the two existing basins now connecting through the current point
-            else:  # len(associated_basins) == 2
-                if associated_basins[0] != associated_basins[1]:
-                    basin_idx = merge_basins(
-                        basins,
-                        associated_basins[0],
-                        associated_basins[1],
-                        basins_idx_remap,
-                    )
-
-            # Update the associated basin
-            update_basin(basins, basins_clusters, basin_idx, height)
-
-    # Clean-up: filter merged basins ; sort the basins by increasing sizes
-    basins = sorted([basin for basin in basins if basin is not None])
-
-    risk_levels_sum = sum(1 + basin[1] for basin in basins)
-    three_largest_basins_sizes_prod = basins[-1][0] * basins[-2][0] * basins[-3][0]
+                if len(associated_basins) == 2:
+                    basin_idx = basins.union(basin_idx, associated_basins[1])
+                basins.update(basin_idx, "n_points", 1)
+                basins.update(basin_idx, "min_height", height)
+            basins_clusters[-1].append(basin_idx)
+
+    # Sort the basins by increasing sizes
+    basins_roots = basins.components()
+    basins_sizes = sorted(basins.aggregate(root, "n_points") for root in basins_roots)
+
+    risk_levels_sum = sum(
+        1 + basins.aggregate(root, "min_height") for root in basins_roots
+    )
+    three_largest_basins_sizes_prod = (
+        basins_sizes[-1] * basins_sizes[-2] * basins_sizes[-3]
+    )
 
     return risk_levels_sum, three_largest_basins_sizes_prod
 
@@ -70,24 +69,3 @@ def get_processed_neighbours(row_idx, col_idx):
     if col_idx > 0:
         neighbours.append((row_idx, col_idx - 1))
     return neighbours
-
-
-def update_basin(basins, basins_clusters, basin_idx, height):
-    basins[basin_idx][0] += 1
-    basins[basin_idx][1] = min(basins[basin_idx][1], height)
-    basins_clusters[-1].append(basin_idx)
-
-
-def merge_basins(basins, first_basin_idx, second_basin_idx, basins_idx_remap):
-    new_basin_idx = min(first_basin_idx, second_basin_idx)
-    old_basin_idx = max(first_basin_idx, second_basin_idx)
-
-    basins[new_basin_idx][0] += basins[old_basin_idx][0]
-    basins[new_basin_idx][1] = min(basins[new_basin_idx][1], basins[old_basin_idx][1])
-    basins[old_basin_idx] = None
-
-    basins_idx_remap[old_basin_idx] = new_basin_idx
-    for basin_idx, actual_basin_idx in basins_idx_remap.items():
-        if actual_basin_idx == old_basin_idx:
-            basins_idx_remap[basin_idx] = new_basin_idx
-    return new_basin_idx
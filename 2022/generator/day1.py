@@ -0,0 +1,17 @@
+import random
+from typing import List
+
+
+# Size of an actual input
+N_ELVES = 250
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    input_lines: List[str] = []
+    for _ in range(max(1, round(N_ELVES * scale))):
+        input_lines.extend(
+            str(rng.randint(1000, 10000)) for _ in range(rng.randint(1, 15))
+        )
+        input_lines.append("")
+    input_lines.pop()
+    return input_lines
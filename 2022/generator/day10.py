@@ -0,0 +1,28 @@
+import random
+from typing import List
+
+
+# Size of an actual input
+N_INSTRUCTIONS = 140
+# Cycles drawing the CRT screen
+N_CYCLES = 240
+WIDTH_SCREEN = 40
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    input_lines: List[str] = []
+    x_register = 1
+    n_cycles = 0
+    while (len(input_lines) < round(N_INSTRUCTIONS * scale)) or (n_cycles < N_CYCLES):
+        if rng.random() < 0.3:
+            input_lines.append("noop")
+            n_cycles += 1
+            continue
+        # The sprite stays on the screen
+        value = rng.randint(-x_register, WIDTH_SCREEN - 1 - x_register)
+        if value == 0:
+            value = 1 if x_register < WIDTH_SCREEN - 1 else -1
+        x_register += value
+        input_lines.append("addx {}".format(value))
+        n_cycles += 2
+    return input_lines
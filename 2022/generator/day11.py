@@ -0,0 +1,51 @@
+import random
+from typing import List
+
+
+# Size of an actual input
+N_MONKEYS = 8
+
+
+def get_primes(n_primes: int) -> List[int]:
+    primes: List[int] = []
+    candidate = 2
+    while len(primes) < n_primes:
+        if all(candidate % prime != 0 for prime in primes):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    n_monkeys = max(2, round(N_MONKEYS * scale))
+    div_test_values = rng.sample(get_primes(n_monkeys), n_monkeys)
+    # A single monkey squares the worry level
+    squaring_monkey = rng.randrange(n_monkeys)
+
+    input_lines: List[str] = []
+    for monkey_idx, div_test_value in enumerate(div_test_values):
+        if monkey_idx == squaring_monkey:
+            operation = "* old"
+        elif rng.random() < 0.3:
+            operation = "* {}".format(rng.randint(2, 19))
+        else:
+            operation = "+ {}".format(rng.randint(1, 8))
+        true_monkey, false_monkey = (
+            rng.sample([idx for idx in range(n_monkeys) if idx != monkey_idx], 2)
+            if n_monkeys > 2
+            else (1 - monkey_idx, 1 - monkey_idx)
+        )
+        items = [rng.randint(50, 99) for _ in range(rng.randint(1, 8))]
+        input_lines.extend(
+            [
+                "Monkey {}:".format(monkey_idx),
+                "  Starting items: {}".format(", ".join(str(item) for item in items)),
+                "  Operation: new = old {}".format(operation),
+                "  Test: divisible by {}".format(div_test_value),
+                "    If true: throw to monkey {}".format(true_monkey),
+                "    If false: throw to monkey {}".format(false_monkey),
+                "",
+            ]
+        )
+    input_lines.pop()
+    return input_lines
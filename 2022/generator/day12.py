@@ -0,0 +1,57 @@
+import random
+import string
+from typing import Dict, List, Tuple
+
+
+# Size of an actual input
+N_ROWS, N_COLUMNS = 41, 160
+
+Coord = Tuple[int, int]
+
+
+def generate(
+    rng: random.Random, scale: float = 1.0, start_char: str = "S", end_char: str = "E"
+) -> List[str]:
+    n_rows = max(2, round(N_ROWS * scale))
+    start: Coord = (rng.randrange(n_rows), 0)
+
+    # Random depth-first exploration of the map, from the start
+    depths: Dict[Coord, int] = {start: 0}
+    open_coords: List[Coord] = [start]
+    while open_coords:
+        i, j = open_coords[-1]
+        next_coords = [
+            (next_i, next_j)
+            for next_i, next_j in ((i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1))
+            if (0 <= next_i < n_rows)
+            and (0 <= next_j < N_COLUMNS)
+            and ((next_i, next_j) not in depths)
+        ]
+        if not next_coords:
+            open_coords.pop()
+            continue
+        next_coord = rng.choice(next_coords)
+        depths[next_coord] = depths[(i, j)] + 1
+        open_coords.append(next_coord)
+
+    # The elevation increases by at most 1 along the exploration paths:
+    # the end is always reachable from the start
+    elevations = string.ascii_lowercase
+    depth_step = max(1, max(depths.values()) // (2 * len(elevations)))
+    height_map = [
+        [
+            elevations[min(depths[(i, j)] // depth_step, len(elevations) - 1)]
+            for j in range(N_COLUMNS)
+        ]
+        for i in range(n_rows)
+    ]
+    end = rng.choice(
+        [
+            coord
+            for coord, depth in depths.items()
+            if depth // depth_step == len(elevations) - 1
+        ]
+    )
+    height_map[start[0]][start[1]] = start_char
+    height_map[end[0]][end[1]] = end_char
+    return ["".join(row) for row in height_map]
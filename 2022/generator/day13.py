@@ -0,0 +1,39 @@
+import json
+import random
+from typing import List, Union
+
+
+# Size of an actual input
+N_PAIRS = 150
+MAX_DEPTH = 4
+
+Packet = List[Union[int, "Packet"]]
+
+
+def generate_packet(rng: random.Random, depth: int = 1) -> Packet:
+    return [
+        generate_packet(rng, depth + 1)
+        if (depth < MAX_DEPTH) and (rng.random() < 0.3)
+        else rng.randint(0, 10)
+        for _ in range(rng.randint(0, 5))
+    ]
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    input_lines: List[str] = []
+    for _ in range(max(1, round(N_PAIRS * scale))):
+        left_packet = generate_packet(rng)
+        # Pairs often share their first values
+        right_packet = generate_packet(rng)
+        right_packet[: rng.randint(0, len(left_packet))] = left_packet[
+            : rng.randint(0, len(left_packet))
+        ]
+        input_lines.extend(
+            [
+                json.dumps(left_packet, separators=(",", ":")),
+                json.dumps(right_packet, separators=(",", ":")),
+                "",
+            ]
+        )
+    input_lines.pop()
+    return input_lines
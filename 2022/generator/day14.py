@@ -0,0 +1,42 @@
+import random
+from typing import List, Tuple
+
+
+# Size of an actual input
+N_PATHS = 40
+CAVE_WIDTH, CAVE_DEPTH = 80, 170
+# The rocks are below the source of the sand
+MIN_Y = 13
+
+
+def clip_x(x_coord: int, y_coord: int, sand_x: int) -> int:
+    # The rocks are inside the pile of sand of the second part: the simulation stops
+    # with the sand falling off the sides of the pile
+    return min(max(x_coord, sand_x - y_coord + 1), sand_x + y_coord - 1)
+
+
+def generate(rng: random.Random, scale: float = 1.0, sand_x: int = 500) -> List[str]:
+    # The area of the cave grows linearly with the scale
+    width = max(10, round(CAVE_WIDTH * scale**0.5))
+    depth = max(10, round(CAVE_DEPTH * scale**0.5))
+
+    input_lines: List[str] = []
+    for _ in range(max(1, round(N_PATHS * scale))):
+        y_coord = rng.randint(MIN_Y, MIN_Y + depth)
+        x_coord = clip_x(
+            rng.randint(sand_x - width // 2, sand_x + width // 2), y_coord, sand_x
+        )
+        path: List[Tuple[int, int]] = [(x_coord, y_coord)]
+        is_horizontal = rng.random() < 0.5
+        for _ in range(rng.randint(1, 5)):
+            length = rng.randint(1, 8) * rng.choice([-1, 1])
+            if is_horizontal:
+                x_coord = clip_x(x_coord + length, y_coord, sand_x)
+            else:
+                y_coord = max(MIN_Y, abs(x_coord - sand_x) + 1, y_coord + length)
+            if (x_coord, y_coord) != path[-1]:
+                path.append((x_coord, y_coord))
+                is_horizontal = not is_horizontal
+        if len(path) > 1:
+            input_lines.append(" -> ".join("{},{}".format(*point) for point in path))
+    return input_lines
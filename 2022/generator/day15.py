@@ -0,0 +1,64 @@
+import random
+from typing import List, Tuple
+
+
+# Size of an actual input
+N_SENSORS = 25
+# Search area of the distress beacon
+MAX_COORD = 4000000
+
+Coord = Tuple[int, int]
+
+
+def compute_manhattan_dist(coord_1: Coord, coord_2: Coord) -> int:
+    return abs(coord_1[0] - coord_2[0]) + abs(coord_1[1] - coord_2[1])
+
+
+def format_sensor(sensor_coord: Coord, radius: int) -> str:
+    # The closest beacon lies on the border of the sensor's coverage
+    beacon_coord = (sensor_coord[0] + radius, sensor_coord[1])
+    return "Sensor at x={}, y={}: closest beacon is at x={}, y={}".format(
+        *sensor_coord, *beacon_coord
+    )
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    distress_coord = (rng.randint(1, MAX_COORD - 1), rng.randint(1, MAX_COORD - 1))
+
+    # Grid of sensors covering the search area, with some jitter
+    grid_size = max(4, round((N_SENSORS * scale) ** 0.5))
+    spacing = -(-MAX_COORD // (grid_size - 3))
+    jitter = spacing // 10
+    sensors: List[Tuple[Coord, int]] = []
+    for i in range(grid_size):
+        for j in range(grid_size):
+            sensor_coord = (
+                -spacing + i * spacing + rng.randint(-jitter, jitter),
+                -spacing + j * spacing + rng.randint(-jitter, jitter),
+            )
+            radius = spacing + 2 * jitter + rng.randint(0, jitter)
+            # The sensors do not detect the distress beacon
+            if compute_manhattan_dist(sensor_coord, distress_coord) > radius:
+                sensors.append((sensor_coord, radius))
+
+    # The four diagonal neighbors of the distress beacon cover the holes left by the
+    # removed sensors, and only leave the distress beacon uncovered
+    offset = 2 * (spacing + 3 * jitter)
+    for x_sign in [-1, 1]:
+        for y_sign in [-1, 1]:
+            sensor_coord = (
+                distress_coord[0] + x_sign * offset,
+                distress_coord[1] + y_sign * offset,
+            )
+            sensors.append((sensor_coord, 2 * offset - 1))
+
+    # Pair of sensors outside the search area whose coverages stop overlapping at the row
+    # of the distress beacon: the solver cannot skip over that row
+    pair_radius = 2 * MAX_COORD
+    separation = 2 * pair_radius - 2 * distress_coord[1] - 1
+    sensor_x = -3 * pair_radius - 1
+    sensors.append(((sensor_x, -1), pair_radius))
+    sensors.append(((sensor_x + separation, -1), pair_radius))
+
+    rng.shuffle(sensors)
+    return [format_sensor(sensor_coord, radius) for sensor_coord, radius in sensors]
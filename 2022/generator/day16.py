@@ -0,0 +1,57 @@
+import itertools
+import random
+import string
+from typing import Dict, List, Set
+
+
+# Size of an actual input
+N_VALVES = 60
+# The search over the order of the valves to open is exponential in their number:
+# their number does not grow with the scale
+N_OPENABLE_VALVES = 15
+
+
+def format_valve(valve: str, flow_rate: int, neighbor_valves: List[str]) -> str:
+    if len(neighbor_valves) == 1:
+        return "Valve {} has flow rate={}; tunnel leads to valve {}".format(
+            valve, flow_rate, neighbor_valves[0]
+        )
+    return "Valve {} has flow rate={}; tunnels lead to valves {}".format(
+        valve, flow_rate, ", ".join(neighbor_valves)
+    )
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    all_valves = [
+        "".join(letters)
+        for letters in itertools.product(string.ascii_uppercase, repeat=2)
+        if letters != ("A", "A")
+    ]
+    n_valves = min(
+        len(all_valves) + 1,
+        max(N_OPENABLE_VALVES + 1, round(N_VALVES * scale)),
+    )
+    valves = ["AA"] + rng.sample(all_valves, n_valves - 1)
+
+    # Random spanning tree of long corridors so that all the valves can be reached,
+    # plus a few loops
+    tunnels: Dict[str, Set[str]] = {valve: set() for valve in valves}
+    for i, valve in enumerate(valves[1:], 1):
+        other_valve = valves[rng.randrange(max(0, i - 3), i)]
+        tunnels[valve].add(other_valve)
+        tunnels[other_valve].add(valve)
+    for _ in range(n_valves // 10):
+        valve, other_valve = rng.sample(valves, 2)
+        tunnels[valve].add(other_valve)
+        tunnels[other_valve].add(valve)
+
+    # The start valve is always broken
+    flow_rates = {valve: 0 for valve in valves}
+    for valve in rng.sample(valves[1:], N_OPENABLE_VALVES):
+        flow_rates[valve] = rng.randint(3, 25)
+
+    rng.shuffle(valves)
+    return [
+        format_valve(valve, flow_rates[valve], sorted(tunnels[valve]))
+        for valve in valves
+    ]
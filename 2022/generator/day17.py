@@ -0,0 +1,12 @@
+import random
+from typing import List
+
+
+# Size of an actual input
+N_JETS = 10091
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    # The jets push slightly more often to the right
+    n_jets = max(1, round(N_JETS * scale))
+    return ["".join(rng.choices("<>", weights=[45, 55], k=n_jets))]
@@ -0,0 +1,30 @@
+import random
+from typing import List
+
+
+# Size of an actual input
+DROPLET_RADIUS = 10
+DENSITY = 0.65
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    # The volume of the droplet grows linearly with the scale
+    radius = max(1.0, DROPLET_RADIUS * scale ** (1 / 3))
+    center = round(radius) + 1
+
+    input_lines: List[str] = []
+    for x_coord in range(2 * center + 1):
+        for y_coord in range(2 * center + 1):
+            for z_coord in range(2 * center + 1):
+                dist = (
+                    (x_coord - center) ** 2
+                    + (y_coord - center) ** 2
+                    + (z_coord - center) ** 2
+                ) ** 0.5
+                # Denser at the core of the droplet, with pockets of air inside
+                if dist <= radius and rng.random() < DENSITY + 0.3 * (
+                    1 - dist / radius
+                ):
+                    input_lines.append(f"{x_coord},{y_coord},{z_coord}")
+    rng.shuffle(input_lines)
+    return input_lines
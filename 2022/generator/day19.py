@@ -0,0 +1,19 @@
+import random
+from typing import List
+
+
+# Size of an actual input
+N_BLUEPRINTS = 30
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    # At least 3 blueprints are checked in the second part
+    n_blueprints = max(3, round(N_BLUEPRINTS * scale))
+    return [
+        f"Blueprint {blueprint_id}: "
+        f"Each ore robot costs {rng.randint(2, 4)} ore. "
+        f"Each clay robot costs {rng.randint(2, 4)} ore. "
+        f"Each obsidian robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} clay. "
+        f"Each geode robot costs {rng.randint(2, 4)} ore and {rng.randint(7, 20)} obsidian."
+        for blueprint_id in range(1, n_blueprints + 1)
+    ]
@@ -0,0 +1,13 @@
+import random
+from typing import List
+
+
+# Size of an actual input
+N_ROUNDS = 2500
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    return [
+        "{} {}".format(rng.choice("ABC"), rng.choice("XYZ"))
+        for _ in range(max(1, round(N_ROUNDS * scale)))
+    ]
@@ -0,0 +1,17 @@
+import random
+from typing import List
+
+
+# Size of an actual input
+N_NUMBERS = 5000
+MAX_NUMBER = 10000
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    # Exactly one zero, from which the grove coordinates are found
+    n_numbers = max(2, round(N_NUMBERS * scale))
+    numbers = [
+        rng.choice([-1, 1]) * rng.randint(1, MAX_NUMBER) for _ in range(n_numbers - 1)
+    ]
+    numbers.insert(rng.randrange(n_numbers), 0)
+    return [str(number) for number in numbers]
@@ -0,0 +1,150 @@
+import itertools
+import random
+import string
+from typing import Dict, List, Tuple
+
+
+# Size of an actual input
+N_MONKEYS = 2200
+# Number of operations between your number and the root monkey
+HUMN_DEPTH = 70
+# All the numbers stay exactly representable as floats
+MAX_NUMBER = 2**50
+
+
+def get_monkey_names(rng: random.Random) -> List[str]:
+    monkeys = [
+        "".join(letters)
+        for letters in itertools.product(string.ascii_lowercase, repeat=4)
+        if "".join(letters) not in ("root", "humn")
+    ]
+    rng.shuffle(monkeys)
+    return monkeys
+
+
+def split_size(rng: random.Random, n_monkeys: int) -> Tuple[int, int]:
+    # Split the monkeys of a subtree between its two child subtrees, keeping odd sizes
+    n_left = 2 * rng.randint(0, (n_monkeys - 3) // 2) + 1
+    return n_left, n_monkeys - 1 - n_left
+
+
+def generate_subtree(
+    rng: random.Random,
+    value: int,
+    n_monkeys: int,
+    monkey_jobs: Dict[str, str],
+    monkey_names: List[str],
+) -> str:
+    """Generate a subtree of n_monkeys monkeys yelling value at its root."""
+    monkey = monkey_names.pop()
+    if n_monkeys < 3:
+        monkey_jobs[monkey] = str(value)
+        return monkey
+
+    divisors = [divisor for divisor in range(2, 11) if value % divisor == 0]
+    operations = ["-"]
+    if value >= 2:
+        operations.append("+")
+    if divisors:
+        operations.append("*")
+    if value < MAX_NUMBER // 10:
+        operations.append("/")
+    operation = rng.choice(operations)
+
+    if operation == "+":
+        child_value_1 = rng.randint(1, value - 1)
+        child_value_2 = value - child_value_1
+    elif operation == "-":
+        child_value_2 = rng.randint(1, 20)
+        child_value_1 = value + child_value_2
+    elif operation == "*":
+        child_value_2 = rng.choice(divisors)
+        child_value_1 = value // child_value_2
+    else:
+        child_value_2 = rng.randint(2, 5)
+        child_value_1 = value * child_value_2
+
+    n_left, n_right = split_size(rng, n_monkeys)
+    child_monkey_1 = generate_subtree(
+        rng, child_value_1, n_left, monkey_jobs, monkey_names
+    )
+    child_monkey_2 = generate_subtree(
+        rng, child_value_2, n_right, monkey_jobs, monkey_names
+    )
+    monkey_jobs[monkey] = f"{child_monkey_1} {operation} {child_monkey_2}"
+    return monkey
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    monkey_names = get_monkey_names(rng)
+    monkey_jobs: Dict[str, str] = {}
+
+    humn_depth = max(1, round(HUMN_DEPTH * scale**0.5))
+    n_monkeys = max(4 * humn_depth + 3, round(N_MONKEYS * scale))
+    # Monkeys in each subtree hanging from the path between you and the root monkey
+    n_subtree_monkeys = (
+        2 * ((n_monkeys - 2 * humn_depth - 2) // (2 * (humn_depth + 1))) + 1
+    )
+
+    # Your numbers for the first and second parts
+    humn_values = [rng.randint(1, 5000), rng.randint(10**10, 10**12)]
+    monkey_jobs["humn"] = str(humn_values[0])
+
+    # Operations on the path from you to the root monkey, valid for both your numbers
+    monkey = "humn"
+    for _ in range(humn_depth):
+        operations = ["+"]
+        if max(humn_values) < MAX_NUMBER // 10:
+            operations.append("*")
+        if min(humn_values) > 1:
+            operations.append("-")
+        # Your number is never in a divisor, and the divisions are exact for both of them
+        divisors = [
+            divisor
+            for divisor in range(2, 11)
+            if all(humn_value % divisor == 0 for humn_value in humn_values)
+        ]
+        if divisors:
+            operations.append("/")
+        operation = rng.choice(operations)
+
+        is_left = True
+        if operation == "+":
+            other_value = rng.randint(1, 1000)
+            humn_values = [humn_value + other_value for humn_value in humn_values]
+            is_left = rng.random() < 0.5
+        elif operation == "*":
+            other_value = rng.randint(2, 10)
+            humn_values = [humn_value * other_value for humn_value in humn_values]
+            is_left = rng.random() < 0.5
+        elif operation == "-":
+            other_value = rng.randint(1, min(humn_values) - 1)
+            humn_values = [humn_value - other_value for humn_value in humn_values]
+        else:
+            other_value = rng.choice(divisors)
+            humn_values = [humn_value // other_value for humn_value in humn_values]
+
+        other_monkey = generate_subtree(
+            rng, other_value, n_subtree_monkeys, monkey_jobs, monkey_names
+        )
+        parent_monkey = monkey_names.pop()
+        if is_left:
+            monkey_jobs[parent_monkey] = f"{monkey} {operation} {other_monkey}"
+        else:
+            monkey_jobs[parent_monkey] = f"{other_monkey} {operation} {monkey}"
+        monkey = parent_monkey
+
+    # The root monkey checks the equality in the second part
+    other_monkey = generate_subtree(
+        rng, humn_values[1], n_subtree_monkeys, monkey_jobs, monkey_names
+    )
+    if rng.random() < 0.5:
+        monkey_jobs["root"] = f"{monkey} + {other_monkey}"
+    else:
+        monkey_jobs["root"] = f"{other_monkey} + {monkey}"
+
+    input_lines = [
+        f"{monkey}: {monkey_job}" for monkey, monkey_job in monkey_jobs.items()
+    ]
+    rng.shuffle(input_lines)
+    return input_lines
@@ -0,0 +1,42 @@
+import random
+from typing import List
+
+
+# The solver hard-codes the folding of the cube of an actual input:
+# the shape of its net does not grow with the scale
+EDGE_LENGTH = 50
+# (row_idx, col_idx) of the faces of the net, in units of edges
+FACES = [(0, 1), (0, 2), (1, 1), (2, 0), (2, 1), (3, 0)]
+WALL_RATE = 0.1
+
+# Size of an actual input
+N_MOVES = 2000
+MAX_STEPS = 50
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    n_rows = 1 + max(row_idx for row_idx, _col_idx in FACES)
+    n_cols = 1 + max(col_idx for _row_idx, col_idx in FACES)
+    input_lines: List[str] = []
+    for row_idx in range(n_rows * EDGE_LENGTH):
+        row = ""
+        for col_idx in range(n_cols * EDGE_LENGTH):
+            if (row_idx // EDGE_LENGTH, col_idx // EDGE_LENGTH) not in FACES:
+                row += " "
+            elif rng.random() < WALL_RATE:
+                row += "#"
+            else:
+                row += "."
+        input_lines.append(row.rstrip())
+    # The first tile is open
+    first_col_idx = input_lines[0].index(input_lines[0].strip())
+    input_lines[0] = (
+        input_lines[0][:first_col_idx] + "." + input_lines[0][first_col_idx + 1 :]
+    )
+
+    n_moves = max(1, round(N_MOVES * scale))
+    path = str(rng.randint(1, MAX_STEPS))
+    for _ in range(n_moves - 1):
+        path += rng.choice("LR") + str(rng.randint(1, MAX_STEPS))
+
+    return input_lines + ["", path]
@@ -0,0 +1,16 @@
+import random
+from typing import List
+
+
+# Size of an actual input
+GRID_SIZE = 72
+ELF_RATE = 0.5
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    # The area of the grove grows linearly with the scale
+    grid_size = max(2, round(GRID_SIZE * scale**0.5))
+    return [
+        "".join("#" if rng.random() < ELF_RATE else "." for _ in range(grid_size))
+        for _ in range(grid_size)
+    ]
@@ -0,0 +1,24 @@
+import random
+from typing import List
+
+
+# Size of an actual input
+N_ROWS, N_COLS = 25, 120
+BLIZZARD_RATE = 0.7
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    # The area of the valley grows linearly with the scale
+    n_rows = max(2, round(N_ROWS * scale**0.5))
+    n_cols = max(2, round(N_COLS * scale**0.5))
+
+    input_lines: List[str] = ["#." + "#" * n_cols]
+    for _ in range(n_rows):
+        row = ""
+        for col_idx in range(n_cols):
+            # No vertical blizzard would let the expedition leave the valley
+            blizzards = "<>" if col_idx in (0, n_cols - 1) else "^v<>"
+            row += rng.choice(blizzards) if rng.random() < BLIZZARD_RATE else "."
+        input_lines.append("#" + row + "#")
+    input_lines.append("#" * n_cols + ".#")
+    return input_lines
@@ -0,0 +1,16 @@
+import random
+from typing import List
+
+
+# Size of an actual input
+N_NUMBERS = 120
+MAX_N_DIGITS = 20
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    # The leading digit is positive: so are the numbers
+    return [
+        rng.choice("12")
+        + "".join(rng.choices("=-012", k=rng.randint(0, MAX_N_DIGITS - 1)))
+        for _ in range(max(1, round(N_NUMBERS * scale)))
+    ]
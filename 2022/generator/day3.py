@@ -0,0 +1,66 @@
+import random
+import string
+from typing import Dict, List
+
+
+# Size of an actual input
+N_GROUPS = 100
+GROUP_SIZE = 3
+
+
+def generate_compartment(
+    rng: random.Random,
+    item_types: List[str],
+    required_item_types: List[str],
+    n_items: int,
+) -> List[str]:
+    compartment = required_item_types + [
+        rng.choice(item_types) for _ in range(n_items - len(required_item_types))
+    ]
+    rng.shuffle(compartment)
+    return compartment
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    input_lines: List[str] = []
+    for _ in range(max(1, round(N_GROUPS * scale))):
+        badge, *item_types = rng.sample(string.ascii_letters, len(string.ascii_letters))
+        # Each other item type is in the rucksacks of at most 2 elves of the group:
+        # the badge is the only item type common to the whole group
+        elves_item_types: Dict[int, List[str]] = {
+            elf_idx: [] for elf_idx in range(GROUP_SIZE)
+        }
+        for item_type in item_types:
+            for elf_idx in rng.sample(
+                range(GROUP_SIZE), rng.randint(1, GROUP_SIZE - 1)
+            ):
+                elves_item_types[elf_idx].append(item_type)
+
+        for elf_item_types in elves_item_types.values():
+            # The common item type is the only one in both compartments
+            common_item_type, *other_item_types = rng.sample(
+                elf_item_types, len(elf_item_types)
+            )
+            split_idx = len(other_item_types) // 2
+            compartments_item_types = [
+                other_item_types[:split_idx] + [common_item_type],
+                other_item_types[split_idx:] + [common_item_type],
+            ]
+            compartments_required_item_types = [[common_item_type], [common_item_type]]
+            badge_compartment_idx = rng.randrange(2)
+            compartments_item_types[badge_compartment_idx].append(badge)
+            compartments_required_item_types[badge_compartment_idx].append(badge)
+
+            n_items = rng.randint(8, 16)
+            input_lines.append(
+                "".join(
+                    item
+                    for item_types, required_item_types in zip(
+                        compartments_item_types, compartments_required_item_types
+                    )
+                    for item in generate_compartment(
+                        rng, item_types, required_item_types, n_items
+                    )
+                )
+            )
+    return input_lines
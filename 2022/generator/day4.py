@@ -0,0 +1,19 @@
+import random
+from typing import List
+
+
+# Size of an actual input
+N_PAIRS = 1000
+MAX_SECTION = 99
+
+
+def generate_range(rng: random.Random) -> str:
+    start = rng.randint(1, MAX_SECTION)
+    return "{}-{}".format(start, rng.randint(start, MAX_SECTION))
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    return [
+        "{},{}".format(generate_range(rng), generate_range(rng))
+        for _ in range(max(1, round(N_PAIRS * scale)))
+    ]
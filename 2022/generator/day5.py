@@ -0,0 +1,45 @@
+import random
+import string
+from typing import List
+
+
+# Size of an actual input
+N_MOVES = 500
+N_STACKS = 9
+MAX_INITIAL_HEIGHT = 8
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    stacks = [
+        [
+            rng.choice(string.ascii_uppercase)
+            for _ in range(rng.randint(1, MAX_INITIAL_HEIGHT))
+        ]
+        for _ in range(N_STACKS)
+    ]
+
+    # Drawing of the stacks of crates, from the top
+    input_lines: List[str] = []
+    for height in range(max(map(len, stacks)), 0, -1):
+        input_lines.append(
+            " ".join(
+                "[{}]".format(stack[height - 1]) if len(stack) >= height else "   "
+                for stack in stacks
+            )
+        )
+    input_lines.append(" ".join(" {} ".format(i + 1) for i in range(N_STACKS)))
+    input_lines.append("")
+
+    # The moves never empty a stack
+    for _ in range(max(1, round(N_MOVES * scale))):
+        start_idx = rng.choice(
+            [idx for idx, stack in enumerate(stacks) if len(stack) > 1]
+        )
+        end_idx = rng.choice([idx for idx in range(N_STACKS) if idx != start_idx])
+        num_crates = rng.randint(1, len(stacks[start_idx]) - 1)
+        stacks[end_idx].extend(stacks[start_idx][-num_crates:])
+        del stacks[start_idx][-num_crates:]
+        input_lines.append(
+            "move {} from {} to {}".format(num_crates, start_idx + 1, end_idx + 1)
+        )
+    return input_lines
@@ -0,0 +1,24 @@
+import random
+import string
+from typing import List
+
+
+# Size of an actual input
+STREAM_LEN = 4096
+START_OF_PACKET_LEN, START_OF_MESSAGE_LEN = 4, 14
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    stream_len = max(4 * START_OF_MESSAGE_LEN, round(STREAM_LEN * scale))
+    # Windows over too few distinct characters cannot be markers:
+    # the markers are found after about 10% and 50% of the stream
+    alphabet = rng.sample(string.ascii_lowercase, len(string.ascii_lowercase))
+    stream = [
+        rng.choice(alphabet[: START_OF_PACKET_LEN - 1]) for _ in range(stream_len // 10)
+    ]
+    stream.extend(
+        rng.choice(alphabet[: START_OF_MESSAGE_LEN - 1])
+        for _ in range(stream_len // 2 - len(stream))
+    )
+    stream.extend(rng.choice(alphabet) for _ in range(stream_len - len(stream)))
+    return ["".join(stream)]
@@ -0,0 +1,72 @@
+import random
+import string
+from typing import Dict, List, Tuple
+
+
+# Size of an actual input
+N_DIRECTORIES, N_FILES = 180, 300
+# Disk space used by the files, to free up at least 30000000 out of 70000000
+MIN_USED_SPACE, MAX_USED_SPACE = 42000000, 48000000
+
+EXTENSIONS = ["", ".dat", ".log", ".txt", ".bin"]
+
+
+def generate_name(
+    rng: random.Random, taken_names: List[str], extension: str = ""
+) -> str:
+    while True:
+        name = (
+            "".join(
+                rng.choice(string.ascii_lowercase) for _ in range(rng.randint(1, 8))
+            )
+            + extension
+        )
+        if name not in taken_names:
+            return name
+
+
+def list_directory(
+    path: str,
+    directories: Dict[str, List[str]],
+    files: Dict[str, List[Tuple[str, int]]],
+) -> List[str]:
+    terminal_outputs = ["$ ls"]
+    terminal_outputs.extend("dir {}".format(name) for name in directories[path])
+    terminal_outputs.extend("{} {}".format(size, name) for name, size in files[path])
+    for name in directories[path]:
+        terminal_outputs.append("$ cd {}".format(name))
+        terminal_outputs.extend(list_directory(path + name + "/", directories, files))
+        terminal_outputs.append("$ cd ..")
+    return terminal_outputs
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    directories: Dict[str, List[str]] = {"/": []}
+    files: Dict[str, List[Tuple[str, int]]] = {"/": []}
+    paths = ["/"]
+    for _ in range(round(N_DIRECTORIES * scale)):
+        parent_path = rng.choice(paths)
+        name = generate_name(
+            rng, directories[parent_path] + [name for name, _ in files[parent_path]]
+        )
+        directories[parent_path].append(name)
+        paths.append(parent_path + name + "/")
+        directories[paths[-1]], files[paths[-1]] = [], []
+
+    sizes = [rng.randint(1, 300000) for _ in range(max(1, round(N_FILES * scale)))]
+    # The total size of the files is in the bounds, whatever the number of files
+    used_space = rng.randint(MIN_USED_SPACE, MAX_USED_SPACE)
+    for size in sizes:
+        parent_path = rng.choice(paths)
+        name = generate_name(
+            rng,
+            directories[parent_path] + [name for name, _ in files[parent_path]],
+            extension=rng.choice(EXTENSIONS),
+        )
+        files[parent_path].append((name, max(1, size * used_space // sum(sizes))))
+
+    # Remark: the last 'cd ..' commands are not needed
+    terminal_outputs = ["$ cd /"] + list_directory("/", directories, files)
+    while terminal_outputs[-1] == "$ cd ..":
+        terminal_outputs.pop()
+    return terminal_outputs
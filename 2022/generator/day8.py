@@ -0,0 +1,16 @@
+import random
+from typing import List
+
+
+# Size of an actual input
+GRID_SIZE = 99
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    # The forest is square (as assumed by the solver): its area grows linearly
+    # with the scale
+    grid_size = max(1, round(GRID_SIZE * scale**0.5))
+    return [
+        "".join(str(rng.randint(0, 9)) for _ in range(grid_size))
+        for _ in range(grid_size)
+    ]
@@ -0,0 +1,13 @@
+import random
+from typing import List
+
+
+# Size of an actual input
+N_MOTIONS = 2000
+
+
+def generate(rng: random.Random, scale: float = 1.0) -> List[str]:
+    return [
+        "{} {}".format(rng.choice("RLUD"), rng.randint(1, 20))
+        for _ in range(max(1, round(N_MOTIONS * scale)))
+    ]
@@ -1,26 +1,30 @@
-from typing import List, Tuple
+import heapq
+import itertools
+from typing import Iterable, List, Tuple
 
 
-def main(input_lines: List[str], top_k: int = 3) -> Tuple[int, int]:
-    input_lines.append("")
-    calories_elves: List[List[int]] = [[]]
-    for line in input_lines:
-        if len(line) == 0:
-            calories_elves.append([])
-            continue
-        calories_elves[-1].append(int(line))
+INPUT_MODE: str = "stream"
 
-    part1_answer: int = find_most_calories_elve(calories_elves)
-    part2_answer: int = sum(find_most_calories_elves(calories_elves, top_k))
-    return part1_answer, part2_answer
 
+def main(input_lines: Iterable[str], top_k: int = 3) -> Tuple[int, int]:
+    top_calories_elves: List[int] = find_most_calories_elves(input_lines, top_k)
 
-def find_most_calories_elve(calories_elves: List[List[int]]) -> int:
-    # For the reason behind this ignore, see: https://github.com/python/mypy/issues/6811
-    return max(map(sum, calories_elves))  # type: ignore
+    part1_answer: int = max(top_calories_elves)
+    part2_answer: int = sum(top_calories_elves)
+    return part1_answer, part2_answer
 
 
-def find_most_calories_elves(calories_elves: List[List[int]], top_k: int) -> List[int]:
-    total_calories_elves: List[int] = list(map(sum, calories_elves))  # type: ignore
-    total_calories_elves.sort()
-    return total_calories_elves[-top_k:]
+def find_most_calories_elves(input_lines: Iterable[str], top_k: int) -> List[int]:
+    # Min-heap of the 'top_k' most calories carried by an elf so far
+    top_calories_elves: List[int] = []
+    calories_elve: int = 0
+    for line in itertools.chain(input_lines, [""]):
+        if len(line) > 0:
+            calories_elve += int(line)
+            continue
+        if len(top_calories_elves) < top_k:
+            heapq.heappush(top_calories_elves, calories_elve)
+        else:
+            heapq.heappushpop(top_calories_elves, calories_elve)
+        calories_elve = 0
+    return top_calories_elves
@@ -1,54 +1,89 @@
-import heapq
-from typing import Dict, List, Tuple
+import functools
+from typing import Callable, cast, Dict, Iterator, List, Tuple
 
 import numpy as np
 import numpy.typing as npt
 
+from common.grid import Buffer, read_grid
+from common.search import a_star, bfs, dial
+
 
 Coord = Tuple[int, int]
 Map = npt.NDArray[np.int64]
 
 
-def main(input_lines: List[str]) -> Tuple[int, int]:
+INPUT_MODE: str = "mmap"
+
+
+def main(input_bytes: Buffer) -> Tuple[int, int]:
     height_map: Map
     end: Coord
     start: Coord
     potential_starts: List[Coord]
-    height_map, end, start, potential_starts = parse_height_map(input_lines)
+    height_map, end, start, potential_starts = parse_height_map(input_bytes)
 
-    # part1_answer: int = a_star(height_map, start, end)
-
-    dists_from_start_to_end: Dict[Coord, int] = dijkstra(
-        height_map, potential_starts, end
+    # Reformulated as: how to get from end to start? (see 'find_dists_to_end')
+    dists_to_end: Dict[Coord, int] = find_dists_to_end(height_map, end)
+    part1_answer: int = dists_to_end[start]
+    part2_answer: int = min(
+        dists_to_end[point] for point in potential_starts if point in dists_to_end
     )
-    part1_answer: int = dists_from_start_to_end[start]
-    part2_answer: int = min(dists_from_start_to_end.values())
 
     return part1_answer, part2_answer
 
 
+def find_part1_dist_with_dijkstra(input_bytes: Buffer) -> int:
+    height_map, end, start, _ = parse_height_map(input_bytes)
+    result = dial(
+        [start],
+        lambda point: ((1, neigh) for neigh in get_moves(height_map, point)),
+        max_cost=1,
+        is_goal=end.__eq__,
+    )
+    return cast(int, result.goal_distance)
+
+
+def find_part1_dist_with_a_star(input_bytes: Buffer) -> int:
+    height_map, end, start, _ = parse_height_map(input_bytes)
+    result = a_star(
+        [start],
+        lambda point: ((1, neigh) for neigh in get_moves(height_map, point)),
+        is_goal=end.__eq__,
+        heuristic=functools.partial(min_dist_to_end, end=end, height_map=height_map),
+    )
+    return cast(int, result.goal_distance)
+
+
+def find_part1_dist_with_bfs(input_bytes: Buffer) -> int:
+    height_map, end, start, _ = parse_height_map(input_bytes)
+    result = bfs(
+        [start],
+        functools.partial(get_moves, height_map),
+        is_goal=end.__eq__,
+    )
+    return cast(int, result.goal_distance)
+
+
 def parse_height_map(
-    input_lines: List[str], start_char: str = "S", end_char: str = "E"
+    input_bytes: Buffer, start_char: str = "S", end_char: str = "E"
 ) -> Tuple[Map, Coord, Coord, List[Coord]]:
-    height_map: Map = np.full(
-        (len(input_lines), len(input_lines[0])), -1, dtype=np.int64
-    )
+    grid = read_grid(input_bytes)
+    is_start = grid == ord(start_char)
+    is_end = grid == ord(end_char)
+
+    height_map: Map = grid.astype(np.int64) - ord("a")
+    height_map[is_start] = 0
+    height_map[is_end] = ord("z") - ord("a")
+
     start: Coord = (-1, -1)
-    potential_starts: List[Coord] = []
+    if np.any(is_start):
+        start = cast(Coord, tuple(np.argwhere(is_start)[-1].tolist()))
     end: Coord = (-1, -1)
-
-    for i, input_line in enumerate(input_lines):
-        for j, char in enumerate(input_line):
-            if char == start_char:
-                start = (i, j)
-                potential_starts.append(start)
-                char = "a"
-            elif char == end_char:
-                end = (i, j)
-                char = "z"
-            elif char == "a":
-                potential_starts.append((i, j))
-            height_map[i, j] = ord(char) - ord("a")
+    if np.any(is_end):
+        end = cast(Coord, tuple(np.argwhere(is_end)[-1].tolist()))
+    potential_starts: List[Coord] = [
+        cast(Coord, tuple(coord)) for coord in np.argwhere(height_map == 0).tolist()
+    ]
 
     return height_map, end, start, potential_starts
 
@@ -69,104 +104,47 @@ def get_neighs(height_map: Map, point: Coord) -> List[Coord]:
 # pylint: enable=invalid-name
 
 
-def dijkstra(height_map: Map, starts: List[Coord], end: Coord) -> Dict[Coord, int]:
+def get_moves(height_map: Map, point: Coord, reverse: bool = False) -> Iterator[Coord]:
+    """Neighbors reachable in a single move from the point.
+
+    Can climb at most 1 step per move (but go down as many steps as wanted).
+    When 'reverse', the moves are the ones leading to the point instead.
+    """
+    height = height_map[point[0], point[1]]
+    for neigh in get_neighs(height_map, point):
+        climb = height_map[neigh[0], neigh[1]] - height
+        if (-climb if reverse else climb) <= 1:
+            yield neigh
+
+
+def find_dists_to_end(height_map: Map, end: Coord) -> Dict[Coord, int]:
     """Reformulate the problem as: how to get from end to start?
 
     Why? To handle several starts.
 
     In the usual formulation: how to get from start to end?
-    fscore[point] = shortest distance from start to point
+    dist[point] = shortest distance from start to point
     This cannot be re-used between runs from different start.
 
     However, if we reformulate the problem as: how to get from end to start?
-    fscore[point] = shortest distance from point to end
-    So the fscore matrix is the same regardless of the start.
+    dist[point] = shortest distance from point to end
+    So the distances are the same regardless of the start.
 
-    Remark: We cannot use A* anymore as there is no single goal anymore (several starts).
+    Every move costs 1: a breadth-first search, exploring all the points from which
+    the end can be reached, gives the distances for all the starts at once.
     """
-    dists_from_start_to_end: Dict[Coord, int] = {}
-
-    # Initialization
-    open_points: List[Tuple[int, Coord]] = [(0, end)]
-    heapq.heapify(open_points)
-    visited: npt.NDArray[np.bool_] = np.full_like(height_map, False)
-    gscore: Map = np.full_like(height_map, -1)
-    gscore[end[0], end[1]] = 0
-
-    while open_points:
-        _gscore, point = heapq.heappop(open_points)
-        if visited[point[0], point[1]]:
-            continue
-        visited[point[0], point[1]] = True
-
-        # Wait to find the distance to end for all the starts
-        if point in starts:
-            dists_from_start_to_end[point] = gscore[point[0], point[1]]
-            if len(dists_from_start_to_end) == len(starts):
-                break
-
-        for neigh in get_neighs(height_map, point):
-            # Reformulated as: how to get from end to start
-            # Can go down at most 1 step per move (but climb as many steps as wanted)
-            if -(height_map[neigh[0], neigh[1]] - height_map[point[0], point[1]]) > 1:
-                continue
-
-            if visited[neigh[0], neigh[1]]:
-                continue
-
-            # Distance between neighbors is exactly 1
-            tmp_gscore = gscore[point[0], point[1]] + 1
-            if (
-                gscore[neigh[0], neigh[1]] == -1
-                or tmp_gscore < gscore[neigh[0], neigh[1]]
-            ):
-                gscore[neigh[0], neigh[1]] = tmp_gscore
-                heapq.heappush(open_points, (tmp_gscore, neigh))
-
-    return dists_from_start_to_end
+    result = bfs([end], functools.partial(get_moves, height_map, reverse=True))
+    return cast(Dict[Coord, int], result.distances)
 
 
 def min_dist_to_end(point: Coord, end: Coord, height_map: Map) -> int:
     height_diff = height_map[end[0], end[1]] - height_map[point[0], point[1]]
     lateral_dist = abs(point[0] - end[0]) + abs(point[1] - end[1])
-    return max(lateral_dist, height_diff)
-
-
-def a_star(height_map: Map, start: Coord, end: Coord) -> int:
-    # Initialization
-    open_points: List[Tuple[int, Coord]] = [(0, start)]
-    heapq.heapify(open_points)
-    visited: npt.NDArray[np.bool_] = np.full_like(height_map, False)
-    gscore: Map = np.full_like(height_map, -1)
-    gscore[start[0], start[1]] = 0
-
-    while open_points:
-        _fscore, point = heapq.heappop(open_points)
-        if visited[point[0], point[1]]:
-            continue
-        visited[point[0], point[1]] = True
-
-        if point == end:
-            break
-
-        for neigh in get_neighs(height_map, point):
-            # Can climb at most 1 step per move (but go down as many steps as wanted)
-            if height_map[neigh[0], neigh[1]] - height_map[point[0], point[1]] > 1:
-                continue
-
-            if visited[neigh[0], neigh[1]]:
-                continue
-
-            # Distance between neighbors is exactly 1
-            tmp_gscore = gscore[point[0], point[1]] + 1
-            if (
-                gscore[neigh[0], neigh[1]] == -1
-                or tmp_gscore < gscore[neigh[0], neigh[1]]
-            ):
-                gscore[neigh[0], neigh[1]] = tmp_gscore
-                fscore = gscore[neigh[0], neigh[1]] + min_dist_to_end(
-                    neigh, end, height_map
-                )
-                heapq.heappush(open_points, (fscore, neigh))
-
-    return gscore[end[0], end[1]]
+    return int(max(lateral_dist, height_diff))
+
+
+VARIANTS: Dict[str, Callable[[Buffer], int]] = {
+    "dijkstra": find_part1_dist_with_dijkstra,
+    "a_star": find_part1_dist_with_a_star,
+    "bfs": find_part1_dist_with_bfs,
+}
@@ -1,10 +1,11 @@
 import re
 from typing import cast, List, Optional, Tuple
 
-import intervals as I  # type: ignore
 import numpy as np
 import numpy.typing as npt
 
+from common.interval_set import IntervalSet
+
 
 Coord = Tuple[int, int]
 CoordRange = npt.NDArray[np.int64]
@@ -35,17 +36,8 @@ def compute_manhattan_dist(coord_1: Coord, coord_2: Coord) -> int:
     return abs(coord_1[0] - coord_2[0]) + abs(coord_1[1] - coord_2[1])
 
 
-def compute_coverage(coverage: I.Interval) -> int:
-    coverage_count = 0
-    for sensor_coverage in coverage:
-        lower_bound = sensor_coverage.lower
-        upper_bound = sensor_coverage.upper
-        if not sensor_coverage.left:
-            lower_bound += 1
-        if not sensor_coverage.right:
-            upper_bound -= 1
-        coverage_count += upper_bound - lower_bound + 1
-    return coverage_count
+def compute_coverage(coverage: IntervalSet) -> int:
+    return coverage.measure()
 
 
 def compute_tuning_frequency(coord: Coord) -> int:
@@ -68,45 +60,46 @@ def parse_sensor_beacon_coords(input_lines: List[str]) -> List[Tuple[Coord, Coor
 
 def check_row_coverage(
     sensor_beacon_coords: List[Tuple[Coord, Coord]], row_y: int, include_beacon=False
-) -> Tuple[I.Interval, int]:
+) -> Tuple[IntervalSet, int]:
     """Compute the portion of the row at y=row_y covered by the sensor.
 
     Return:
-        coverage (I.Interval): the said coverage
+        coverage (IntervalSet): the said coverage
         min_overlap (int): the minimum (non-empty) overlap between two sensors' coverages
     """
-    coverage: I.Interval = I.empty()
+    coords: CoordRange = np.array(sensor_beacon_coords, dtype=np.int64).reshape(
+        (-1, 2, 2)
+    )
+    sensor_coords: CoordRange = coords[:, 0]
+    beacon_coords: CoordRange = coords[:, 1]
+    min_manhattan_dists: CoordRange = np.sum(
+        np.abs(sensor_coords - beacon_coords), axis=1
+    )
+    # How much manhattan distance "is left" to spend along the x-axis
+    x_offsets: CoordRange = min_manhattan_dists - np.abs(sensor_coords[:, 1] - row_y)
+    # Portion of the row covered by each sensor (empty if the offset is negative)
+    min_covered_xs: CoordRange = sensor_coords[:, 0] - x_offsets
+    max_covered_xs: CoordRange = sensor_coords[:, 0] + x_offsets
+    # Full coverage: union of all the sensors' coverages at once
+    coverage = IntervalSet.from_bounds(min_covered_xs, max_covered_xs)
+
+    # Find the minimum (non-empty) overlap between the coverages of two sensors
+    is_covering = x_offsets >= 0
+    lowers, uppers = min_covered_xs[is_covering], max_covered_xs[is_covering]
+    overlaps: CoordRange = np.minimum.outer(uppers, uppers) - np.maximum.outer(
+        lowers, lowers
+    )
+    # Each pair of sensors once (the overlaps of a single position are ignored)
+    pair_overlaps: CoordRange = overlaps[np.triu_indices(len(lowers), k=1)]
+    pair_overlaps = pair_overlaps[pair_overlaps > 0]
     min_overlap: Optional[int] = None
-    sensor_coverages: List[I.Interval] = []
-    for sensor_coord, beacon_coord in sensor_beacon_coords:
-        min_manhattan_dist = compute_manhattan_dist(sensor_coord, beacon_coord)
-        sensor_x, sensor_y = sensor_coord
-        # How much manhattan distance "is left" to spend along the x-axis
-        x_offset = min_manhattan_dist - abs(sensor_y - row_y)
-        # Portion of the row covered by the sensor
-        min_covered_x = sensor_x - x_offset
-        max_covered_x = sensor_x + x_offset
-        sensor_coverage = I.closed(min_covered_x, max_covered_x)
-        # Find the minimum (non-empty) overlap between that sensor and the previous ones' coverages
-        for prev_sensor_coverage in sensor_coverages:
-            coverage_overlap = sensor_coverage.intersection(prev_sensor_coverage)
-            if coverage_overlap.is_empty():
-                continue
-            overlap = coverage_overlap.upper - coverage_overlap.lower
-            if overlap == 0:
-                continue
-            if min_overlap is None or min_overlap > overlap:
-                min_overlap = overlap
-        # Update the full coverage
-        coverage = coverage.union(sensor_coverage)
-        sensor_coverages.append(sensor_coverage)
+    if len(pair_overlaps) > 0:
+        min_overlap = int(np.min(pair_overlaps))
 
     if not include_beacon:
-        # Remove the found beacons from the coverage sensor_coverage
-        for _sensor_coord, beacon_coord in sensor_beacon_coords:
-            beacon_x, beacon_y = beacon_coord
-            if beacon_y == row_y:
-                coverage = coverage.difference(I.closed(beacon_x, beacon_x))
+        # Remove the found beacons from the coverage
+        beacon_xs: CoordRange = beacon_coords[beacon_coords[:, 1] == row_y, 0]
+        coverage = coverage.difference(IntervalSet.from_bounds(beacon_xs, beacon_xs))
 
     min_overlap = cast(int, min_overlap)
     return coverage, min_overlap
@@ -115,7 +108,7 @@ def check_row_coverage(
 def find_distress_beacon_coord(
     sensor_beacon_coords: List[Tuple[Coord, Coord]], max_coord: int
 ) -> Coord:
-    x_bounds: I.Interval = I.closed(0, max_coord)
+    x_bounds = IntervalSet.closed(0, max_coord)
     y_coord: int = 0
     while y_coord < max_coord:
         coverage, min_overlap = check_row_coverage(
@@ -125,9 +118,9 @@ def find_distress_beacon_coord(
         diff = x_bounds.difference(coverage)
         if not diff.is_empty():
             assert (
-                diff.upper - diff.lower - 1 == 1
-            ), f"There should be exactly one spot not covered, got {diff.upper - diff.lower - 1}"
-            x_coord: int = (diff.upper + diff.lower) // 2
+                diff.measure() == 1
+            ), f"There should be exactly one spot not covered, got {diff.measure()}"
+            x_coord: int = int(diff.lowers[0])
             return x_coord, y_coord
 
         # At most, by going down 1 row, we can decrease the overlap between the coverage
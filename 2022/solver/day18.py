@@ -3,9 +3,11 @@ Assumptions:
 - Shapes are simple enough that the enclosed surfaces are smaller than the outside ones
 """
 
-from collections import defaultdict
+import operator
 from typing import Dict, List, Tuple
 
+from common.union_find import UnionFind
+
 
 Coord = Tuple[int, int, int]
 Cluster = List[Coord]
@@ -60,68 +62,34 @@ def compute_surfaces(lava_droplets: List[Coord]) -> Tuple[int, int]:
 def cluster_cubes(
     cubes: List[Coord], allow_diagonal: bool = True
 ) -> List[Tuple[Cluster, int]]:
-    # Sort the cubes for efficiency
-    cubes.sort(key=sum)
-
-    # Initialization
-    max_cluster_id: int = -1
-    cluster_assignments: Dict[Coord, int] = {}
-    cluster_contact_surfaces: Dict[int, int] = {}
-
-    # Cluster the cubes
+    # One element per cube, with the number of faces in contact between the cubes
+    # of its cluster
+    cube_clusters = UnionFind(contact_surface=operator.add)
+    cube_idxs: Dict[Coord, int] = {}
+    for cube in cubes:
+        cube_idxs[cube] = cube_clusters.add(contact_surface=0)
+
+    # Cluster the cubes: look their neighbors up, instead of comparing the pairs
     for i, this_cube in enumerate(cubes):
-        if this_cube not in cluster_assignments:
-            max_cluster_id += 1
-            cluster_assignments[this_cube] = max_cluster_id
-            cluster_contact_surfaces[max_cluster_id] = 0
-        this_cluster = cluster_assignments[this_cube]
-
-        this_key = sum(this_cube)
-
-        for other_cube in cubes[i + 1 :]:
-            other_cluster = cluster_assignments.get(other_cube, -1)
-
-            other_key = sum(other_cube)
-            if other_key - this_key > 2:
-                break
-
-            num_diff_coords: int = 0
-            for k, this_axis in enumerate(this_cube):
-                other_axis = other_cube[k]
-                if this_axis == other_axis:
-                    continue
-                if abs(this_axis - other_axis) == 1:
-                    num_diff_coords += 1
-                else:
-                    num_diff_coords = 3
-                    break
-
-            if num_diff_coords == 1 or (allow_diagonal and num_diff_coords <= 2):
-                if num_diff_coords == 1:
-                    cluster_contact_surfaces[this_cluster] += 2
-                if other_cluster >= 0 and other_cluster != this_cluster:
-                    cluster_contact_surfaces[this_cluster] += cluster_contact_surfaces[
-                        other_cluster
-                    ]
-                    cluster_contact_surfaces.pop(other_cluster)
-                    for some_cube, some_cluster in cluster_assignments.items():
-                        if some_cluster == other_cluster:
-                            cluster_assignments[some_cube] = this_cluster
-                else:
-                    cluster_assignments[other_cube] = this_cluster
-
-    clusters = defaultdict(list)
-    for cube, cluster_id in cluster_assignments.items():
-        clusters[cluster_id].append(cube)
-
-    cluster_surfaces = {
-        cluster_id: len(clusters[cluster_id]) * 6 - contact_surface
-        for cluster_id, contact_surface in cluster_contact_surfaces.items()
-    }
-
-    clusters_and_surfaces = [
-        (cluster, cluster_surfaces[cluster_id])
-        for cluster_id, cluster in clusters.items()
+        direct_neigh_coords, diagonal_neigh_coords = get_neighbors(this_cube)
+        for other_cube in direct_neigh_coords:
+            j = cube_idxs.get(other_cube, -1)
+            # Each pair of cubes once
+            if j > i:
+                cube_clusters.union(i, j)
+                cube_clusters.update(i, "contact_surface", 2)
+        if allow_diagonal:
+            for other_cube in diagonal_neigh_coords:
+                j = cube_idxs.get(other_cube, -1)
+                if j > i:
+                    cube_clusters.union(i, j)
+
+    clusters_and_surfaces: List[Tuple[Cluster, int]] = [
+        (
+            [cubes[i] for i in cluster],
+            len(cluster) * 6 - cube_clusters.aggregate(root, "contact_surface"),
+        )
+        for root, cluster in cube_clusters.components().items()
     ]
 
     return clusters_and_surfaces
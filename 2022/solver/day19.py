@@ -43,20 +43,33 @@ class Factory:
         return cast(Resources, max_resources)
 
 
+# (factories, time of end for part 1, time of end for part 2)
+Parsed = Tuple[List[Factory], int, int]
+
+
 def main(
     input_lines: List[str], part1_t_end: int = 24, part2_t_end: int = 32
 ) -> Tuple[int, int]:
-    factories: List[Factory] = parse_blueprints(input_lines)
+    parsed: Parsed = parse(input_lines, part1_t_end, part2_t_end)
+    return part1(parsed), part2(parsed)
+
+
+def parse(
+    input_lines: List[str], part1_t_end: int = 24, part2_t_end: int = 32
+) -> Parsed:
+    return parse_blueprints(input_lines), part1_t_end, part2_t_end
+
 
+def part1(parsed: Parsed) -> int:
+    factories, part1_t_end, _ = parsed
     part1_max_geodes = map(partial(find_max_geodes, part1_t_end), factories)
-    part1_answer: int = sum(
-        k * geodes for k, geodes in enumerate(part1_max_geodes, start=1)
-    )
+    return sum(k * geodes for k, geodes in enumerate(part1_max_geodes, start=1))
 
-    part2_max_geodes = map(partial(find_max_geodes, part2_t_end), factories[:3])
-    part2_answer: int = reduce(lambda a, b: a * b, part2_max_geodes)
 
-    return part1_answer, part2_answer
+def part2(parsed: Parsed) -> int:
+    factories, _, part2_t_end = parsed
+    part2_max_geodes = map(partial(find_max_geodes, part2_t_end), factories[:3])
+    return reduce(lambda a, b: a * b, part2_max_geodes)
 
 
 def parse_blueprints(input_lines: List[str]) -> List[Factory]:
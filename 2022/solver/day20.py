@@ -1,13 +1,18 @@
 from typing import List, Tuple
 
+from common.grid import Buffer
+from common.parsing import parse_ints
+
 
 File = List[int]
 
+INPUT_MODE: str = "mmap"
+
 
 def main(
-    input_lines: List[str], decription_key: int = 811589153, part2_num_mixing: int = 10
+    input_bytes: Buffer, decription_key: int = 811589153, part2_num_mixing: int = 10
 ) -> Tuple[int, int]:
-    numbers: File = [int(line) for line in input_lines]
+    numbers: File = parse_ints(input_bytes).tolist()
 
     part1_answer: int = sum(find_grove_coordinates(numbers))
 
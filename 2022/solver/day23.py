@@ -1,8 +1,19 @@
-from collections import defaultdict
-from typing import Dict, List, Tuple
+from typing import List, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from common.automaton import converge, crop, evolve
+from common.grid import Buffer, map_chars, read_grid
+from common.neighbors import count_neighbors, moore_kernel, offsets_kernel
 
 
 Coord = Tuple[int, int]
+# grid[i, j] = is there an elf in position (i, j) ?
+Grid = npt.NDArray[np.bool_]
+
+
+INPUT_MODE: str = "mmap"
 
 
 # Directions in which the elves can move (order matters here)
@@ -12,137 +23,78 @@ DIRECTIONS: Tuple[Coord, Coord, Coord, Coord] = (
     (0, -1),  # W
     (0, +1),  # E
 )
+# An elf moves in a direction when there is no elf in the 3 positions on that side
+DIRECTION_KERNELS: List[npt.NDArray[np.bool_]] = [
+    offsets_kernel(
+        [(d_row if d_row != 0 else k, d_col if d_col != 0 else k) for k in (-1, 0, 1)]
+    )
+    for d_row, d_col in DIRECTIONS
+]
+NEIGHBOR_KERNEL: npt.NDArray[np.bool_] = moore_kernel(2)
 
 
-def main(input_lines: List[str], part1_n_rounds: int = 10) -> Tuple[int, int]:
-    positions: List[Coord] = parse_positions(input_lines)
+def main(input_bytes: Buffer, part1_n_rounds: int = 10) -> Tuple[int, int]:
+    grid: Grid = parse_grid(input_bytes)
 
-    update_positions(positions, part1_n_rounds)
-    part1_answer: int = compute_coverage(positions)
+    grid = evolve(grid, step, part1_n_rounds)
+    part1_answer: int = compute_coverage(grid)
 
-    part2_answer: int = converge(positions, part1_n_rounds)
+    n_rounds: int
+    _grid, n_rounds = converge(grid, step, start_step_idx=part1_n_rounds)
+    part2_answer: int = part1_n_rounds + n_rounds
 
     return part1_answer, part2_answer
 
 
-def parse_positions(
-    input_lines: List[str], elf_char="#", empty_char="."
-) -> List[Coord]:
-    positions: List[Coord] = []
-    for i, input_line in enumerate(input_lines):
-        for j, char in enumerate(input_line):
-            if char == elf_char:
-                positions.append((i, j))
-            elif char != empty_char:
-                raise RuntimeError(f"Unrecognized char in input: {char}")
-    return positions
+def parse_grid(input_bytes: Buffer, elf_char="#", empty_char=".") -> Grid:
+    try:
+        return map_chars(
+            read_grid(input_bytes), {elf_char: True, empty_char: False}, np.bool_
+        )
+    except ValueError as exc:
+        raise RuntimeError(f"Unrecognized char in input: {exc}") from exc
 
 
-def update_positions(positions: List[Coord], n_rounds: int) -> None:
-    for round_idx in range(n_rounds):
-        step(round_idx, positions)
+def shift(grid: Grid, direction: Coord) -> Grid:
+    # The border of the grid is empty: nothing wraps around
+    return np.roll(grid, direction, axis=(0, 1))
 
 
-def converge(positions: List[Coord], start_round_idx: int = 0) -> int:
-    round_idx = start_round_idx
-    while step(round_idx, positions):
-        round_idx += 1
-    return round_idx + 1
-
-
-def step(round_idx: int, positions: List[Coord]) -> bool:
-    # Sort the positions to make it easy to find an elf's neighbors
-    positions.sort(key=sum)
-
-    # Initialization
-    # key: proposed position, value: idx of the elves that want to move there
-    proposed_positions: Dict[Coord, List[int]] = defaultdict(list)
+def step(grid: Grid, round_idx: int) -> Tuple[Grid, bool]:
+    # Room for the elves moving out of the grid
+    grid = np.pad(grid, 1)
 
     # Part 1: Check where the elves want to move
-    for elf_idx, position in enumerate(positions):
-        key = sum(position)
-
-        # In the same order as the DIRECTIONS
-        can_move: List[bool] = [True] * len(DIRECTIONS)
-        for other_elf_idx in range(elf_idx - 1, -1, -1):
-            # Already know the elf cannot move, no need to process further
-            if not any(can_move):
-                break
-            other_position = positions[other_elf_idx]
-            # All the other elves will be too far, no need to process further
-            if key - sum(other_position) > 2:
-                break
-            # The other elf is too far, it is not a neighbor
-            if abs(other_position[0] - position[0]) > 1:
-                continue
-            if abs(other_position[1] - position[1]) > 1:
-                continue
-            # Check whether the other elf is blocking a direction
-            if other_position[0] == position[0] - 1:
-                can_move[0] = False
-            elif other_position[0] == position[0] + 1:
-                can_move[1] = False
-            if other_position[1] == position[1] - 1:
-                can_move[2] = False
-            elif other_position[1] == position[1] + 1:
-                can_move[3] = False
-        for other_position in positions[elf_idx + 1 :]:
-            # Already know the elf cannot move, no need to process further
-            if not any(can_move):
-                break
-            # All the other elves will be too far, no need to process further
-            if sum(other_position) - key > 2:
-                break
-            # The other elf is too far, it is not a neighbor
-            if abs(other_position[0] - position[0]) > 1:
-                continue
-            if abs(other_position[1] - position[1]) > 1:
-                continue
-            # Check whether the other elf is blocking a direction
-            if other_position[0] == position[0] - 1:
-                can_move[0] = False
-            elif other_position[0] == position[0] + 1:
-                can_move[1] = False
-            if other_position[1] == position[1] - 1:
-                can_move[2] = False
-            elif other_position[1] == position[1] + 1:
-                can_move[3] = False
-
-        if not any(can_move) or all(can_move):
-            continue
-
-        for k in range(len(DIRECTIONS)):
-            direction_idx = (round_idx + k) % len(DIRECTIONS)
-            if can_move[direction_idx]:
-                direction = DIRECTIONS[direction_idx]
-                # No neighbor: move in that direction
-                new_position = (position[0] + direction[0], position[1] + direction[1])
-                proposed_positions[new_position].append(elf_idx)
-                break
+    # Only the elves with neighbors move
+    proposing: Grid = grid & (count_neighbors(grid, NEIGHBOR_KERNEL) > 0)
+    proposals: List[Grid] = [np.full(grid.shape, False)] * len(DIRECTIONS)
+    for k in range(len(DIRECTIONS)):
+        direction_idx = (round_idx + k) % len(DIRECTIONS)
+        can_move: Grid = count_neighbors(grid, DIRECTION_KERNELS[direction_idx]) == 0
+        proposals[direction_idx] = proposing & can_move
+        proposing = proposing & ~can_move
 
     # Part 2: Update all the elves' positions
-    is_updated = False
-    for proposed_position, elves_idxs in proposed_positions.items():
-        if len(elves_idxs) > 1:
-            # More than 1 elf want to move there, no elves should move
-            continue
-        positions[elves_idxs[0]] = proposed_position
-        is_updated = True
-
-    return is_updated
-
-
-def compute_coverage(positions: List[Coord]) -> int:
-    min_row_idx, min_col_idx = positions[0]
-    max_row_idx, max_col_idx = positions[0]
-    for position in positions:
-        row_idx, col_idx = position
-        min_row_idx = min(min_row_idx, row_idx)
-        max_row_idx = max(max_row_idx, row_idx)
-        min_col_idx = min(min_col_idx, col_idx)
-        max_col_idx = max(max_col_idx, col_idx)
-    rectangle_area: int = (max_row_idx - min_row_idx + 1) * (
-        max_col_idx - min_col_idx + 1
-    )
-    coverage: int = rectangle_area - len(positions)
+    # Number of elves proposing to move to each position
+    n_proposals: npt.NDArray[np.int64] = np.zeros(grid.shape, dtype=np.int64)
+    for proposal, direction in zip(proposals, DIRECTIONS):
+        n_proposals += shift(proposal, direction)
+    # More than 1 elf want to move there, no elves should move
+    is_free: Grid = n_proposals == 1
+    new_grid: Grid = grid.copy()
+    has_moved = False
+    for proposal, (d_row, d_col) in zip(proposals, DIRECTIONS):
+        moving: Grid = proposal & shift(is_free, (-d_row, -d_col))
+        if moving.any():
+            new_grid[moving] = False
+            new_grid[shift(moving, (d_row, d_col))] = True
+            has_moved = True
+
+    new_grid, _origin = crop(new_grid, np.zeros(2, dtype=np.int64))
+    return new_grid, has_moved
+
+
+def compute_coverage(grid: Grid) -> int:
+    # The grid is the smallest rectangle containing every elf
+    coverage: int = grid.size - int(np.count_nonzero(grid))
     return coverage
@@ -1,20 +1,36 @@
-from typing import List, Tuple
+import functools
+import math
+from typing import Callable, Dict, Iterator, Tuple
 
 import numpy as np
 import numpy.typing as npt
 
+from common.grid import Buffer, map_chars, read_grid
+from common.search import bfs as search_bfs
+
 
 Coord = Tuple[int, int]
 # map[i, j, k] = is there a blizzard of direction k in position (i, j) ?
 # With: k = 0 (up) ; 1 (down) ; 2 (left) ; 3 (right)
 Map = npt.NDArray[np.bool_]
+# reachable[i, j] = is this point reachable at t?
+Reachable = npt.NDArray[np.bool_]
+
+# State of the expedition: its position, at a given time
+State = Tuple[Coord, int]
+
+# Moves of the expedition: wait, up, down, left or right
+MOVES: Tuple[Coord, ...] = ((0, 0), (-1, 0), (1, 0), (0, -1), (0, 1))
+
 
+INPUT_MODE: str = "mmap"
 
-def main(input_lines: List[str]) -> Tuple[int, int]:
+
+def main(input_bytes: Buffer) -> Tuple[int, int]:
     valley_map: Map
     start_pos: Coord
     end_pos: Coord
-    valley_map, start_pos, end_pos = parse_valley_map(input_lines)
+    valley_map, start_pos, end_pos = parse_valley_map(input_bytes)
 
     # Remark: Why add 2 below?
     # start at t = 1: as this is not the start position,
@@ -38,43 +54,61 @@ def main(input_lines: List[str]) -> Tuple[int, int]:
     return part1_answer, part2_answer
 
 
+def find_part2_time(
+    input_bytes: Buffer, find_trip_time: Callable[[Map, int, Coord, Coord], int]
+) -> int:
+    valley_map, start_pos, end_pos = parse_valley_map(input_bytes)
+    time: int = 0
+    for trip_start_pos, trip_end_pos in (
+        (start_pos, end_pos),
+        (end_pos, start_pos),
+        (start_pos, end_pos),
+    ):
+        time += find_trip_time(valley_map, time, trip_start_pos, trip_end_pos)
+    return 1 + time + 1
+
+
+def find_trip_time_with_frontier(
+    valley_map: Map, start_time: int, start_pos: Coord, end_pos: Coord
+) -> int:
+    for _ in range(start_time):
+        valley_map = step_map(valley_map)
+    trip_time, _valley_map = bfs(valley_map, start_pos, end_pos)
+    return trip_time
+
+
 def parse_valley_map(
-    input_lines: List[str],
+    input_bytes: Buffer,
     empty_char: str = ".",
     up_char: str = "^",
     down_char: str = "v",
     left_char: str = "<",
     right_char: str = ">",
 ) -> Tuple[Map, Coord, Coord]:
-    assert len(input_lines) > 2
+    grid = read_grid(input_bytes)
+    assert grid.shape[0] > 2
 
     # To account for the valley's walls
-    num_rows: int = len(input_lines) - 2
-    num_cols: int = len(input_lines[0]) - 2
-    valley_map: Map = np.full((num_rows, num_cols, 4), False, dtype=np.bool_)
+    num_rows: int = grid.shape[0] - 2
+    blizzard_chars = (up_char, down_char, left_char, right_char)
+    try:
+        # k = 1 + index of the blizzard's direction (0 if empty)
+        blizzards = map_chars(
+            grid[1:-1, 1:-1],
+            {empty_char: 0, **{char: k for k, char in enumerate(blizzard_chars, 1)}},
+        )
+    except ValueError as exc:
+        raise RuntimeError(f"Unsupported character {exc}") from exc
+    valley_map: Map = blizzards[:, :, np.newaxis] == np.arange(1, 5)
 
     # Get the start position
-    start_col_idx: int = input_lines[0].index(empty_char) - 1
+    start_col_idx: int = int(np.argmax(grid[0] == ord(empty_char))) - 1
     start_pos: Coord = (0, start_col_idx)
 
-    # Build the map
-    for i, input_line in enumerate(input_lines[1:-1]):
-        for j, char in enumerate(input_line[1:-1]):
-            if char == up_char:
-                valley_map[i, j, 0] = True
-            elif char == down_char:
-                valley_map[i, j, 1] = True
-            elif char == left_char:
-                valley_map[i, j, 2] = True
-            elif char == right_char:
-                valley_map[i, j, 3] = True
-            elif char != empty_char:
-                raise RuntimeError(f"Unsupported character {char}")
-
     valley_map = step_map(valley_map)
 
     # Get the end position
-    end_col_idx: int = input_lines[-1].index(empty_char) - 1
+    end_col_idx: int = int(np.argmax(grid[-1] == ord(empty_char))) - 1
     end_pos: Coord = (num_rows - 1, end_col_idx)
 
     return valley_map, start_pos, end_pos
@@ -83,10 +117,7 @@ def parse_valley_map(
 def bfs(valley_map: Map, start_pos: Coord, end_pos: Coord) -> Tuple[int, Map]:
     # Initialization
     time: int = 0
-    # reachable[i, j] = is this point reachable at t?
-    reachable: npt.NDArray[np.bool_] = np.full(
-        valley_map.shape[:2], False, dtype=np.bool_
-    )
+    reachable: Reachable = np.full(valley_map.shape[:2], False, dtype=np.bool_)
 
     # Step 1: Wait for the start position to be reachable
     while np.any(valley_map[start_pos[0], start_pos[1]]):
@@ -131,3 +162,66 @@ def step_map(valley_map: Map):
     new_valley_map[:, 1:, 3] = valley_map[:, :-1, 3]
     new_valley_map[:, 0, 3] = valley_map[:, -1, 3]
     return new_valley_map
+
+
+def find_trip_time_with_search(
+    valley_map: Map, start_time: int, start_pos: Coord, end_pos: Coord
+) -> int:
+    """Same as 'bfs', but searching the states of the expedition one by one.
+
+    'valley_map' is the map at time 0: the blizzards at any time are found from it
+    (they wrap around the valley), instead of stepping the map.
+    The states are encoded by the position and the time modulo the period
+    of the blizzards: the same state comes back after each period.
+    """
+    num_rows, num_cols = valley_map.shape[:2]
+    period: int = num_rows * num_cols // math.gcd(num_rows, num_cols)
+    up, down, left, right = (valley_map[:, :, k].tolist() for k in range(4))
+
+    def is_free(pos: Coord, time: int) -> bool:
+        row_idx, col_idx = pos
+        return not (
+            up[(row_idx + time) % num_rows][col_idx]
+            or down[(row_idx - time) % num_rows][col_idx]
+            or left[row_idx][(col_idx + time) % num_cols]
+            or right[row_idx][(col_idx - time) % num_cols]
+        )
+
+    def get_next_states(state: State) -> Iterator[State]:
+        (row_idx, col_idx), time = state
+        for d_row, d_col in MOVES:
+            pos = (row_idx + d_row, col_idx + d_col)
+            if (
+                0 <= pos[0] < num_rows
+                and 0 <= pos[1] < num_cols
+                and is_free(pos, time + 1)
+            ):
+                yield pos, time + 1
+        # The start position can be entered again (after waiting outside the valley)
+        if is_free(start_pos, time + 1):
+            yield start_pos, time + 1
+
+    # Wait for the start position to be reachable
+    wait_time: int = 0
+    while not is_free(start_pos, start_time + wait_time):
+        wait_time += 1
+
+    result = search_bfs(
+        [(start_pos, start_time + wait_time)],
+        get_next_states,
+        is_goal=lambda state: state[0] == end_pos,
+        key=lambda state: (state[0], state[1] % period),
+    )
+    if result.goal_distance is None:
+        raise RuntimeError("Could not find a path to the end position")
+    return wait_time + result.goal_distance
+
+
+VARIANTS: Dict[str, Callable[[Buffer], int]] = {
+    "search": functools.partial(
+        find_part2_time, find_trip_time=find_trip_time_with_search
+    ),
+    "frontier": functools.partial(
+        find_part2_time, find_trip_time=find_trip_time_with_frontier
+    ),
+}
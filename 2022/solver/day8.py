@@ -1,14 +1,19 @@
-from typing import List, Tuple
+from typing import Tuple
 
 import numpy as np
 import numpy.typing as npt
 
+from common.grid import Buffer, read_grid
+
 
 Map = npt.NDArray[np.int64]
 
 
-def main(input_lines: List[str]) -> Tuple[int, int]:
-    tree_map: Map = parse_tree_map(input_lines)
+INPUT_MODE: str = "mmap"
+
+
+def main(input_bytes: Buffer) -> Tuple[int, int]:
+    tree_map: Map = parse_tree_map(input_bytes)
 
     # Number of visible tress
     part1_answer: int = int(np.sum(find_visible_trees(tree_map)))
@@ -18,14 +23,9 @@ def main(input_lines: List[str]) -> Tuple[int, int]:
     return part1_answer, part2_answer
 
 
-def parse_tree_map(input_lines: List[str]) -> Map:
-    assert len(input_lines) > 0, "Empty tree_map"
-    tree_map: Map = np.empty(
-        shape=(len(input_lines), len(input_lines[0])), dtype=np.int64
-    )
-    for row_idx, row in enumerate(input_lines):
-        for col_idx, height in enumerate(row):
-            tree_map[row_idx, col_idx] = int(height)
+def parse_tree_map(input_bytes: Buffer) -> Map:
+    tree_map: Map = read_grid(input_bytes).astype(np.int64) - ord("0")
+    assert tree_map.size > 0, "Empty tree_map"
     return tree_map
 
 
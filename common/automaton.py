@@ -0,0 +1,216 @@
+import operator
+from collections import Counter
+from typing import (
+    Callable,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+import numpy as np
+import numpy.typing as npt
+
+from .neighbors import count_neighbors, offsets_kernel
+
+
+State = TypeVar("State")
+# 'step(state, step_idx)' returns the next state, and whether the step changed it:
+# a flag computed from what the step already knows (e.g. did any cell move?),
+# cheaper than comparing the whole states
+Step = Callable[[State, int], Tuple[State, bool]]
+
+Cell = Tuple[int, ...]
+Grid = npt.NDArray[np.bool_]
+Cells = Set[Cell]
+
+DENSE, SPARSE = "dense", "sparse"
+BACKENDS = (DENSE, SPARSE)
+# Below this fraction of live cells in their bounding box, the sparse backend
+# (Python work per live cell) is faster than the dense one (numpy work per cell)
+SPARSE_MAX_OCCUPANCY = 0.01
+
+
+def iterate(
+    state: State, step: Step, start_step_idx: int = 0
+) -> Iterator[Tuple[State, bool]]:
+    """Endlessly yield the successive states, and whether each step changed anything."""
+    step_idx = start_step_idx
+    while True:
+        state, changed = step(state, step_idx)
+        yield state, changed
+        step_idx += 1
+
+
+def evolve(state: State, step: Step, n_steps: int, start_step_idx: int = 0) -> State:
+    """State after 'n_steps' steps."""
+    for step_idx in range(start_step_idx, start_step_idx + n_steps):
+        state, _changed = step(state, step_idx)
+    return state
+
+
+def converge(state: State, step: Step, start_step_idx: int = 0) -> Tuple[State, int]:
+    """Step until a step changes nothing.
+
+    Return the stable state, and the number of steps (including the last one).
+    """
+    step_idx = start_step_idx
+    changed = True
+    while changed:
+        state, changed = step(state, step_idx)
+        step_idx += 1
+    return state, step_idx - start_step_idx
+
+
+class LifeRule(NamedTuple):
+    """Outer-totalistic rule (e.g. Conway's game of life: B3/S23).
+
+    A dead cell is born when its number of live neighbors is in 'birth',
+    a live cell survives when its number of live neighbors is in 'survival'.
+    """
+
+    birth: FrozenSet[int]
+    survival: FrozenSet[int]
+
+
+def step_dense(grid: Grid, kernel: npt.NDArray, rule: LifeRule) -> Tuple[Grid, bool]:
+    """One step of a life-like automaton on a bounded grid (outside of it: dead cells)."""
+    n_neighbors = count_neighbors(grid, kernel)
+    # Lookup tables of the rule, by number of live neighbors
+    max_neighbors = int(np.sum(kernel != 0))
+    is_birth = np.full(max_neighbors + 1, False)
+    is_birth[[n for n in rule.birth if n <= max_neighbors]] = True
+    is_survival = np.full(max_neighbors + 1, False)
+    is_survival[[n for n in rule.survival if n <= max_neighbors]] = True
+
+    births = ~grid & is_birth[n_neighbors]
+    deaths = grid & ~is_survival[n_neighbors]
+    if not (births.any() or deaths.any()):
+        return grid, False
+    return (grid | births) & ~deaths, True
+
+
+def step_sparse(
+    cells: Cells, offsets: Sequence[Cell], rule: LifeRule
+) -> Tuple[Cells, bool]:
+    """One step of a life-like automaton on the set of the coordinates of its live cells."""
+    if 0 in rule.birth:
+        raise ValueError("The dead cells cannot be born without any live neighbor")
+    n_neighbors = Counter(
+        tuple(map(operator.add, cell, offset)) for cell in cells for offset in offsets
+    )
+    new_cells = {
+        cell
+        for cell, n in n_neighbors.items()
+        if (n in rule.survival if cell in cells else n in rule.birth)
+    }
+    if 0 in rule.survival:
+        new_cells.update(cell for cell in cells if cell not in n_neighbors)
+    changed = len(new_cells) != len(cells) or any(
+        cell not in cells for cell in new_cells
+    )
+    return new_cells, changed
+
+
+def choose_backend(n_live_cells: int, volume: int) -> str:
+    """Backend to step a life-like automaton, by occupancy of the bounding box."""
+    if n_live_cells < SPARSE_MAX_OCCUPANCY * volume:
+        return SPARSE
+    return DENSE
+
+
+def to_dense(cells: Cells, n_dims: int) -> Tuple[Grid, npt.NDArray[np.int64]]:
+    """Grid of the bounding box of the live cells, and the coordinates of its origin."""
+    if not cells:
+        return np.full((0,) * n_dims, False), np.zeros(n_dims, dtype=np.int64)
+    coords = np.array(list(cells), dtype=np.int64)
+    origin = coords.min(axis=0)
+    grid = np.full(coords.max(axis=0) - origin + 1, False)
+    grid[tuple((coords - origin).T)] = True
+    return grid, origin
+
+
+def to_sparse(grid: Grid, origin: npt.NDArray[np.int64]) -> Cells:
+    return set(map(tuple, (np.argwhere(grid) + origin).tolist()))
+
+
+def crop(
+    grid: Grid, origin: npt.NDArray[np.int64]
+) -> Tuple[Grid, npt.NDArray[np.int64]]:
+    """Crop the grid to the bounding box of its live cells."""
+    if not grid.any():
+        return np.full((0,) * grid.ndim, False), origin
+    slices: List[slice] = []
+    for axis in range(grid.ndim):
+        is_live = grid.any(axis=tuple(k for k in range(grid.ndim) if k != axis))
+        live_idxs = np.flatnonzero(is_live)
+        slices.append(slice(int(live_idxs[0]), int(live_idxs[-1]) + 1))
+    return grid[tuple(slices)], origin + [s.start for s in slices]
+
+
+def run_life(
+    cells: Iterable[Sequence[int]],
+    offsets: Iterable[Sequence[int]],
+    rule: LifeRule,
+    n_steps: int,
+    backend: Optional[str] = None,
+) -> Cells:
+    """Live cells of a life-like automaton on an unbounded N-D lattice after 'n_steps'.
+
+    'offsets' are the ones of the neighbors of a cell. At each step, the automaton
+    is stepped on a dense grid (bounding box of the live cells, with a margin)
+    or on the sparse set of the live cells, chosen by occupancy (unless 'backend'
+    forces one). It stops early when a step changes nothing.
+    """
+    if backend is not None and backend not in BACKENDS:
+        raise ValueError(
+            "Unsupported backend '{}' (expected one of: {})".format(
+                backend, ", ".join(BACKENDS)
+            )
+        )
+    if 0 in rule.birth:
+        raise ValueError("The dead cells cannot be born without any live neighbor")
+    live_cells: Cells = {tuple(cell) for cell in cells}
+    neighbor_offsets: List[Cell] = [tuple(offset) for offset in offsets]
+    if not live_cells:
+        return live_cells
+    n_dims = len(neighbor_offsets[0])
+    kernel = offsets_kernel(neighbor_offsets)
+    margin = [size // 2 for size in kernel.shape]
+
+    grid: Optional[Grid] = None
+    origin = np.zeros(n_dims, dtype=np.int64)
+    for _step_idx in range(n_steps):
+        if grid is None:
+            n_live_cells = len(live_cells)
+            volume = int(np.prod(np.ptp(list(live_cells), axis=0) + 1))
+        else:
+            n_live_cells, volume = int(grid.sum()), grid.size
+        # No cell can be born anymore
+        if n_live_cells == 0:
+            break
+        step_backend = backend or choose_backend(n_live_cells, volume)
+
+        if step_backend == SPARSE:
+            if grid is not None:
+                live_cells, grid = to_sparse(grid, origin), None
+            live_cells, changed = step_sparse(live_cells, neighbor_offsets, rule)
+        else:
+            if grid is None:
+                grid, origin = to_dense(live_cells, n_dims)
+            # Room for the cells born around the live ones
+            grid = np.pad(grid, [(size, size) for size in margin])
+            grid, changed = step_dense(grid, kernel, rule)
+            grid, origin = crop(grid, origin - margin)
+        if not changed:
+            break
+
+    if grid is not None:
+        live_cells = to_sparse(grid, origin)
+    return live_cells
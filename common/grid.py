@@ -0,0 +1,72 @@
+import mmap
+from typing import Dict, Union
+
+import numpy as np
+import numpy.typing as npt
+
+
+# Raw input of the solvers taking it as a memory map (see 'runner/inputs.py')
+Buffer = Union[bytes, bytearray, mmap.mmap]
+Grid = npt.NDArray[np.uint8]
+
+NEWLINE = ord("\n")
+
+
+def find_blank_line(input_bytes: Buffer, start: int = 0) -> int:
+    """Offset of the first line following a blank line (-1 if there is none)."""
+    blank_line_idx = input_bytes.find(b"\n\n", start)
+    if blank_line_idx < 0:
+        return -1
+    return blank_line_idx + 2
+
+
+def read_grid(input_bytes: Buffer, offset: int = 0, size: int = -1) -> Grid:
+    """View a rectangular grid of characters as a 2-D array of their (ASCII) codes.
+
+    The grid spans 'size' bytes (-1: until the end) from 'offset' in the raw input.
+    Zero-copy: the rows of the (read-only) view are strided over the raw input,
+    skipping the line breaks.
+    """
+    buffer: Grid = np.frombuffer(input_bytes, dtype=np.uint8, offset=offset)
+    if size >= 0:
+        buffer = buffer[:size]
+    # Ignore the trailing line breaks
+    end = len(buffer)
+    while end > 0 and buffer[end - 1] == NEWLINE:
+        end -= 1
+    if end == 0:
+        return np.empty((0, 0), dtype=np.uint8)
+
+    n_cols = input_bytes.find(b"\n", offset, offset + end) - offset
+    if n_cols < 0:
+        n_cols = end
+    n_rows = (end + 1) // (n_cols + 1)
+    if end != n_rows * (n_cols + 1) - 1 or np.any(
+        buffer[n_cols : end : n_cols + 1] != NEWLINE
+    ):
+        raise ValueError("The grid is not rectangular")
+
+    return np.lib.stride_tricks.as_strided(
+        buffer,
+        shape=(n_rows, n_cols),
+        strides=(n_cols + 1, 1),
+        writeable=False,
+    )
+
+
+def map_chars(
+    grid: Grid, char_values: Dict[str, int], dtype: npt.DTypeLike = np.int64
+) -> npt.NDArray:
+    """Map each character of the grid to its value, with a lookup table.
+
+    Raise a 'ValueError' if the grid contains any other character.
+    """
+    table = np.zeros(256, dtype=dtype)
+    is_known = np.zeros(256, dtype=np.bool_)
+    for char, value in char_values.items():
+        table[ord(char)] = value
+        is_known[ord(char)] = True
+    if not np.all(is_known[grid]):
+        unknown_chars = sorted(set(map(chr, np.unique(grid[~is_known[grid]]))))
+        raise ValueError("Unsupported character(s): {}".format(unknown_chars))
+    return table[grid]
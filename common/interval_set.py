@@ -0,0 +1,136 @@
+from typing import Callable, Iterator, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+
+Bounds = npt.NDArray[np.int64]
+Values = Union[int, npt.ArrayLike]
+# 'keep(in_self, in_other)': which parts of the two sets to keep, e.g. 'np.logical_or'
+Combination = Callable[[npt.NDArray[np.bool_], npt.NDArray[np.bool_]], npt.NDArray]
+
+
+class IntervalSet:
+    """Set of integers, as a union of closed intervals '[lower, upper]'.
+
+    The bounds are kept in two sorted numpy arrays: the intervals are disjoint,
+    non-adjacent (merged into a single interval otherwise) and non-empty.
+    Membership is a binary search ('searchsorted') for a whole array of values,
+    and the set operations are a few array operations, whatever the number
+    of intervals.
+    """
+
+    __slots__ = ("lowers", "uppers")
+
+    def __init__(self, lowers: Bounds, uppers: Bounds) -> None:
+        """From already sorted, disjoint, non-adjacent intervals (see 'from_bounds')."""
+        self.lowers = lowers
+        self.uppers = uppers
+
+    @classmethod
+    def from_bounds(cls, lowers: npt.ArrayLike, uppers: npt.ArrayLike) -> "IntervalSet":
+        """Union of the intervals '[lowers[i], uppers[i]]', in any order.
+
+        The empty intervals (upper < lower) are ignored.
+        """
+        lowers = np.asarray(lowers, dtype=np.int64).ravel()
+        uppers = np.asarray(uppers, dtype=np.int64).ravel()
+        if lowers.shape != uppers.shape:
+            raise ValueError(
+                "Got {} lower bound(s) for {} upper bound(s)".format(
+                    len(lowers), len(uppers)
+                )
+            )
+        is_non_empty = lowers <= uppers
+        lowers, uppers = lowers[is_non_empty], uppers[is_non_empty]
+        order = np.argsort(lowers, kind="stable")
+        lowers, uppers = lowers[order], uppers[order]
+        if len(lowers) == 0:
+            return cls(lowers, uppers)
+
+        # Upper bound of the union of all the intervals up to each one
+        max_uppers = np.maximum.accumulate(uppers)
+        # An interval starts a new one when neither overlapping nor adjacent
+        # to the previous ones
+        is_start = np.ones(len(lowers), dtype=np.bool_)
+        is_start[1:] = lowers[1:] > max_uppers[:-1] + 1
+        starts = np.flatnonzero(is_start)
+        ends = np.append(starts[1:] - 1, len(lowers) - 1)
+        return cls(lowers[starts], max_uppers[ends])
+
+    @classmethod
+    def empty(cls) -> "IntervalSet":
+        return cls(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+    @classmethod
+    def closed(cls, lower: int, upper: int) -> "IntervalSet":
+        return cls.from_bounds([lower], [upper])
+
+    def __len__(self) -> int:
+        """Number of intervals (see 'measure' for the number of integers)."""
+        return len(self.lowers)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self.lowers.tolist(), self.uppers.tolist())
+
+    def __repr__(self) -> str:
+        return "IntervalSet({})".format(
+            " | ".join("[{}, {}]".format(lower, upper) for lower, upper in self)
+            or "empty"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return np.array_equal(self.lowers, other.lowers) and np.array_equal(
+            self.uppers, other.uppers
+        )
+
+    def __contains__(self, value: int) -> bool:
+        return bool(self.contains(value))
+
+    def is_empty(self) -> bool:
+        return len(self.lowers) == 0
+
+    def measure(self) -> int:
+        """Number of integers in the set."""
+        return int(np.sum(self.uppers - self.lowers + 1))
+
+    def contains(self, values: Values) -> npt.NDArray[np.bool_]:
+        """Membership of each value of an array (of any shape)."""
+        values = np.asarray(values, dtype=np.int64)
+        if self.is_empty():
+            return np.zeros(values.shape, dtype=np.bool_)
+        # Index of the last interval starting at or before each value
+        interval_idxs = np.searchsorted(self.lowers, values, side="right") - 1
+        return (interval_idxs >= 0) & (
+            values <= self.uppers[np.maximum(interval_idxs, 0)]
+        )
+
+    def union(self, *others: "IntervalSet") -> "IntervalSet":
+        """Union with any number of sets at once."""
+        return IntervalSet.from_bounds(
+            np.concatenate([self.lowers] + [other.lowers for other in others]),
+            np.concatenate([self.uppers] + [other.uppers for other in others]),
+        )
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        return self._combine(other, np.logical_and)
+
+    def difference(self, other: "IntervalSet") -> "IntervalSet":
+        return self._combine(other, lambda in_self, in_other: in_self & ~in_other)
+
+    def _combine(self, other: "IntervalSet", keep: Combination) -> "IntervalSet":
+        # Between two consecutive bounds of either set, the membership to each set
+        # is constant: it is the one of the first integer of the segment
+        segment_starts = np.unique(
+            np.concatenate(
+                [self.lowers, self.uppers + 1, other.lowers, other.uppers + 1]
+            )
+        )
+        if len(segment_starts) == 0:
+            return IntervalSet.empty()
+        # After the last bound: in neither set
+        segment_starts, segment_ends = segment_starts[:-1], segment_starts[1:] - 1
+        is_kept = keep(self.contains(segment_starts), other.contains(segment_starts))
+        return IntervalSet.from_bounds(segment_starts[is_kept], segment_ends[is_kept])
@@ -0,0 +1,78 @@
+import itertools
+from typing import Iterable, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+
+def moore_kernel(n_dims: int, include_center: bool = False) -> npt.NDArray[np.bool_]:
+    """Kernel of the 3^n_dims - 1 cells around a cell (and of the cell itself)."""
+    kernel = np.full((3,) * n_dims, True)
+    kernel[(1,) * n_dims] = include_center
+    return kernel
+
+
+def offsets_kernel(offsets: Iterable[Sequence[int]]) -> npt.NDArray[np.bool_]:
+    """Kernel of the cells at the given offsets (e.g. (-1, 0)) from a cell."""
+    offsets = [tuple(offset) for offset in offsets]
+    n_dims = len(offsets[0])
+    radius = max(abs(coordinate) for offset in offsets for coordinate in offset)
+    kernel = np.full((2 * radius + 1,) * n_dims, False)
+    for offset in offsets:
+        kernel[tuple(radius + coordinate for coordinate in offset)] = True
+    return kernel
+
+
+def count_neighbors(
+    grid: npt.NDArray,
+    kernel: npt.NDArray,
+    dtype: npt.DTypeLike = np.int64,
+    fill_value: int = 0,
+) -> npt.NDArray:
+    """Weighted count of the neighbors of each cell of a N-D grid.
+
+    'result[idx] = sum(kernel[k] * grid[idx + k - center])' over the indices 'k'
+    of the kernel, centered on 'kernel.shape // 2', the cells outside the grid
+    counting as 'fill_value' (a correlation: the kernel is not flipped).
+    One shifted-slice add over the whole grid per non-zero weight of the kernel:
+    no work per cell in Python.
+    """
+    if grid.ndim != kernel.ndim:
+        raise ValueError(
+            "The kernel has {} dimension(s) instead of {}".format(
+                kernel.ndim, grid.ndim
+            )
+        )
+    centers = [size // 2 for size in kernel.shape]
+    padded_grid = np.full(
+        [
+            grid_size + kernel_size - 1
+            for grid_size, kernel_size in zip(grid.shape, kernel.shape)
+        ],
+        fill_value,
+        dtype=dtype,
+    )
+    # Padded with 'center' cells before and 'kernel_size - 1 - center' cells after:
+    # 'grid[idx + k - center]' is 'padded_grid[idx + k]'
+    padded_grid[
+        tuple(
+            slice(center, center + grid_size)
+            for grid_size, center in zip(grid.shape, centers)
+        )
+    ] = grid
+
+    result = np.zeros(grid.shape, dtype=dtype)
+    for kernel_idx in itertools.product(*(range(size) for size in kernel.shape)):
+        weight = kernel[kernel_idx]
+        if weight == 0:
+            continue
+        shifted_grid = padded_grid[
+            tuple(
+                slice(k, k + grid_size) for k, grid_size in zip(kernel_idx, grid.shape)
+            )
+        ]
+        if weight == 1:
+            result += shifted_grid
+        else:
+            result += weight * shifted_grid
+    return result
@@ -0,0 +1,99 @@
+from typing import Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from .grid import Buffer, NEWLINE
+
+
+Ints = npt.NDArray[np.int64]
+Offsets = npt.NDArray[np.intp]
+
+# Largest number of digits of an integer fitting in 64 bits (whatever its digits)
+MAX_N_DIGITS = 18
+POWERS_OF_10: Ints = 10 ** np.arange(MAX_N_DIGITS, dtype=np.int64)
+
+
+def parse_ints(input_bytes: Buffer, sep: str = "\n") -> Ints:
+    """Parse the integers separated by 'sep' in the raw input into an array.
+
+    Parsed in bulk by numpy, in place: from a view of the raw input (e.g. of
+    a memory map), without any intermediate Python string or integer.
+    Empty fields (e.g. blank lines with the default separator) and the trailing
+    line breaks are ignored.
+    Raise a 'ValueError' if a field is not an integer.
+    """
+    if len(sep) != 1:
+        raise ValueError("Expected a single character separator, got '{}'".format(sep))
+    buffer: npt.NDArray[np.uint8] = np.frombuffer(input_bytes, dtype=np.uint8)
+    # Ignore the trailing line breaks
+    end = len(buffer)
+    while end > 0 and buffer[end - 1] == NEWLINE:
+        end -= 1
+    buffer = buffer[:end]
+
+    is_sep = buffer == ord(sep)
+    is_digit = (buffer >= ord("0")) & (buffer <= ord("9"))
+    is_minus = buffer == ord("-")
+    unexpected_idxs = np.flatnonzero(~(is_sep | is_digit | is_minus))
+    if len(unexpected_idxs) > 0:
+        raise ValueError(
+            "Unexpected character {!r} at offset {}".format(
+                bytes(buffer[unexpected_idxs[:1]]), unexpected_idxs[0]
+            )
+        )
+
+    # Bounds of the fields: between the separators (ignoring the empty ones)
+    sep_idxs = np.flatnonzero(is_sep)
+    field_starts = np.concatenate(([0], sep_idxs + 1))
+    field_ends = np.concatenate((sep_idxs, [len(buffer)]))
+    is_non_empty = field_starts < field_ends
+    field_starts, field_ends = field_starts[is_non_empty], field_ends[is_non_empty]
+    # An optional sign, then at least one digit (and only digits)
+    is_negative = is_minus[field_starts]
+    n_digits = field_ends - field_starts - is_negative
+    if np.count_nonzero(is_minus) != np.count_nonzero(is_negative) or np.any(
+        n_digits <= 0
+    ):
+        raise ValueError("Expected integers separated by {!r}".format(sep))
+    if np.any(n_digits > MAX_N_DIGITS):
+        raise ValueError("Integers of more than {} digits".format(MAX_N_DIGITS))
+    if len(field_starts) == 0:
+        return np.empty(0, dtype=np.int64)
+
+    # Sum of the k-th digits (from the right) of all the integers, weighted by 10^k:
+    # one pass per digit, over all the integers at once
+    values: Ints = np.zeros(len(field_starts), dtype=np.int64)
+    for power in range(int(np.max(n_digits))):
+        digits = buffer[field_ends - 1 - power].astype(np.int64) - ord("0")
+        values += np.where(power < n_digits, digits, 0) * POWERS_OF_10[power]
+    values[is_negative] *= -1
+    return values
+
+
+def parse_int_groups(input_bytes: Buffer) -> Tuple[Ints, Offsets]:
+    """Parse groups of integers (one per line) separated by blank lines.
+
+    Return the integers of all the groups in a flat array, and the offsets
+    of the groups in it: the i-th group is 'values[offsets[i] : offsets[i + 1]]'.
+    """
+    values = parse_ints(input_bytes)
+
+    buffer: npt.NDArray[np.uint8] = np.frombuffer(input_bytes, dtype=np.uint8)
+    # Ignore the trailing line breaks
+    end = len(buffer)
+    while end > 0 and buffer[end - 1] == NEWLINE:
+        end -= 1
+    is_newline = buffer[:end] == NEWLINE
+    # A line starts at the beginning of the input, and after each line break
+    is_line_start = np.ones(end, dtype=np.bool_)
+    is_line_start[1:] = is_newline[:-1]
+    # Each non-blank line holds a single integer (any other character is rejected)
+    number_starts = np.flatnonzero(is_line_start & ~is_newline)
+    blank_lines = np.flatnonzero(is_line_start & is_newline)
+
+    offsets: Offsets = np.empty(len(blank_lines) + 2, dtype=np.intp)
+    offsets[0] = 0
+    offsets[1:-1] = np.searchsorted(number_starts, blank_lines)
+    offsets[-1] = len(values)
+    return values, offsets
@@ -0,0 +1,191 @@
+import heapq
+import itertools
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+
+# 'neighbors(state)': the states reachable in a single move from 'state'
+# (with the cost of the move, for the weighted searches)
+Neighbors = Callable[[Any], Iterable[Any]]
+WeightedNeighbors = Callable[[Any], Iterable[Tuple[int, Any]]]
+# 'key(state)': hashable encoding of a state, identifying the states already reached
+# (e.g. a tuple of the fields which matter, or an index in a flat grid).
+# By default, the state itself (which then has to be hashable).
+Key = Callable[[Any], Hashable]
+IsGoal = Callable[[Any], bool]
+Heuristic = Callable[[Any], int]
+
+
+class SearchResult(NamedTuple):
+    """Outcome of a search.
+
+    'distances': shortest distance found from the start(s) to each reached state,
+    by key (final for the expanded ones).
+    'goal': first goal state reached (None when no goal was given or reached).
+    'goal_distance': its distance (None likewise).
+    'expanded': number of states whose neighbors were generated.
+    'pushed': number of states added to the frontier (including the starts).
+    """
+
+    distances: Dict[Hashable, int]
+    goal: Any
+    goal_distance: Optional[int]
+    expanded: int
+    pushed: int
+
+
+def _identity(state: Any) -> Hashable:
+    return state
+
+
+def bfs(
+    starts: Iterable[Any],
+    neighbors: Neighbors,
+    is_goal: Optional[IsGoal] = None,
+    key: Key = _identity,
+) -> SearchResult:
+    """Breadth-first search: every move costs 1.
+
+    Without 'is_goal', explore every state reachable from the starts.
+    """
+    distances: Dict[Hashable, int] = {}
+    queue: Deque[Any] = deque()
+    for start in starts:
+        start_key = key(start)
+        if start_key not in distances:
+            distances[start_key] = 0
+            queue.append(start)
+    pushed = len(queue)
+    expanded = 0
+
+    while queue:
+        state = queue.popleft()
+        distance = distances[key(state)]
+        if is_goal is not None and is_goal(state):
+            return SearchResult(distances, state, distance, expanded, pushed)
+        expanded += 1
+        for next_state in neighbors(state):
+            next_key = key(next_state)
+            if next_key not in distances:
+                distances[next_key] = distance + 1
+                queue.append(next_state)
+                pushed += 1
+    return SearchResult(distances, None, None, expanded, pushed)
+
+
+def dial(
+    starts: Iterable[Any],
+    neighbors: WeightedNeighbors,
+    max_cost: int,
+    is_goal: Optional[IsGoal] = None,
+    key: Key = _identity,
+) -> SearchResult:
+    """Dijkstra's algorithm on a bucket queue (Dial's algorithm).
+
+    The cost of each move is an integer between 0 and 'max_cost': the frontier
+    is a ring of 'max_cost + 1' buckets (one per distance from the current one),
+    no heap operation, each state is pushed in O(1).
+    Without 'is_goal', settle every state reachable from the starts.
+    """
+    n_buckets = max_cost + 1
+    buckets: List[List[Any]] = [[] for _ in range(n_buckets)]
+    distances: Dict[Hashable, int] = {}
+    for start in starts:
+        start_key = key(start)
+        if start_key not in distances:
+            distances[start_key] = 0
+            buckets[0].append(start)
+    pushed = n_pending = len(buckets[0])
+    expanded = 0
+
+    distance = 0
+    while n_pending > 0:
+        bucket = buckets[distance % n_buckets]
+        # The 0-cost moves append to the bucket being emptied
+        while bucket:
+            state = bucket.pop()
+            n_pending -= 1
+            # Stale entry: pushed again since, with a lower distance
+            if distances[key(state)] != distance:
+                continue
+            if is_goal is not None and is_goal(state):
+                return SearchResult(distances, state, distance, expanded, pushed)
+            expanded += 1
+            for cost, next_state in neighbors(state):
+                if not 0 <= cost <= max_cost:
+                    raise ValueError(
+                        "Move cost {} outside of [0, {}]".format(cost, max_cost)
+                    )
+                next_key = key(next_state)
+                next_distance = distance + cost
+                if next_distance < distances.get(next_key, next_distance + 1):
+                    distances[next_key] = next_distance
+                    buckets[next_distance % n_buckets].append(next_state)
+                    n_pending += 1
+                    pushed += 1
+        distance += 1
+    return SearchResult(distances, None, None, expanded, pushed)
+
+
+def a_star(
+    starts: Iterable[Any],
+    neighbors: WeightedNeighbors,
+    is_goal: IsGoal,
+    heuristic: Heuristic,
+    key: Key = _identity,
+) -> SearchResult:
+    """A* search on a binary heap (Dijkstra's algorithm with a zero heuristic).
+
+    'heuristic(state)' must never overestimate the distance to the nearest goal
+    (admissible). If it also never decreases by more than the cost of a move
+    (consistent), each state is expanded at most once: otherwise, a state is
+    expanded again when a shorter path to it is found.
+    """
+    distances: Dict[Hashable, int] = {}
+    # Ties broken by order of insertion: the states need not be comparable
+    tie_breaker = itertools.count()
+    heap: List[Tuple[int, int, int, Any]] = []
+    for start in starts:
+        start_key = key(start)
+        if start_key not in distances:
+            distances[start_key] = 0
+            heap.append((heuristic(start), next(tie_breaker), 0, start))
+    heapq.heapify(heap)
+    pushed = len(heap)
+    expanded = 0
+
+    while heap:
+        _estimate, _order, distance, state = heapq.heappop(heap)
+        # Stale entry: pushed again since, with a lower distance
+        if distances[key(state)] != distance:
+            continue
+        if is_goal(state):
+            return SearchResult(distances, state, distance, expanded, pushed)
+        expanded += 1
+        for cost, next_state in neighbors(state):
+            next_key = key(next_state)
+            next_distance = distance + cost
+            if next_distance < distances.get(next_key, next_distance + 1):
+                distances[next_key] = next_distance
+                heapq.heappush(
+                    heap,
+                    (
+                        next_distance + heuristic(next_state),
+                        next(tie_breaker),
+                        next_distance,
+                        next_state,
+                    ),
+                )
+                pushed += 1
+    return SearchResult(distances, None, None, expanded, pushed)
@@ -0,0 +1,97 @@
+from typing import Any, Callable, Dict, List
+
+
+# 'merge(aggregate, other_aggregate)': aggregate of the union of two components
+# (e.g. 'min' for a minimum, 'operator.add' for a count)
+Merge = Callable[[Any, Any], Any]
+
+
+class UnionFind:
+    """Disjoint sets of the elements 0, 1, ..., n - 1 (e.g. clusters of points).
+
+    Backed by flat lists indexed by element: the parent of each element (itself
+    for the root of a component), and the size of each component (at its root).
+    With path compression and union by size, any sequence of operations runs
+    in near-linear time.
+
+    Each component can also carry named aggregates (e.g. its minimum height),
+    combined by their 'merge' function when two components are merged.
+    """
+
+    def __init__(self, **merges: Merge) -> None:
+        """'merges': merge function of each aggregate, by name (e.g. 'min_height=min').
+
+        The elements are then added one by one (see 'add').
+        """
+        self.parents: List[int] = []
+        self.sizes: List[int] = []
+        self.merges = merges
+        # Aggregate of each component (at its root), by name
+        self.aggregates: Dict[str, List[Any]] = {name: [] for name in merges}
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    def add(self, **values: Any) -> int:
+        """Add an element in its own component, with its aggregates' initial values.
+
+        Return the new element.
+        """
+        if values.keys() != self.merges.keys():
+            raise ValueError(
+                "Expected the values of the aggregates: {}".format(
+                    ", ".join(sorted(self.merges))
+                )
+            )
+        element = len(self.parents)
+        self.parents.append(element)
+        self.sizes.append(1)
+        for name, value in values.items():
+            self.aggregates[name].append(value)
+        return element
+
+    def find(self, element: int) -> int:
+        """Root of the component of the element."""
+        root = element
+        while self.parents[root] != root:
+            root = self.parents[root]
+        # Path compression: the elements on the way now point to the root directly
+        while self.parents[element] != root:
+            self.parents[element], element = root, self.parents[element]
+        return root
+
+    def union(self, element: int, other_element: int) -> int:
+        """Merge the components of the two elements, and return the merged one's root."""
+        root, other_root = self.find(element), self.find(other_element)
+        if root == other_root:
+            return root
+        # Union by size: the smaller tree goes under the root of the bigger one
+        if self.sizes[root] < self.sizes[other_root]:
+            root, other_root = other_root, root
+        self.parents[other_root] = root
+        self.sizes[root] += self.sizes[other_root]
+        for name, merge in self.merges.items():
+            aggregates = self.aggregates[name]
+            aggregates[root] = merge(aggregates[root], aggregates[other_root])
+        return root
+
+    def size(self, element: int) -> int:
+        """Number of elements in the component of the element."""
+        return self.sizes[self.find(element)]
+
+    def aggregate(self, element: int, name: str) -> Any:
+        """Aggregate of the component of the element."""
+        return self.aggregates[name][self.find(element)]
+
+    def update(self, element: int, name: str, value: Any) -> None:
+        """Merge a value into the aggregate of the component of the element."""
+        root = self.find(element)
+        aggregates = self.aggregates[name]
+        aggregates[root] = self.merges[name](aggregates[root], value)
+
+    def components(self) -> Dict[int, List[int]]:
+        """Elements of each component, by root (ordered by their smallest element)."""
+        components: Dict[int, List[int]] = {}
+        for element in range(len(self.parents)):
+            components.setdefault(self.find(element), []).append(element)
+        return components
@@ -1,33 +1,91 @@
 #!/usr/bin/env python3
 
 from argparse import ArgumentParser
+import contextlib
 from datetime import datetime
-import importlib
+import functools
+import glob
+import io
 import os
 import re
 import sys
 import time
-
-import requests
+import traceback
+
+from runner.answer_cache import ANSWER_CACHE_DIR, AnswerCache
+from runner.benchmark import benchmark, format_statistics
+from runner.generation import GENERATED_INPUT_DIR, generate_input
+from runner.import_times import run_with_import_times
+from runner.inputs import deliver_input, from_lines, get_input_mode
+from runner.memory import trace_memory
+from runner.parts import has_parts, solve_by_parts
+from runner.profiling import PROFILE_PATH, profile
+from runner.regression import (
+    BASELINE_PATH,
+    find_regressions,
+    format_regression,
+    load_baseline,
+    save_baseline,
+)
+from runner.report import (
+    format_summary,
+    get_peak_rss_kb,
+    make_record,
+    summarize_by_year,
+    write_report,
+)
+from runner.prefetch import prefetch
+from runner.sandbox import RAISED, SUCCESS, run_isolated
+from runner.scaling import format_scaling, measure_scaling, SUPERLINEAR_SLOPE
+from runner.scheduling import (
+    load_timings,
+    order_longest_first,
+    run_in_pool,
+    save_timings,
+)
+from runner.server_cache import SERVER_CACHE_DIR, ServerCache
+from runner.sources import find_module_path, get_dependencies
+from runner.variants import compare_variants, format_variants, get_variants
+from runner.watch import get_changed_modules, reload_modules, watch
 
 
 # For local runs
 INPUT_PATH = os.path.join("{year}", "input", "day{day}.txt")
 SOLUTION_PATH = os.path.join("{year}", "solution", "day{day}.txt")
 # In CI
-SOLUTION_URL = "https://adventofcode.com/{year}/day/{day}"
+SERVER_URL = os.environ.get("ADVENT_OF_CODE_URL", "https://adventofcode.com")
+SOLUTION_URL = SERVER_URL + "/{year}/day/{day}"
 INPUT_URL = SOLUTION_URL + "/input"
 SOLUTION_PATTERN = re.compile(r"Your puzzle answer was \<code\>([\w\-\_=,]*)\<\/code\>")
 
 SOLVING_MODULE = "{year}.solver.day{day}"
+SOLVING_PACKAGE = os.path.join("{year}", "solver")
+GENERATING_MODULE = "{year}.generator.day{day}"
 
 # Special keyword to handle the unspecified part 2 of day 25's puzzle
 UNSPECIFIED = "unspecified"
+# Special keyword to solve the puzzles of all the years
+ALL_YEARS = "all"
 
 
 class NotSolvedException(RuntimeError):
     def __init__(self, year, day):
         super().__init__(f"Year {year}: day {day} has not been solved yet.")
+        self.year, self.day = year, day
+
+    def __reduce__(self):
+        # To be sent from / to the worker processes
+        return (NotSolvedException, (self.year, self.day))
+
+
+class NotGeneratedException(RuntimeError):
+    def __init__(self, year, day):
+        super().__init__(f"Year {year}: day {day} has no input generator yet.")
+        self.year, self.day = year, day
+
+    def __reduce__(self):
+        # To be sent from / to the worker processes
+        return (NotGeneratedException, (self.year, self.day))
 
 
 def load_input(input_path):
@@ -47,47 +105,85 @@ def load_solutions(solution_path):
     return part1_solution, part2_solution
 
 
-def load_server_input_and_solutions(year, day, session):
-    with requests.Session() as sess:
-        # Get the input
-        input_url = INPUT_URL.format(year=year, day=day)
-        res = sess.get(input_url, cookies={"session": session})
+def fetch_server_input(sess, year, day, session):
+    input_url = INPUT_URL.format(year=year, day=day)
+    res = sess.get(input_url, cookies={"session": session})
+    if res.status_code != 200:
         content = res.content.decode("utf-8")
-        if res.status_code != 200:
-            raise RuntimeError(f"Failed to get input from: {input_url}\n{content}")
-        input_lines = content.splitlines()
-        if len(input_lines[-1]) == 0:
-            input_lines.pop()
-
-        # Get the solutions
-        solution_url = SOLUTION_URL.format(year=year, day=day)
-        res = sess.get(solution_url, cookies={"session": session})
-        content = res.content.decode("utf-8")
-        if res.status_code != 200:
-            raise RuntimeError(
-                f"Failed to get solutions from: {solution_url}\n{content}"
-            )
-        solutions = SOLUTION_PATTERN.findall(content)
-        if len(solutions) == 0:
-            raise NotSolvedException(year, day)
-        if len(solutions) == 1:
-            # Let it fail the day if part 2 should have been solved but isn't yet
-            solutions.append(UNSPECIFIED)
-        elif len(solutions) > 2:
-            raise RuntimeError(
-                f"Cannot identify solutions: too many candidates {solutions}"
-            )
+        raise RuntimeError(f"Failed to get input from: {input_url}\n{content}")
+    return res.content
+
+
+def fetch_server_solutions(sess, year, day, session):
+    solution_url = SOLUTION_URL.format(year=year, day=day)
+    res = sess.get(solution_url, cookies={"session": session})
+    content = res.content.decode("utf-8")
+    if res.status_code != 200:
+        raise RuntimeError(f"Failed to get solutions from: {solution_url}\n{content}")
+    solutions = SOLUTION_PATTERN.findall(content)
+    if len(solutions) == 0:
+        raise NotSolvedException(year, day)
+    if len(solutions) == 1:
+        # Let it fail the day if part 2 should have been solved but isn't yet
+        solutions.append(UNSPECIFIED)
+    elif len(solutions) > 2:
+        raise RuntimeError(
+            f"Cannot identify solutions: too many candidates {solutions}"
+        )
+    return solutions
 
+
+def load_server_input_and_solutions(year, day, session, cache=None, sess=None):
+    input_content = solutions = None
+    if cache is not None:
+        input_content = cache.get_input(year, day)
+        solutions = cache.get_solutions(year, day)
+        # The solution of a part may have been submitted since it was cached
+        if solutions is not None and UNSPECIFIED in solutions:
+            solutions = None
+
+    if input_content is None or solutions is None:
+        with contextlib.ExitStack() as stack:
+            if sess is None:
+                # Only imported when needed: it is long to import
+                import requests  # pylint: disable=import-outside-toplevel
+
+                sess = stack.enter_context(requests.Session())
+
+            # Get the input
+            if input_content is None:
+                input_content = fetch_server_input(sess, year, day, session)
+                if cache is not None:
+                    cache.set_input(year, day, input_content)
+
+            # Get the solutions
+            if solutions is None:
+                solutions = fetch_server_solutions(sess, year, day, session)
+                if cache is not None:
+                    cache.set_solutions(year, day, solutions)
+
+    input_lines = input_content.decode("utf-8").splitlines()
+    if len(input_lines[-1]) == 0:
+        input_lines.pop()
     return input_lines, solutions
 
 
-def get_input_and_solutions(year, day, mode_ci, session):
+def get_input_and_solutions(
+    year, day, mode_ci, session, cache_server=True, *, load_lines=True
+):
     if not mode_ci:
         # Locally: when solving the puzzles
         # Read the input and solutions from local files
         try:
             # Get the input
-            input_lines = load_input(INPUT_PATH.format(year=year, day=day))
+            input_path = INPUT_PATH.format(year=year, day=day)
+            if load_lines:
+                input_lines = load_input(input_path)
+            elif os.path.isfile(input_path):
+                # Delivered from its file by the runner to the solver
+                input_lines = None
+            else:
+                raise FileNotFoundError(input_path)
             # Get the solutions
             solutions = load_solutions(SOLUTION_PATH.format(year=year, day=day))
         except FileNotFoundError as exc:
@@ -96,25 +192,178 @@ def get_input_and_solutions(year, day, mode_ci, session):
     else:
         # In CI: when checking the answers
         # Get the input and solutions from the advent_of_code server
-        input_lines, solutions = load_server_input_and_solutions(year, day, session)
+        input_lines, solutions = load_server_input_and_solutions(
+            year, day, session, cache=ServerCache(session) if cache_server else None
+        )
 
     return input_lines, solutions
 
 
-def solve_puzzle(year, day, input_lines, *additional_args, always_print=False):
+def import_generating_module(year, day):
+    module_name = GENERATING_MODULE.format(year=year, day=day)
     try:
-        solving_module = importlib.import_module(
-            SOLVING_MODULE.format(year=year, day=day)
-        )
+        __import__(module_name)
     except ModuleNotFoundError as exc:
-        raise NotSolvedException(year, day) from exc
+        raise NotGeneratedException(year, day) from exc
+    return sys.modules[module_name]
+
 
-    tic = time.time()
-    part1_answer, part2_answer = solving_module.main(input_lines, *additional_args)
-    toc = time.time()
+def generate_puzzle_input(year, day, scale=1.0, seed=0):
+    generating_module = import_generating_module(year, day)
+    return generate_input(generating_module, year, day, scale=scale, seed=seed)
+
+
+def import_solving_module(year, day):
+    module_name = SOLVING_MODULE.format(year=year, day=day)
+    try:
+        # Unlike 'importlib.import_module', the import time is reported by '-X importtime'
+        __import__(module_name)
+    except ModuleNotFoundError as exc:
+        raise NotSolvedException(year, day) from exc
+    return sys.modules[module_name]
+
+
+def solve_puzzle(
+    year,
+    day,
+    input_lines,
+    *additional_args,
+    input_path=None,
+    always_print=False,
+    profile_top=None,
+    memory_top=None,
+    cache=None,
+    parallel_parts=False,
+):
+    cache_key = None
+    if cache is not None:
+        cache_key = cache.get_key(
+            SOLVING_MODULE.format(year=year, day=day),
+            input_lines,
+            additional_args,
+            input_path=input_path,
+        )
+        cached_entry = None if cache_key is None else cache.get(cache_key)
+        if cached_entry is not None:
+            answers, measures = cached_entry
+            if always_print:
+                print(
+                    "Day {} was solved in {:.1f} ms ! (cached)".format(
+                        day, measures["wall_time_ms"]
+                    )
+                )
+            return answers, measures
+
+    solving_module = import_solving_module(year, day)
+
+    solve = solving_module.main
+    parts_measures = {}
+    if has_parts(solving_module):
+        # The parts cannot be profiled or traced in a child process
+        parallel_parts = (
+            parallel_parts and (profile_top is None) and (memory_top is None)
+        )
+        solve = functools.partial(
+            solve_by_parts, solving_module, parts_measures, parallel=parallel_parts
+        )
+    if profile_top is not None:
+        print("Day {} profile:".format(day))
+        solve = functools.partial(
+            profile,
+            solve,
+            stats_path=PROFILE_PATH.format(year=year, day=day),
+            top=profile_top,
+        )
+    memory_measures = {}
+    if memory_top is not None:
+        print("Day {} memory:".format(day))
+        solve = functools.partial(trace_memory, solve, top=memory_top)
+
+    with deliver_input(
+        get_input_mode(solving_module), input_lines, input_path
+    ) as solver_input:
+        tic, cpu_tic = time.time(), time.process_time()
+        if memory_top is None:
+            part1_answer, part2_answer = solve(solver_input, *additional_args)
+        else:
+            (part1_answer, part2_answer), memory_measures = solve(
+                solver_input, *additional_args
+            )
+        toc, cpu_toc = time.time(), time.process_time()
+    measures = {
+        "wall_time_ms": (toc - tic) * 1000,
+        "cpu_time_ms": (cpu_toc - cpu_tic) * 1000,
+        "peak_rss_kb": get_peak_rss_kb(),
+        **parts_measures,
+        **memory_measures,
+    }
     if always_print:
-        print("Day {} was solved in {:.1f} ms !".format(day, (toc - tic) * 1000))
-    return part1_answer, part2_answer
+        print("Day {} was solved in {:.1f} ms !".format(day, measures["wall_time_ms"]))
+        if parts_measures:
+            print(
+                "Day {} parse: {:.1f} ms ; part 1: {:.1f} ms ; part 2: {:.1f} ms".format(
+                    day,
+                    parts_measures["parse_time_ms"],
+                    parts_measures["part1_time_ms"],
+                    parts_measures["part2_time_ms"],
+                )
+            )
+    if cache_key is not None:
+        cache.set(cache_key, (part1_answer, part2_answer), measures)
+    return (part1_answer, part2_answer), measures
+
+
+def benchmark_puzzle(year, day, input_lines, *additional_args, warmup=1, repeat=10):
+    solving_module = import_solving_module(year, day)
+    stats = benchmark(
+        from_lines(solving_module.main, get_input_mode(solving_module)),
+        input_lines,
+        *additional_args,
+        warmup=warmup,
+        repeat=repeat,
+    )
+    print(format_statistics(day, stats))
+    return stats
+
+
+def compare_puzzle_variants(year, day, input_lines, warmup=1, repeat=10):
+    solving_module = import_solving_module(year, day)
+    variants = get_variants(solving_module)
+    if variants is None:
+        print("Day {} has no variants".format(day))
+        return None
+    input_mode = get_input_mode(solving_module)
+    results = compare_variants(
+        {name: from_lines(function, input_mode) for name, function in variants.items()},
+        input_lines,
+        warmup=warmup,
+        repeat=repeat,
+    )
+    print(format_variants(day, results))
+    return results
+
+
+def measure_puzzle_scaling(
+    year, day, scales, *additional_args, seed=0, warmup=1, repeat=10
+):
+    solving_module = import_solving_module(year, day)
+    try:
+        generating_module = import_generating_module(year, day)
+    except NotGeneratedException as exc:
+        print(exc)
+        return None
+    result = measure_scaling(
+        from_lines(solving_module.main, get_input_mode(solving_module)),
+        lambda scale: generate_input(
+            generating_module, year, day, scale=scale, seed=seed
+        ),
+        scales,
+        *additional_args,
+        warmup=warmup,
+        repeat=repeat,
+    )
+    print(format_scaling(day, result))
+    return result
 
 
 def check_answer(day_number, part_number, answer, solution=None, always_print=False):
@@ -140,9 +389,13 @@ def get_args():
     parser = ArgumentParser("Solver for the Advent of Code puzzles.")
     parser.add_argument(
         "-y",
+        "--years",
         "--year",
-        type=int,
-        help="Year of the puzzle(s) to solve (default: current year).",
+        type=str,
+        nargs="+",
+        help="Year(s) of the puzzle(s) to solve, or '{}' for all the years with solvers "
+        "(default: current year). The days of all the years are solved in a single run "
+        "(and a single pool of workers, see '--jobs').".format(ALL_YEARS),
     )
     parser.add_argument(
         "-d",
@@ -164,6 +417,176 @@ def get_args():
         action="store_true",
         help="Always print the expected solutions VS the actual answers.",
     )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        help="Solve synthetic inputs instead of the actual ones: generated by "
+        "'{year}/generator/day{day}.py', with this size relative to an actual input "
+        "(e.g. 10 for 10 times more lines). The answers are not checked. "
+        "The inputs are also written in '" + GENERATED_INPUT_DIR + "'.",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed of the synthetic inputs: the same seed always gives the same "
+        "inputs (default: 0).",
+    )
+    parser.add_argument(
+        "--parallel_parts",
+        action="store_true",
+        help="Solve the 2 parts of the puzzles concurrently, in 2 processes, "
+        "for the solvers split into 'parse', 'part1' and 'part2' "
+        "(instead of a single 'main').",
+    )
+    parser.add_argument(
+        "-n",
+        "--no_cache",
+        action="store_true",
+        help="Always solve the puzzles, even when their answers are cached (in '{}'). "
+        "By default, the answers are reused when neither the input nor the sources "
+        "of the solver (and of the modules it imports) changed.".format(
+            ANSWER_CACHE_DIR
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes solving the days in parallel "
+        "(default: 1, 0: one per CPU). The longest days (from the previous runs) start first.",
+    )
+    parser.add_argument(
+        "-t",
+        "--timeout",
+        type=float,
+        help="Maximum solving time (in s) per day. Each day is then solved in its own "
+        "process, killed when exceeding it: the day fails with 'TIMEOUT'.",
+    )
+    parser.add_argument(
+        "--max_memory",
+        type=int,
+        help="Maximum memory (in MB) per day. Each day is then solved in its own "
+        "process, with a limited address space: the day fails with 'OOM'.",
+    )
+    parser.add_argument(
+        "-b",
+        "--bench",
+        action="store_true",
+        help="Benchmark the solvers: time several repetitions of each day "
+        "and report the min / median / p95 / stddev of the solving time.",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="Number of untimed warm-up runs per day (or per variant, or per scale) "
+        "in the benchmark (or variants, or scaling) mode (default: 1).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+        help="Number of timed runs per day (or per variant, or per scale) "
+        "in the benchmark (or variants, or scaling) mode (default: 10).",
+    )
+    parser.add_argument(
+        "--variants",
+        action="store_true",
+        help="Run the alternative implementations declared by the solvers "
+        "(in their 'VARIANTS') on the same input: check that their outputs are "
+        "equivalent and report their speed-up relative to the baseline one.",
+    )
+    parser.add_argument(
+        "--scaling",
+        action="store_true",
+        help="Time the solvers on synthetic inputs of several sizes (see '--scales'), "
+        "fit the log-log slope of the solving time against the input size, and flag "
+        "the solvers growing super-linearly (slope > {}).".format(SUPERLINEAR_SLOPE),
+    )
+    parser.add_argument(
+        "--scales",
+        type=float,
+        nargs="+",
+        default=[0.25, 0.5, 1, 2, 4],
+        help="Sizes of the synthetic inputs, relative to an actual input, "
+        "in the scaling mode (default: 0.25 0.5 1 2 4).",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the solvers with cProfile: print their hottest functions "
+        "and dump their statistics to '{}'.".format(PROFILE_PATH),
+    )
+    parser.add_argument(
+        "--profile_top",
+        type=int,
+        default=10,
+        help="Number of functions to print, by cumulative and total time, "
+        "in the profiling mode (default: 10).",
+    )
+    parser.add_argument(
+        "-m",
+        "--memory",
+        action="store_true",
+        help="Trace the memory of the solvers: print their peak traced allocation, "
+        "their peak RSS and their top allocation sites.",
+    )
+    parser.add_argument(
+        "--memory_top",
+        type=int,
+        default=10,
+        help="Number of allocation sites to print in the memory mode (default: 10).",
+    )
+    parser.add_argument(
+        "--import_times",
+        action="store_true",
+        help="Report how the import time splits across the runner, "
+        "its dependencies and the solvers.",
+    )
+    parser.add_argument(
+        "-r",
+        "--report",
+        type=str,
+        help="Path of a JSON report to write, with one record per day "
+        "(wall / CPU time, peak RSS, answers, verdicts, interpreter version).",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        help="Path of the timings baseline (default: '{}').".format(BASELINE_PATH),
+    )
+    parser.add_argument(
+        "--save_baseline",
+        action="store_true",
+        help="Save the solving times as the new baseline "
+        "(to be used along with the benchmark mode).",
+    )
+    parser.add_argument(
+        "--check_baseline",
+        action="store_true",
+        help="Fail if any day is slower than its baseline by more than "
+        "'max_slowdown_ratio' or 'max_slowdown_ms'.",
+    )
+    parser.add_argument(
+        "--max_slowdown_ratio",
+        type=float,
+        default=1.5,
+        help="Maximum allowed ratio between the solving time and the baseline (default: 1.5).",
+    )
+    parser.add_argument(
+        "--max_slowdown_ms",
+        type=float,
+        help="Maximum allowed increase (in ms) of the solving time over the baseline.",
+    )
+    parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="Keep running after solving the days: watch the solvers and inputs, "
+        "and solve the affected days again (in the same warm process) on every change.",
+    )
     parser.add_argument(
         "-c",
         "--mode_ci",
@@ -171,6 +594,25 @@ def get_args():
         help="Enable the CI mode which gets inputs and solutions from advent_of_code server. "
         "Instead of using local files.",
     )
+    parser.add_argument(
+        "--no_server_cache",
+        action="store_true",
+        help="In CI mode, do not use the local cache of the inputs and solutions "
+        "(in '{}'): always get them from the server.".format(SERVER_CACHE_DIR),
+    )
+    parser.add_argument(
+        "--fetch_threads",
+        type=int,
+        default=4,
+        help="In CI mode, number of threads fetching the days' data concurrently "
+        "while the first days are being solved (default: 4).",
+    )
+    parser.add_argument(
+        "--fetch_rate",
+        type=float,
+        default=5,
+        help="In CI mode, maximum number of requests per second to the server (default: 5).",
+    )
     parser.add_argument(
         "-s",
         "--session",
@@ -180,12 +622,29 @@ def get_args():
     )
 
     args = parser.parse_args()
-    if args.year is None:
-        args.year = datetime.now().year
+    if args.years is None:
+        args.years = [datetime.now().year]
+    elif ALL_YEARS in args.years:
+        args.years = get_all_years()
+    else:
+        try:
+            args.years = sorted({int(year) for year in args.years})
+        except ValueError:
+            parser.error(
+                "argument -y/--years: expected years or '{}'".format(ALL_YEARS)
+            )
     if args.days is None:
         args.days = range(1, 26)
+    # All the (year, day) puzzles to solve
+    args.puzzles = [(year, day) for year in args.years for day in args.days]
     if args.additional_params is None:
         args.additional_params = []
+    if args.jobs == 0:
+        args.jobs = None
+    if args.repeat < 1:
+        parser.error("argument --repeat: expected at least 1 timed run")
+    if args.baseline is not None and len(args.years) > 1:
+        parser.error("argument --baseline: only for a single year")
 
     if args.mode_ci and args.session is None:
         raise RuntimeError(
@@ -195,37 +654,332 @@ def get_args():
     return args
 
 
-def main():
-    args = get_args()
+def get_all_years():
+    return sorted(
+        int(os.path.basename(os.path.dirname(package_path)))
+        for package_path in glob.glob(SOLVING_PACKAGE.format(year="[0-9]" * 4))
+    )
 
-    result = True
-    for day in args.days:
-        try:
+
+def run_day(year, day, args, fetched=None):
+    try:
+        if args.scale is not None:
+            input_lines = generate_puzzle_input(
+                year, day, scale=args.scale, seed=args.seed
+            )
+            # The answers to a synthetic input are not known
+            solutions = None
+        elif fetched is None:
             input_lines, solutions = get_input_and_solutions(
-                args.year,
+                year,
                 day,
                 args.mode_ci,
                 args.session,
+                cache_server=not args.no_server_cache,
+                # Otherwise, the input is read from its local file in the input mode
+                # of the solver: only imported when its answers are not cached
+                load_lines=args.bench or args.variants,
             )
-            part1_solution, part2_solution = solutions
-            part1_answer, part2_answer = solve_puzzle(
-                args.year,
+        else:
+            input_lines, solutions = fetched.result()
+        answers, measures = solve_puzzle(
+            year,
+            day,
+            # Keep the original input intact for the benchmark
+            list(input_lines) if args.bench or args.variants else input_lines,
+            *args.additional_params,
+            input_path=(
+                INPUT_PATH.format(year=year, day=day) if input_lines is None else None
+            ),
+            always_print=args.always_print,
+            profile_top=args.profile_top if args.profile else None,
+            memory_top=args.memory_top if args.memory else None,
+            parallel_parts=args.parallel_parts,
+            # The answers are always recomputed when measuring the solvers
+            cache=(
+                None
+                if args.no_cache
+                or args.bench
+                or args.profile
+                or args.memory
+                or args.save_baseline
+                or args.check_baseline
+                else AnswerCache()
+            ),
+        )
+        if args.bench:
+            measures["bench"] = benchmark_puzzle(
+                year,
                 day,
                 input_lines,
                 *args.additional_params,
-                always_print=args.always_print,
+                warmup=args.warmup,
+                repeat=args.repeat,
+            )
+        if args.variants:
+            measures["variants"] = compare_puzzle_variants(
+                year, day, input_lines, warmup=args.warmup, repeat=args.repeat
+            )
+        if args.scaling:
+            measures["scaling"] = measure_puzzle_scaling(
+                year,
+                day,
+                args.scales,
+                *args.additional_params,
+                seed=args.seed,
+                warmup=args.warmup,
+                repeat=args.repeat,
             )
-        except NotSolvedException as exc:
-            print(exc)
-            continue
+    except (NotSolvedException, NotGeneratedException) as exc:
+        print(exc)
+        return True, make_record(year, day)
+
+    if solutions is None:
+        verdicts = None
+        if args.always_print:
+            for i, answer in enumerate(answers, start=1):
+                print("Day {} Part {}: answered = {}".format(day, i, repr(answer)))
+    else:
+        verdicts = [
+            check_answer(day, i, answer, solution, always_print=args.always_print)
+            for i, (answer, solution) in enumerate(zip(answers, solutions), start=1)
+        ]
+    are_variants_equivalent = all(
+        result["equivalent"] for result in measures.get("variants") or []
+    )
+    return all(verdicts or []) and are_variants_equivalent, make_record(
+        year,
+        day,
+        answers,
+        solutions,
+        verdicts,
+        input_scale=args.scale,
+        input_seed=None if args.scale is None else args.seed,
+        **measures,
+    )
+
+
+def run_day_in_worker(year, day, args, fetched=None):
+    # Capture the messages of the worker process to print them in the days' order
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        result, record = run_day(year, day, args, fetched)
+    return output.getvalue(), result, record
+
+
+def run_day_isolated(year, day, args, fetched=None):
+    status, value = run_isolated(
+        run_day_in_worker,
+        year,
+        day,
+        args,
+        fetched,
+        timeout=args.timeout,
+        max_memory_mb=args.max_memory,
+        # Imported before the memory limit: only the solving is measured against it
+        preload=("numpy", SOLVING_MODULE.format(year=year, day=day)),
+    )
+    if status == SUCCESS:
+        return value
+    # The other days still run: the failure is only reported for this one
+    return (
+        "Day {} failed: {}\n".format(
+            day, status if status != RAISED else "{} ({!r})".format(status, value)
+        ),
+        False,
+        make_record(year, day, error=status),
+    )
+
+
+def get_solving_time(record):
+    if record["bench"] is not None:
+        return record["bench"]["median"]
+    return record["wall_time_ms"]
+
 
-        for i, (answer, solution) in enumerate(
-            ((part1_answer, part1_solution), (part2_answer, part2_solution)), start=1
+def prefetch_server_data(args, timings):
+    if not args.mode_ci or args.scale is not None:
+        return contextlib.nullcontext({})
+    # Fetch the data of the longest days first, to start solving them first
+    return prefetch(
+        load_server_input_and_solutions,
+        order_longest_first(args.puzzles, timings),
+        args.session,
+        None if args.no_server_cache else ServerCache(args.session),
+        n_threads=args.fetch_threads,
+        rate=args.fetch_rate,
+    )
+
+
+def get_watched_paths(puzzles):
+    paths = set()
+    for year in sorted({year for year, _day in puzzles}):
+        paths.update(glob.glob(os.path.join(SOLVING_PACKAGE.format(year=year), "*.py")))
+        paths.update(glob.glob(os.path.join(str(year), "input", "*")))
+        paths.update(glob.glob(os.path.join(str(year), "solution", "*")))
+    # Including the in-repo modules imported by the solvers (outside of their package)
+    for year, day in puzzles:
+        for module_name in get_dependencies(SOLVING_MODULE.format(year=year, day=day)):
+            paths.add(find_module_path(module_name))
+    return paths
+
+
+def get_affected_puzzles(puzzles, changed_paths):
+    changed_paths = {os.path.normpath(path) for path in changed_paths}
+    changed_modules = get_changed_modules(changed_paths)
+    affected_puzzles = []
+    for year, day in puzzles:
+        module_name = SOLVING_MODULE.format(year=year, day=day)
+        data_paths = {
+            os.path.normpath(INPUT_PATH.format(year=year, day=day)),
+            os.path.normpath(SOLUTION_PATH.format(year=year, day=day)),
+        }
+        if (
+            changed_paths & data_paths
+            or module_name in changed_modules
+            or changed_modules & set(get_dependencies(module_name))
         ):
-            result = (
-                check_answer(day, i, answer, solution, always_print=args.always_print)
-                and result
+            affected_puzzles.append((year, day))
+    return affected_puzzles
+
+
+def format_puzzles(puzzles):
+    years = {year for year, _day in puzzles}
+    if len(years) == 1:
+        return ", ".join(str(day) for _year, day in puzzles)
+    return ", ".join("{}/{}".format(year, day) for year, day in puzzles)
+
+
+def watch_and_solve(args):
+    def solve_affected_days(changed_paths):
+        affected_puzzles = get_affected_puzzles(args.puzzles, changed_paths)
+        if not affected_puzzles:
+            return
+        print(
+            "\nChanged: {}\nSolving again day(s): {}".format(
+                ", ".join(changed_paths), format_puzzles(affected_puzzles)
+            )
+        )
+        # Keep watching even if a solver is broken (e.g. while it is being edited)
+        try:
+            reload_modules(get_changed_modules(changed_paths))
+        except Exception:  # pylint: disable=broad-except
+            traceback.print_exc()
+            return
+        for year, day in affected_puzzles:
+            try:
+                run_day(year, day, args)
+            except Exception:  # pylint: disable=broad-except
+                traceback.print_exc()
+
+    print("\nWatching for changes (press Ctrl+C to stop)...")
+    try:
+        watch(lambda: get_watched_paths(args.puzzles), solve_affected_days)
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    args = get_args()
+    if args.import_times:
+        # Run again, with the import times being reported by the interpreter
+        sys.exit(
+            run_with_import_times(
+                [arg for arg in sys.argv if arg != "--import_times"],
+            )
+        )
+
+    result = True
+    records = []
+    timings = load_timings()
+    isolated = args.timeout is not None or args.max_memory is not None
+    is_multi_year = len(args.years) > 1
+    with prefetch_server_data(args, timings) as fetched:
+        if args.jobs == 1 and not isolated:
+            for year, day in args.puzzles:
+                if is_multi_year and day == args.days[0]:
+                    print("\nYear {}:".format(year))
+                day_result, record = run_day(year, day, args, fetched.get((year, day)))
+                result = day_result and result
+                records.append(record)
+        else:
+            # pylint: disable=import-outside-toplevel
+            from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+            # pylint: enable=import-outside-toplevel
+            # The days of all the years share the same pool of workers
+            for (year, day), (output, day_result, record) in run_in_pool(
+                # Each isolated day runs in its own process, managed by a thread
+                run_day_isolated if isolated else run_day_in_worker,
+                args.puzzles,
+                args,
+                jobs=args.jobs,
+                timings=timings,
+                prefetched=fetched,
+                executor_class=ThreadPoolExecutor if isolated else ProcessPoolExecutor,
+            ):
+                if is_multi_year and day == args.days[0]:
+                    print("\nYear {}:".format(year))
+                print(output, end="")
+                result = day_result and result
+                records.append(record)
+    if args.report is not None:
+        write_report(args.report, records)
+
+    for year in args.years:
+        year_label = "Year {}: ".format(year) if is_multi_year else ""
+        year_records = [record for record in records if record["year"] == year]
+        day_timings = {
+            record["day"]: get_solving_time(record) for record in year_records
+        }
+        # Only the timings on the actual inputs are used to schedule the days
+        if args.scale is None:
+            save_timings(year, day_timings)
+        if args.scaling:
+            superlinear_days = [
+                record["day"]
+                for record in sorted(year_records, key=lambda record: record["day"])
+                if (record["scaling"] or {}).get("superlinear")
+            ]
+            print(
+                "\n{}Super-linear day(s): {}".format(
+                    year_label, ", ".join(map(str, superlinear_days)) or "none"
+                )
+            )
+
+        baseline_path = args.baseline or BASELINE_PATH.format(year=year)
+        if args.save_baseline:
+            save_baseline(baseline_path, year, day_timings)
+        elif args.check_baseline:
+            try:
+                baseline_timings = load_baseline(baseline_path)
+            except FileNotFoundError:
+                print(
+                    "{}No baseline to check against in '{}' "
+                    "(save one first with '--save_baseline')".format(
+                        year_label, baseline_path
+                    )
+                )
+                result = False
+                continue
+            regressions = find_regressions(
+                day_timings,
+                baseline_timings,
+                max_slowdown_ratio=args.max_slowdown_ratio,
+                max_slowdown_ms=args.max_slowdown_ms,
             )
+            for regression in regressions:
+                print(year_label + format_regression(*regression))
+            result = (len(regressions) == 0) and result
+
+    if is_multi_year:
+        summary = summarize_by_year(records)
+        print()
+        for year, year_summary in summary["years"].items():
+            print(format_summary("Year {}".format(year), year_summary))
+        print(format_summary("Overall", summary["overall"]))
+
+    if args.watch:
+        watch_and_solve(args)
 
     sys.exit(0 if result else 1)
 
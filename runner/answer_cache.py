@@ -0,0 +1,76 @@
+import hashlib
+import os
+import pickle
+
+from .sources import find_module_path, get_dependencies
+
+
+# Local cache of the answers (and measures) of the solvers.
+# Each entry is addressed by the hash of the input (of its lines, or of its file when
+# it is not loaded by the runner), of the solver's sources
+# (including the in-repo modules it imports) and of the additional parameters.
+ANSWER_CACHE_DIR = os.path.join(".cache", "answers")
+ENTRY_PATH = "{key}.pickle"
+
+
+def get_sources_hash(module_name):
+    """Hash of the sources of a module and of the in-repo modules it (transitively) imports.
+
+    Return 'None' if the module cannot be found.
+    """
+    if find_module_path(module_name) is None:
+        return None
+
+    sources_hash = hashlib.sha256()
+    for name in get_dependencies(module_name):
+        with open(find_module_path(name), "rb") as module_file:
+            sources_hash.update(name.encode("utf-8"))
+            sources_hash.update(hashlib.sha256(module_file.read()).digest())
+    return sources_hash.hexdigest()
+
+
+def get_file_hash(path, chunk_size=1 << 20):
+    # In constant memory
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as input_file:
+        for chunk in iter(lambda: input_file.read(chunk_size), b""):
+            file_hash.update(chunk)
+    return file_hash.digest()
+
+
+class AnswerCache:
+    def __init__(self, cache_dir=ANSWER_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def get_key(module_name, input_lines, additional_args, input_path=None):
+        sources_hash = get_sources_hash(module_name)
+        if sources_hash is None:
+            return None
+        key = hashlib.sha256()
+        key.update(sources_hash.encode("utf-8"))
+        if input_lines is None:
+            key.update(get_file_hash(input_path))
+        else:
+            key.update(hashlib.sha256("\n".join(input_lines).encode("utf-8")).digest())
+        key.update(repr(additional_args).encode("utf-8"))
+        return key.hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, ENTRY_PATH.format(key=key))
+
+    def get(self, key):
+        entry_path = self._entry_path(key)
+        if not os.path.isfile(entry_path):
+            return None
+        with open(entry_path, "rb") as entry_file:
+            return pickle.load(entry_file)
+
+    def set(self, key, answers, measures):
+        entry_path = self._entry_path(key)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Allow the days to be cached concurrently by several worker processes
+        tmp_path = "{}.{}.tmp".format(entry_path, os.getpid())
+        with open(tmp_path, "wb") as tmp_file:
+            pickle.dump((answers, measures), tmp_file)
+        os.replace(tmp_path, entry_path)
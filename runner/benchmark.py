@@ -0,0 +1,51 @@
+import math
+import statistics
+import time
+
+
+def benchmark(function, input_lines, *args, warmup=1, repeat=10):
+    """Time 'function(input_lines, *args)' over several repetitions.
+
+    Each call gets a fresh copy of 'input_lines' as some solvers mutate their input.
+    The first 'warmup' calls are not timed, to discard the first-call effects.
+    Return the statistics (in ms) of the 'repeat' timed calls.
+    """
+    for _ in range(warmup):
+        function(list(input_lines), *args)
+
+    timings = []
+    for _ in range(repeat):
+        lines = list(input_lines)
+        tic = time.perf_counter_ns()
+        function(lines, *args)
+        toc = time.perf_counter_ns()
+        timings.append((toc - tic) / 1e6)
+
+    return get_statistics(timings)
+
+
+def get_statistics(timings):
+    sorted_timings = sorted(timings)
+    # Nearest-rank percentile
+    p95_idx = max(math.ceil(0.95 * len(sorted_timings)) - 1, 0)
+    return {
+        "min": sorted_timings[0],
+        "median": statistics.median(sorted_timings),
+        "p95": sorted_timings[p95_idx],
+        "stddev": statistics.stdev(sorted_timings) if len(sorted_timings) > 1 else 0.0,
+        "repeat": len(sorted_timings),
+    }
+
+
+def format_statistics(day, stats):
+    return (
+        "Day {} benchmark ({} runs): min = {:.3f} ms ; median = {:.3f} ms ; "
+        "p95 = {:.3f} ms ; stddev = {:.3f} ms".format(
+            day,
+            stats["repeat"],
+            stats["min"],
+            stats["median"],
+            stats["p95"],
+            stats["stddev"],
+        )
+    )
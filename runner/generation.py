@@ -0,0 +1,33 @@
+import os
+import random
+
+from .server_cache import write_atomically
+
+
+# Synthetic inputs written by the generators, to be fed to the solvers outside of the runner
+GENERATED_INPUT_DIR = os.path.join(".cache", "generated")
+GENERATED_INPUT_PATH = os.path.join("{year}", "day{day}_scale{scale:g}_seed{seed}.txt")
+
+
+def get_rng(year, day, seed=0):
+    # Seeded from a string, so that the stream is the same across runs and platforms
+    return random.Random("{}/{}/{}".format(year, day, seed))
+
+
+def generate_input(generating_module, year, day, scale=1.0, seed=0):
+    """Generate a valid synthetic input for a given (year, day).
+
+    'scale' is the size of the generated input relative to the size of an actual input
+    (e.g. 10 for 10 times more lines, cells or numbers).
+    The same 'seed' always gives the same input.
+    The input is also written to 'GENERATED_INPUT_DIR'.
+    Return the lines of the input.
+    """
+    input_lines = generating_module.generate(get_rng(year, day, seed), scale)
+
+    input_path = os.path.join(
+        GENERATED_INPUT_DIR,
+        GENERATED_INPUT_PATH.format(year=year, day=day, scale=scale, seed=seed),
+    )
+    write_atomically(input_path, "".join(line + "\n" for line in input_lines).encode())
+    return input_lines
@@ -0,0 +1,92 @@
+import re
+import subprocess
+import sys
+
+
+IMPORT_TIME_PATTERN = re.compile(
+    r"^import time:\s+(?P<self_us>\d+) \|\s+(?P<cumulative_us>\d+) \|(?P<name> +\S+)$"
+)
+
+# Categories of the imported modules, by prefix of their names.
+# The other modules are accounted in the category of the module importing them.
+CATEGORIES = [
+    ("solvers", re.compile(r"^\d{4}\.solver(\.|$)")),
+    ("runner", re.compile(r"^runner(\.|$)")),
+    ("numpy", re.compile(r"^numpy(\.|$)")),
+    ("requests", re.compile(r"^requests(\.|$)")),
+]
+# Modules imported at the interpreter start-up or directly by 'main.py'
+DEFAULT_CATEGORY = "start-up / main"
+
+
+def get_category(module_name):
+    for category, pattern in CATEGORIES:
+        if pattern.match(module_name):
+            return category
+    return None
+
+
+def parse_import_times(lines):
+    """Parse the output of 'python -X importtime'.
+
+    Return the list of (self time in us, depth, module name), in import order
+    (i.e. each module before the modules it imports).
+    """
+    imports = []
+    for line in lines:
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match is None:
+            continue
+        name = match.group("name")
+        # The depth of an import is given by the indentation of its name (by 2 spaces)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((int(match.group("self_us")), depth, name.strip()))
+    # The modules are listed after the modules they import
+    imports.reverse()
+    return imports
+
+
+def get_import_times_by_category(imports):
+    import_times = {}
+    importers_categories = []
+    for self_us, depth, name in imports:
+        del importers_categories[depth:]
+        category = get_category(name)
+        if category is None:
+            category = (
+                importers_categories[-1] if importers_categories else DEFAULT_CATEGORY
+            )
+        importers_categories.append(category)
+        import_times[category] = import_times.get(category, 0) + self_us / 1000
+    return import_times
+
+
+def run_with_import_times(argv):
+    """Run the command line 'argv' (of a Python script) with '-X importtime',
+    and print how the import time splits across the categories of modules.
+
+    Return the exit code of the command.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv],
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
+    other_lines = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            other_lines.append(line)
+    if other_lines:
+        print("\n".join(other_lines), file=sys.stderr)
+
+    import_times = get_import_times_by_category(
+        parse_import_times(process.stderr.splitlines())
+    )
+    print("Import times:")
+    for category, import_time in sorted(
+        import_times.items(), key=lambda item: -item[1]
+    ):
+        print("    {}: {:.1f} ms".format(category, import_time))
+    print("    total: {:.1f} ms".format(sum(import_times.values())))
+    return process.returncode
@@ -0,0 +1,91 @@
+import contextlib
+import mmap
+import os
+
+
+# Optional attribute of a solving module declaring how it receives its input
+# (as the first argument of its 'main', or of its 'parse'):
+# - 'lines' (default): the list of the lines of the input
+# - 'stream': a lazy iterator over the lines of the input, read on the fly
+# - 'mmap': a read-only memory map of the input file (a bytes-like object)
+# With the last two, the input is not loaded in memory by the runner:
+# the solvers can process inputs which do not fit in it.
+INPUT_MODE_ATTRIBUTE = "INPUT_MODE"
+LINES, STREAM, MMAP = "lines", "stream", "mmap"
+INPUT_MODES = (LINES, STREAM, MMAP)
+
+
+def get_input_mode(solving_module):
+    input_mode = getattr(solving_module, INPUT_MODE_ATTRIBUTE, LINES)
+    if input_mode not in INPUT_MODES:
+        raise ValueError(
+            "Unsupported input mode '{}' (expected one of: {})".format(
+                input_mode, ", ".join(INPUT_MODES)
+            )
+        )
+    return input_mode
+
+
+def iter_lines(input_path):
+    """Lazily iterate over the lines of a file, without their line breaks.
+
+    Same lines as 'str.splitlines' on the content of the file, in constant memory.
+    """
+    # pylint: disable=unspecified-encoding
+    with open(input_path, "r") as input_file:
+        for line in input_file:
+            yield line[:-1] if line.endswith("\n") else line
+    # pylint: enable=unspecified-encoding
+
+
+@contextlib.contextmanager
+def map_file(input_path):
+    with open(input_path, "rb") as input_file:
+        # An empty file cannot be memory-mapped
+        if os.fstat(input_file.fileno()).st_size == 0:
+            yield b""
+            return
+        input_map = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield input_map
+        finally:
+            try:
+                input_map.close()
+            except BufferError:
+                # Views of the map are still alive (e.g. numpy arrays referenced
+                # by the traceback of an exception raised by the solver):
+                # the map is released with the last of them, and the exception
+                # of the solver, if any, propagates unchanged
+                pass
+
+
+@contextlib.contextmanager
+def deliver_input(input_mode, input_lines=None, input_path=None):
+    """Deliver the input of a solver in its input mode.
+
+    From its lines when they are already loaded, otherwise from its file.
+    """
+    with contextlib.ExitStack() as stack:
+        if input_mode == LINES:
+            yield list(iter_lines(input_path)) if input_lines is None else input_lines
+        elif input_mode == STREAM:
+            yield iter_lines(input_path) if input_lines is None else iter(input_lines)
+        elif input_lines is None:
+            yield stack.enter_context(map_file(input_path))
+        else:
+            yield "".join(line + "\n" for line in input_lines).encode("utf-8")
+
+
+def from_lines(function, input_mode):
+    """Wrap a function of the input delivered in 'input_mode' into a function of the lines.
+
+    To be benchmarked like the other solvers.
+    """
+    if input_mode == LINES:
+        return function
+
+    def function_of_lines(input_lines, *args):
+        with deliver_input(input_mode, input_lines=input_lines) as delivered_input:
+            return function(delivered_input, *args)
+
+    return function_of_lines
@@ -0,0 +1,101 @@
+import os
+import threading
+import tracemalloc
+
+from .report import get_peak_rss_kb
+
+
+class MemorySampler(threading.Thread):
+    """Sample the memory usage of the process while a function is running.
+
+    - The peak RSS is sampled from '/proc/self/statm' (when available),
+    as 'ru_maxrss' only gives the peak of the whole process.
+    - A tracemalloc snapshot is taken every time the traced memory grows
+    beyond 'snapshot_growth' times the one of the last snapshot,
+    to find the top allocation sites close to the peak.
+    """
+
+    def __init__(self, interval=0.01, snapshot_growth=1.25):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.snapshot_growth = snapshot_growth
+        self.peak_rss_kb = get_current_rss_kb()
+        self.snapshot = None
+        self._snapshot_size = 0
+        self._stop_event = threading.Event()
+
+    def sample(self):
+        rss_kb = get_current_rss_kb()
+        if rss_kb is not None:
+            self.peak_rss_kb = max(self.peak_rss_kb, rss_kb)
+        traced_size, _ = tracemalloc.get_traced_memory()
+        if traced_size > self.snapshot_growth * self._snapshot_size:
+            self.snapshot = tracemalloc.take_snapshot()
+            self._snapshot_size = traced_size
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        self.sample()
+
+
+def get_current_rss_kb():
+    try:
+        # pylint: disable=unspecified-encoding
+        with open("/proc/self/statm", "r") as statm_file:
+            rss_pages = int(statm_file.read().split()[1])
+        # pylint: enable=unspecified-encoding
+    except OSError:
+        # Fallback on the peak RSS of the whole process
+        return get_peak_rss_kb()
+    return rss_pages * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+def trace_memory(function, *args, top=10):
+    """Call 'function(*args)' while tracing its memory usage.
+
+    The peak traced allocation, the peak RSS and the 'top' allocation sites
+    (close to the peak) are printed.
+    Return the result of the function and the memory measures (in kB).
+    """
+    tracemalloc.start()
+    sampler = MemorySampler()
+    sampler.start()
+    try:
+        result = function(*args)
+    finally:
+        sampler.stop()
+        _, peak_traced_size = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    measures = {
+        "peak_traced_kb": peak_traced_size // 1024,
+        "day_peak_rss_kb": sampler.peak_rss_kb,
+    }
+    print(
+        "Peak traced memory = {:.1f} MB ; peak RSS = {} MB".format(
+            measures["peak_traced_kb"] / 1024,
+            (
+                "?"
+                if measures["day_peak_rss_kb"] is None
+                else "{:.1f}".format(measures["day_peak_rss_kb"] / 1024)
+            ),
+        )
+    )
+    if sampler.snapshot is not None:
+        print("Top allocation sites:")
+        # Discard the allocations of the sampler itself
+        snapshot = sampler.snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, threading.__file__),
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ]
+        )
+        for statistic in snapshot.statistics("lineno")[:top]:
+            print("    {}".format(statistic))
+    return result, measures
@@ -0,0 +1,57 @@
+import time
+
+from .sandbox import get_context
+
+
+# Optional entry points of a solving module, used instead of its 'main':
+# - 'parse(input_lines, *additional_args)' returns the parsed input
+# - 'part1(parsed)' and 'part2(parsed)' return the answers of each part,
+# without modifying the parsed input (which is shared by both parts)
+PARTS_ENTRY_POINTS = ("parse", "part1", "part2")
+
+
+def has_parts(solving_module):
+    return all(hasattr(solving_module, name) for name in PARTS_ENTRY_POINTS)
+
+
+def timed_call(function, *args):
+    tic = time.perf_counter()
+    result = function(*args)
+    toc = time.perf_counter()
+    return result, (toc - tic) * 1000
+
+
+def solve_by_parts(
+    solving_module, measures, input_lines, *additional_args, parallel=False
+):
+    """Solve a puzzle through the 'parse' / 'part1' / 'part2' entry points of its module.
+
+    The input is parsed once for both parts. If 'parallel', part 2 is solved
+    in a child process while part 1 is solved in the current one.
+    The solving times (in ms) of the parsing and of each part are stored in 'measures'.
+    Return the answers of both parts.
+    """
+    parsed, measures["parse_time_ms"] = timed_call(
+        solving_module.parse, input_lines, *additional_args
+    )
+
+    if not parallel:
+        part1_answer, measures["part1_time_ms"] = timed_call(
+            solving_module.part1, parsed
+        )
+        part2_answer, measures["part2_time_ms"] = timed_call(
+            solving_module.part2, parsed
+        )
+        return part1_answer, part2_answer
+
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+
+    # pylint: enable=import-outside-toplevel
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context()) as executor:
+        part2_future = executor.submit(timed_call, solving_module.part2, parsed)
+        part1_answer, measures["part1_time_ms"] = timed_call(
+            solving_module.part1, parsed
+        )
+        part2_answer, measures["part2_time_ms"] = part2_future.result()
+    return part1_answer, part2_answer
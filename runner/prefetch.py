@@ -0,0 +1,75 @@
+import contextlib
+import threading
+import time
+
+
+class RateLimitedSession:
+    """Share a single HTTP session (and its connection pool) between threads,
+    with at most 'rate' requests per second."""
+
+    def __init__(self, n_threads, rate):
+        # Only imported when needed: it is long to import
+        import requests  # pylint: disable=import-outside-toplevel
+
+        self._sess = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=n_threads
+        )
+        self._sess.mount("https://", adapter)
+        self._sess.mount("http://", adapter)
+        self._min_interval = 1 / rate
+        self._next_request_time = time.monotonic()
+        self._lock = threading.Lock()
+
+    def get(self, *args, **kwargs):
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_request_time - now
+            self._next_request_time = max(now, self._next_request_time) + (
+                self._min_interval
+            )
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return self._sess.get(*args, **kwargs)
+
+    def close(self):
+        self._sess.close()
+
+
+class FetchedData:  # pylint: disable=too-few-public-methods
+    """Picklable copy of the outcome of a done future, to be sent to a worker process."""
+
+    def __init__(self, future):
+        self._exception = future.exception()
+        self._result = None if self._exception is not None else future.result()
+
+    def result(self):
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+
+@contextlib.contextmanager
+def prefetch(fetch_function, puzzles, *args, n_threads=4, rate=5):
+    """Call 'fetch_function(year, day, *args, sess=sess)' for all the (year, day)
+    puzzles concurrently, sharing a single rate-limited session.
+
+    Yield the futures of each (year, day), so that each day can be solved as soon as
+    its data is available, while the data of the next days are still being fetched.
+    """
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ThreadPoolExecutor
+
+    # pylint: enable=import-outside-toplevel
+    sess = RateLimitedSession(n_threads, rate)
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        futures = {
+            (year, day): executor.submit(fetch_function, year, day, *args, sess=sess)
+            for year, day in puzzles
+        }
+        try:
+            yield futures
+        finally:
+            for future in futures.values():
+                future.cancel()
+    sess.close()
@@ -0,0 +1,28 @@
+import os
+
+
+# Profiling statistics of each day, to be explored with 'pstats' or 'snakeviz'
+PROFILE_PATH = os.path.join(".cache", "profile", "{year}", "day{day}.pstats")
+
+
+def profile(function, *args, stats_path=None, top=10):
+    """Call 'function(*args)' under cProfile and return its result.
+
+    The statistics are dumped to 'stats_path' (if any), and the 'top' functions
+    by cumulative and total time are printed.
+    """
+    # Only imported when profiling, to keep the start-up fast
+    import cProfile  # pylint: disable=import-outside-toplevel
+    import pstats  # pylint: disable=import-outside-toplevel
+
+    profiler = cProfile.Profile()
+    result = profiler.runcall(function, *args)
+
+    if stats_path is not None:
+        os.makedirs(os.path.dirname(stats_path), exist_ok=True)
+        profiler.dump_stats(stats_path)
+
+    stats = pstats.Stats(profiler).strip_dirs()
+    for sort_key in (pstats.SortKey.CUMULATIVE, pstats.SortKey.TIME):
+        stats.sort_stats(sort_key).print_stats(top)
+    return result
@@ -0,0 +1,74 @@
+import json
+import os
+import platform
+
+
+# Committed timings of reference, produced by the benchmark mode
+BASELINE_PATH = os.path.join("{year}", "bench", "baseline.json")
+
+
+def load_baseline(baseline_path):
+    # pylint: disable=unspecified-encoding
+    with open(baseline_path, "r") as baseline_file:
+        baseline = json.load(baseline_file)
+    # pylint: enable=unspecified-encoding
+    return {int(day): timing for day, timing in baseline["timings_ms"].items()}
+
+
+def save_baseline(baseline_path, year, day_timings):
+    # Only the days which were run are updated: the others keep their baseline
+    baseline_timings = (
+        load_baseline(baseline_path) if os.path.isfile(baseline_path) else {}
+    )
+    for day, timing in day_timings.items():
+        if timing is not None:
+            baseline_timings[day] = timing
+    baseline = {
+        "year": year,
+        "python_version": platform.python_version(),
+        "timings_ms": {
+            str(day): timing for day, timing in sorted(baseline_timings.items())
+        },
+    }
+
+    os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+    # pylint: disable=unspecified-encoding
+    with open(baseline_path, "w") as baseline_file:
+        json.dump(baseline, baseline_file, indent=2)
+        baseline_file.write("\n")
+    # pylint: enable=unspecified-encoding
+
+
+def find_regressions(
+    day_timings, baseline_timings, max_slowdown_ratio=None, max_slowdown_ms=None
+):
+    """Compare the solving times (in ms) to the ones of the baseline.
+
+    A day regresses when it is slower than its baseline by more than 'max_slowdown_ratio'
+    or by more than 'max_slowdown_ms'. The days absent from the baseline are ignored.
+    Return the list of (day, timing, baseline_timing) which regressed.
+    """
+    regressions = []
+    for day, timing in sorted(day_timings.items()):
+        baseline_timing = baseline_timings.get(day)
+        if timing is None or baseline_timing is None:
+            continue
+        if (
+            max_slowdown_ratio is not None
+            and timing > max_slowdown_ratio * baseline_timing
+        ) or (
+            max_slowdown_ms is not None and timing - baseline_timing > max_slowdown_ms
+        ):
+            regressions.append((day, timing, baseline_timing))
+    return regressions
+
+
+def format_regression(day, timing, baseline_timing):
+    return (
+        "Day {} is slower than its baseline: {:.3f} ms VS {:.3f} ms (x{:.2f})".format(
+            day,
+            timing,
+            baseline_timing,
+            timing / baseline_timing if baseline_timing > 0 else float("inf"),
+        )
+    )
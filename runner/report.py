@@ -0,0 +1,149 @@
+from datetime import datetime, timezone
+import json
+import os
+import platform
+import subprocess
+import sys
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None  # type: ignore  # pylint: disable=invalid-name
+
+
+# Bump when the schema of the report changes in a non backward-compatible way
+REPORT_SCHEMA_VERSION = 1
+
+
+def get_peak_rss_kb():
+    """Peak resident set size (in kB) of the current process."""
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # 'ru_maxrss' is in bytes on macOS, but in kB on Linux
+    if sys.platform == "darwin":
+        peak_rss //= 1024
+    return peak_rss
+
+
+def get_git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def make_record(
+    year,
+    day,
+    answers=None,
+    solutions=None,
+    verdicts=None,
+    *,
+    error=None,
+    input_scale=None,
+    input_seed=None,
+    **measures,
+):
+    """One record of the report, for a given (year, day).
+
+    All the fields are always present (possibly 'None'), and the answers / solutions
+    are stored as strings, so that the schema is stable.
+    """
+    return {
+        "year": year,
+        "day": day,
+        "solved": answers is not None,
+        "answers": None if answers is None else [str(answer) for answer in answers],
+        "solutions": (
+            None
+            if solutions is None
+            else [None if solution is None else str(solution) for solution in solutions]
+        ),
+        "verdicts": verdicts,
+        # Only for the synthetic inputs (see '--scale')
+        "input_scale": input_scale,
+        "input_seed": input_seed,
+        # Why the day could not be solved: 'TIMEOUT', 'OOM' or 'CRASHED'
+        "error": error,
+        "wall_time_ms": measures.get("wall_time_ms"),
+        "cpu_time_ms": measures.get("cpu_time_ms"),
+        "peak_rss_kb": measures.get("peak_rss_kb"),
+        # Only for the solvers split into 'parse' / 'part1' / 'part2'
+        "parse_time_ms": measures.get("parse_time_ms"),
+        "part1_time_ms": measures.get("part1_time_ms"),
+        "part2_time_ms": measures.get("part2_time_ms"),
+        "peak_traced_kb": measures.get("peak_traced_kb"),
+        "day_peak_rss_kb": measures.get("day_peak_rss_kb"),
+        "bench": measures.get("bench"),
+        "variants": measures.get("variants"),
+        "scaling": measures.get("scaling"),
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+    }
+
+
+def summarize(records):
+    """Aggregate the records of several days: number of days solved / failed
+    and total solving time (in ms).
+
+    A day fails when it could not be solved (e.g. 'TIMEOUT') or when any of its answers
+    is wrong (the days not solved yet do not fail).
+    """
+    return {
+        "days": len(records),
+        "solved": sum(record["solved"] for record in records),
+        "failed": sum(
+            record["error"] is not None or False in (record["verdicts"] or [])
+            for record in records
+        ),
+        "wall_time_ms": sum(record["wall_time_ms"] or 0 for record in records),
+    }
+
+
+def summarize_by_year(records):
+    """Summaries of the records of each year, and of all of them."""
+    years = sorted({record["year"] for record in records})
+    return {
+        "years": {
+            str(year): summarize(
+                [record for record in records if record["year"] == year]
+            )
+            for year in years
+        },
+        "overall": summarize(records),
+    }
+
+
+def format_summary(label, summary):
+    return "{}: {} / {} day(s) solved, {} failed, in {:.1f} ms".format(
+        label,
+        summary["solved"],
+        summary["days"],
+        summary["failed"],
+        summary["wall_time_ms"],
+    )
+
+
+def write_report(report_path, records):
+    report = {
+        "schema_version": REPORT_SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": get_git_commit(),
+        "platform": platform.platform(),
+        "summary": summarize_by_year(records),
+        "records": sorted(records, key=lambda record: (record["year"], record["day"])),
+    }
+
+    report_dir = os.path.dirname(report_path)
+    if report_dir:
+        os.makedirs(report_dir, exist_ok=True)
+    # pylint: disable=unspecified-encoding
+    with open(report_path, "w") as report_file:
+        json.dump(report, report_file, indent=2)
+    # pylint: enable=unspecified-encoding
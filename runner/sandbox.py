@@ -0,0 +1,99 @@
+import importlib
+import signal
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None  # type: ignore  # pylint: disable=invalid-name
+
+
+# Statuses of a function run in an isolated process
+SUCCESS = "SUCCESS"
+RAISED = "RAISED"
+TIMEOUT = "TIMEOUT"
+OOM = "OOM"
+CRASHED = "CRASHED"
+
+
+def get_context():
+    # Only imported when isolating the days, to keep the start-up fast
+    import multiprocessing  # pylint: disable=import-outside-toplevel
+
+    # Do not fork the parent process directly: it may be running threads (e.g. prefetch)
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def limit_memory(max_memory_mb):
+    if resource is None:
+        return
+    max_memory = max_memory_mb * 1024 * 1024
+    _, hard_limit = resource.getrlimit(resource.RLIMIT_AS)
+    if hard_limit != resource.RLIM_INFINITY:
+        max_memory = min(max_memory, hard_limit)
+    resource.setrlimit(resource.RLIMIT_AS, (max_memory, hard_limit))
+
+
+def preload_modules(module_names):
+    for module_name in module_names:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            # Left to the function: to fail (or handle it) like when not preloaded
+            pass
+
+
+def run_child(conn, function, args, max_memory_mb, preload):
+    # Before the limit: an import must not fail for lack of memory (e.g. numpy
+    # allocating the buffers of its BLAS library), it is not part of the run
+    preload_modules(preload)
+    if max_memory_mb is not None:
+        limit_memory(max_memory_mb)
+    try:
+        outcome = (SUCCESS, function(*args))
+    except MemoryError:
+        outcome = (OOM, None)
+    except Exception as exc:  # pylint: disable=broad-except
+        outcome = (RAISED, exc)
+    try:
+        conn.send(outcome)
+    except Exception:  # pylint: disable=broad-except
+        # The exception may not be picklable
+        conn.send((RAISED, RuntimeError(repr(outcome[1]))))
+    conn.close()
+
+
+def run_isolated(function, *args, timeout=None, max_memory_mb=None, preload=()):
+    """Call 'function(*args)' in a child process, within a wall-clock and a memory budget.
+
+    The child is killed if it exceeds 'timeout' (in s), and its address space
+    is limited to 'max_memory_mb' (in MB). The modules named in 'preload'
+    are imported by the child before limiting its memory.
+    Return the status of the run and the result of the function (if successful),
+    or the exception it raised (if any).
+    """
+    context = get_context()
+    parent_conn, child_conn = context.Pipe(duplex=False)
+    process = context.Process(
+        target=run_child, args=(child_conn, function, args, max_memory_mb, preload)
+    )
+    process.start()
+    # Only the child may write: to detect when it dies without a result
+    child_conn.close()
+
+    try:
+        if not parent_conn.poll(timeout):
+            process.kill()
+            return TIMEOUT, None
+        try:
+            return parent_conn.recv()
+        except EOFError:
+            process.join()
+            # The process was most likely killed by the OOM killer
+            if max_memory_mb is not None and process.exitcode == -signal.SIGKILL:
+                return OOM, None
+            return CRASHED, None
+    finally:
+        process.join()
+        parent_conn.close()
@@ -0,0 +1,86 @@
+import math
+
+from .benchmark import benchmark
+
+
+# Above this log-log slope of the solving time against the input size, a solver is
+# flagged as super-linear (with some margin for the noise of the timings)
+SUPERLINEAR_SLOPE = 1.2
+
+
+def get_input_size(input_lines):
+    return sum(len(line) + 1 for line in input_lines)
+
+
+def fit_slope(sizes, timings):
+    """Least-squares slope of log(timings) against log(sizes).
+
+    An empirical complexity: ~1 for a linear solver, ~2 for a quadratic one.
+    Return None when it cannot be fitted (e.g. the size does not change).
+    """
+    points = [
+        (math.log(size), math.log(timing))
+        for size, timing in zip(sizes, timings)
+        if size > 0 and timing > 0
+    ]
+    if len({log_size for log_size, _log_timing in points}) < 2:
+        return None
+    mean_log_size = sum(log_size for log_size, _log_timing in points) / len(points)
+    mean_log_timing = sum(log_timing for _log_size, log_timing in points) / len(points)
+    covariance = sum(
+        (log_size - mean_log_size) * (log_timing - mean_log_timing)
+        for log_size, log_timing in points
+    )
+    variance = sum((log_size - mean_log_size) ** 2 for log_size, _log_timing in points)
+    return covariance / variance
+
+
+def measure_scaling(function, generate_lines, scales, *args, warmup=1, repeat=10):
+    """Time 'function(input_lines, *args)' on inputs of several sizes.
+
+    'generate_lines(scale)' returns the lines of the input of a given scale.
+    Return the median solving time (in ms) and the size (in bytes) of the input
+    at each scale, and the log-log slope of the former against the latter.
+    """
+    points = []
+    for scale in sorted(scales):
+        input_lines = generate_lines(scale)
+        stats = benchmark(function, input_lines, *args, warmup=warmup, repeat=repeat)
+        points.append(
+            {
+                "scale": scale,
+                "input_bytes": get_input_size(input_lines),
+                "median": stats["median"],
+            }
+        )
+    slope = fit_slope(
+        [point["input_bytes"] for point in points],
+        [point["median"] for point in points],
+    )
+    return {
+        "points": points,
+        "slope": slope,
+        "superlinear": slope is not None and slope > SUPERLINEAR_SLOPE,
+    }
+
+
+def format_scaling(day, result):
+    lines = [
+        "Day {} scaling:".format(day),
+        "  {:>8}  {:>12}  {:>12}".format("scale", "input (kB)", "median (ms)"),
+    ]
+    for point in result["points"]:
+        lines.append(
+            "  {:>8g}  {:>12.1f}  {:>12.3f}".format(
+                point["scale"], point["input_bytes"] / 1024, point["median"]
+            )
+        )
+    if result["slope"] is None:
+        lines.append("  log-log slope: n/a (the input size does not grow)")
+    else:
+        lines.append(
+            "  log-log slope: {:.2f}{}".format(
+                result["slope"], " (SUPER-LINEAR)" if result["superlinear"] else ""
+            )
+        )
+    return "\n".join(lines)
@@ -0,0 +1,113 @@
+import json
+import os
+
+from .prefetch import FetchedData
+
+
+# Solving times (in ms) of the previous runs, used to schedule the longest days first
+TIMINGS_PATH = os.path.join(".cache", "timings.json")
+
+
+def load_timings(timings_path=TIMINGS_PATH):
+    if not os.path.isfile(timings_path):
+        return {}
+    # pylint: disable=unspecified-encoding
+    with open(timings_path, "r") as timings_file:
+        return json.load(timings_file)
+    # pylint: enable=unspecified-encoding
+
+
+def save_timings(year, day_timings, timings_path=TIMINGS_PATH):
+    timings = load_timings(timings_path)
+    year_timings = timings.setdefault(str(year), {})
+    for day, timing in day_timings.items():
+        if timing is not None:
+            year_timings[str(day)] = timing
+
+    os.makedirs(os.path.dirname(timings_path), exist_ok=True)
+    # pylint: disable=unspecified-encoding
+    with open(timings_path, "w") as timings_file:
+        json.dump(timings, timings_file, indent=2, sort_keys=True)
+    # pylint: enable=unspecified-encoding
+
+
+def order_longest_first(puzzles, timings):
+    """Sort the (year, day) puzzles from the longest to the shortest to solve."""
+    # Days that were never timed are scheduled first: they could be the longest ones
+    return sorted(
+        puzzles,
+        key=lambda puzzle: -timings.get(str(puzzle[0]), {}).get(
+            str(puzzle[1]), float("inf")
+        ),
+    )
+
+
+def copy_outcome(source_future, target_future):
+    if source_future.exception() is not None:
+        target_future.set_exception(source_future.exception())
+    else:
+        target_future.set_result(source_future.result())
+
+
+def submit_when_done(executor, future, function, *args):
+    """Submit 'function(*args, FetchedData(future))' to the executor once 'future' is done."""
+    from concurrent.futures import Future  # pylint: disable=import-outside-toplevel
+
+    chained_future = Future()
+
+    def submit(done_future):
+        try:
+            submitted_future = executor.submit(
+                function, *args, FetchedData(done_future)
+            )
+        except RuntimeError as exc:  # The pool is broken or shut down
+            chained_future.set_exception(exc)
+            return
+        submitted_future.add_done_callback(
+            lambda submitted_future: copy_outcome(submitted_future, chained_future)
+        )
+
+    future.add_done_callback(submit)
+    return chained_future
+
+
+def run_in_pool(
+    function,
+    puzzles,
+    *args,
+    jobs=None,
+    timings=None,
+    prefetched=None,
+    executor_class=None,
+):
+    """Run 'function(year, day, *args)' for all the (year, day) puzzles in a single
+    pool of workers (processes by default), whatever their year.
+
+    The days are submitted longest first (according to the previous timings),
+    so that the total run takes about as long as the slowest day.
+    The days with 'prefetched' data (futures, by (year, day)) are submitted as soon
+    as their data is available, which is passed as an additional 'FetchedData' argument.
+    The results are yielded in the order of 'puzzles', as soon as they are available.
+    """
+    if timings is None:
+        timings = load_timings()
+    if prefetched is None:
+        prefetched = {}
+    if executor_class is None:
+        # pylint: disable=import-outside-toplevel
+        from concurrent.futures import ProcessPoolExecutor
+
+        # pylint: enable=import-outside-toplevel
+        executor_class = ProcessPoolExecutor
+
+    with executor_class(max_workers=jobs) as executor:
+        futures = {}
+        for year, day in order_longest_first(puzzles, timings):
+            if (year, day) in prefetched:
+                futures[year, day] = submit_when_done(
+                    executor, prefetched[year, day], function, year, day, *args
+                )
+            else:
+                futures[year, day] = executor.submit(function, year, day, *args)
+        for year, day in puzzles:
+            yield (year, day), futures[year, day].result()
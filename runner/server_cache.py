@@ -0,0 +1,80 @@
+import hashlib
+import json
+import os
+
+
+# Local cache of the inputs and solutions got from the advent_of_code server (in CI).
+# The contents are stored once, addressed by their hash, in 'objects/'
+# and are referenced by one entry per (session, year, day).
+SERVER_CACHE_DIR = os.path.join(".cache", "server")
+OBJECT_PATH = os.path.join("objects", "{digest}")
+ENTRY_PATH = os.path.join("{session_hash}", "{year}", "day{day}.json")
+
+
+def get_session_hash(session):
+    # Never store the session cookie itself
+    return hashlib.sha256(session.encode("utf-8")).hexdigest()[:16]
+
+
+def write_atomically(path, content):
+    # Allow the days to be cached concurrently by several worker processes
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp_path, "wb") as tmp_file:
+        tmp_file.write(content)
+    os.replace(tmp_path, path)
+
+
+class ServerCache:
+    def __init__(self, session, cache_dir=SERVER_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.session_hash = get_session_hash(session)
+
+    def _entry_path(self, year, day):
+        return os.path.join(
+            self.cache_dir,
+            ENTRY_PATH.format(session_hash=self.session_hash, year=year, day=day),
+        )
+
+    def _load_entry(self, year, day):
+        entry_path = self._entry_path(year, day)
+        if not os.path.isfile(entry_path):
+            return {}
+        # pylint: disable=unspecified-encoding
+        with open(entry_path, "r") as entry_file:
+            return json.load(entry_file)
+        # pylint: enable=unspecified-encoding
+
+    def _update_entry(self, year, day, **fields):
+        entry = self._load_entry(year, day)
+        entry.update(fields)
+        write_atomically(
+            self._entry_path(year, day), json.dumps(entry, indent=2).encode("utf-8")
+        )
+
+    def get_input(self, year, day):
+        digest = self._load_entry(year, day).get("input")
+        if digest is None:
+            return None
+        object_path = os.path.join(self.cache_dir, OBJECT_PATH.format(digest=digest))
+        if not os.path.isfile(object_path):
+            return None
+        with open(object_path, "rb") as object_file:
+            content = object_file.read()
+        if hashlib.sha256(content).hexdigest() != digest:
+            # Corrupted object
+            return None
+        return content
+
+    def set_input(self, year, day, content):
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = os.path.join(self.cache_dir, OBJECT_PATH.format(digest=digest))
+        if not os.path.isfile(object_path):
+            write_atomically(object_path, content)
+        self._update_entry(year, day, input=digest)
+
+    def get_solutions(self, year, day):
+        return self._load_entry(year, day).get("solutions")
+
+    def set_solutions(self, year, day, solutions):
+        self._update_entry(year, day, solutions=solutions)
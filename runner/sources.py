@@ -0,0 +1,66 @@
+import ast
+import os
+
+
+def find_module_path(module_name):
+    """Path of the source of an in-repo module (or 'None' if it is not in the repo).
+
+    The path is resolved from the repository's root, without importing anything.
+    """
+    base_path = os.path.join(*module_name.split("."))
+    for module_path in (base_path + ".py", os.path.join(base_path, "__init__.py")):
+        if os.path.isfile(module_path):
+            return module_path
+    return None
+
+
+def find_imported_modules(module_name, module_path):
+    with open(module_path, "rb") as module_file:
+        tree = ast.parse(module_file.read(), filename=module_path)
+
+    package_name = module_name
+    if not module_path.endswith("__init__.py"):
+        package_name = module_name.rpartition(".")[0]
+
+    imported_modules = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imported_modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level == 0:
+                base_name = node.module
+            else:
+                base_name = package_name.rsplit(".", node.level - 1)[0]
+                if node.module is not None:
+                    base_name += "." + node.module
+            imported_modules.append(base_name)
+            # The imported names may be submodules
+            imported_modules.extend(
+                base_name + "." + alias.name for alias in node.names
+            )
+    return imported_modules
+
+
+def get_dependencies(module_name):
+    """Sorted names of the in-repo modules (transitively) imported by a module,
+    including itself."""
+    dependencies = set()
+    modules_to_visit = [module_name]
+    while modules_to_visit:
+        name = modules_to_visit.pop()
+        if name in dependencies:
+            continue
+        module_path = find_module_path(name)
+        if module_path is None:
+            continue
+        dependencies.add(name)
+        modules_to_visit.extend(find_imported_modules(name, module_path))
+    return sorted(dependencies)
+
+
+def get_module_name(module_path):
+    """Name of an in-repo module, from the path of its source (relative to the root)."""
+    module_path = os.path.splitext(os.path.normpath(module_path))[0]
+    if os.path.basename(module_path) == "__init__":
+        module_path = os.path.dirname(module_path)
+    return module_path.replace(os.sep, ".")
@@ -0,0 +1,59 @@
+from .benchmark import benchmark
+
+
+# Optional attribute of a solving module declaring its alternative implementations:
+# a dict '{name: function(input)}', ordered from the baseline implementation
+# to the most optimized one, whose outputs should be equal
+# (the input is delivered in the input mode of the module, see 'inputs.py')
+VARIANTS_ATTRIBUTE = "VARIANTS"
+
+
+def get_variants(solving_module):
+    return getattr(solving_module, VARIANTS_ATTRIBUTE, None)
+
+
+def compare_variants(variants, input_lines, *, warmup=1, repeat=10):
+    """Run all the 'variants' on the same input, and time them.
+
+    The first variant is the baseline: the output of the others is checked against
+    its output, and their speed-up is relative to it.
+    Return one result per variant.
+    """
+    results = []
+    baseline_output, baseline_median = None, None
+    for name, function in variants.items():
+        output = function(list(input_lines))
+        stats = benchmark(function, input_lines, warmup=warmup, repeat=repeat)
+        if not results:
+            baseline_output, baseline_median = output, stats["median"]
+        results.append(
+            {
+                "name": name,
+                "output": str(output),
+                "equivalent": bool(output == baseline_output),
+                "median": stats["median"],
+                "speed_up": baseline_median / stats["median"],
+            }
+        )
+    return results
+
+
+def format_variants(day, results):
+    name_width = max(len("variant"), *(len(result["name"]) for result in results))
+    lines = [
+        "Day {} variants:".format(day),
+        "  {:<{}}  {:>12}  {:>8}  {}".format(
+            "variant", name_width, "median (ms)", "speed-up", "equivalent"
+        ),
+    ]
+    for result in results:
+        lines.append(
+            "  {:<{}}  {:>12.3f}  {:>7.2f}x  {}".format(
+                result["name"],
+                name_width,
+                result["median"],
+                result["speed_up"],
+                "yes" if result["equivalent"] else "NO ({})".format(result["output"]),
+            )
+        )
+    return "\n".join(lines)
@@ -0,0 +1,75 @@
+import importlib
+import os
+import sys
+import time
+
+from .sources import find_module_path, get_dependencies, get_module_name
+
+
+def get_mtimes(paths):
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            continue
+    return mtimes
+
+
+def watch(get_paths, on_change, interval=0.5):
+    """Call 'on_change(changed_paths)' every time some of the watched files change
+    (i.e. are modified, created or deleted), until interrupted.
+
+    The files to watch are given by 'get_paths()', polled every 'interval' (in s).
+    """
+    mtimes = get_mtimes(get_paths())
+    while True:
+        time.sleep(interval)
+        new_mtimes = get_mtimes(get_paths())
+        changed_paths = sorted(
+            path
+            for path in set(mtimes) | set(new_mtimes)
+            if mtimes.get(path) != new_mtimes.get(path)
+        )
+        # Compare the next changes to the state before running 'on_change',
+        # in case some files are changed while it is running
+        mtimes = new_mtimes
+        if changed_paths:
+            on_change(changed_paths)
+
+
+def reload_modules(changed_modules):
+    """Reload the already imported in-repo modules which (transitively) import
+    any of the changed modules, dependencies first.
+
+    Return the names of the reloaded modules.
+    """
+    importlib.invalidate_caches()
+    changed_modules = set(changed_modules)
+    loaded_modules = [
+        name for name in list(sys.modules) if find_module_path(name) is not None
+    ]
+
+    dependencies = {name: get_dependencies(name) for name in loaded_modules}
+    stale_modules = {
+        name for name in loaded_modules if changed_modules & set(dependencies[name])
+    }
+
+    reloaded_modules = []
+
+    def reload(name):
+        if name in reloaded_modules:
+            return
+        for dependency in dependencies[name]:
+            if dependency != name and dependency in stale_modules:
+                reload(dependency)
+        importlib.reload(sys.modules[name])
+        reloaded_modules.append(name)
+
+    for name in sorted(stale_modules):
+        reload(name)
+    return reloaded_modules
+
+
+def get_changed_modules(changed_paths):
+    return {get_module_name(path) for path in changed_paths if path.endswith(".py")}
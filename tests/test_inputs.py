@@ -0,0 +1,36 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from common.grid import read_grid
+from runner.inputs import MMAP, deliver_input
+
+
+class TestDeliverMmapInput(unittest.TestCase):
+    def setUp(self):
+        input_file, self.input_path = tempfile.mkstemp()
+        with os.fdopen(input_file, "wb") as input_file:
+            # Not rectangular: 'read_grid' raises, while viewing the map
+            input_file.write(b"abc\nde\n")
+
+    def tearDown(self):
+        os.remove(self.input_path)
+
+    def test_solver_exception_reaches_caller(self):
+        with self.assertRaises(ValueError) as raised:
+            with deliver_input(MMAP, input_path=self.input_path) as input_bytes:
+                read_grid(input_bytes)
+        self.assertEqual(str(raised.exception), "The grid is not rectangular")
+        # Not replaced by (nor chained to) an error while closing the map
+        self.assertIsNone(raised.exception.__context__)
+
+    def test_views_outlive_map(self):
+        with deliver_input(MMAP, input_path=self.input_path) as input_bytes:
+            view = np.frombuffer(input_bytes, dtype=np.uint8)
+        self.assertEqual(view.tobytes(), b"abc\nde\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
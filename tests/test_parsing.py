@@ -0,0 +1,50 @@
+import unittest
+
+import numpy as np
+
+from common.parsing import parse_int_groups, parse_ints
+
+
+class TestParseInts(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual(parse_ints(b"1\n-23\n\n456\n").tolist(), [1, -23, 456])
+        self.assertEqual(parse_ints(b"3,4,3\n", sep=",").tolist(), [3, 4, 3])
+        self.assertEqual(parse_ints(b"").tolist(), [])
+
+    def test_reject_malformed(self):
+        for input_bytes in (b"1 2\n3\n", b"1,2\n", b"1-2\n", b"-\n", b"x\n"):
+            with self.subTest(input_bytes=input_bytes):
+                with self.assertRaises(ValueError):
+                    parse_ints(input_bytes)
+
+
+class TestParseIntGroups(unittest.TestCase):
+    def assert_groups(self, input_bytes, expected_groups):
+        values, offsets = parse_int_groups(input_bytes)
+        self.assertEqual(values.dtype, np.int64)
+        self.assertEqual(offsets.dtype, np.intp)
+        groups = [
+            values[start:end].tolist() for start, end in zip(offsets, offsets[1:])
+        ]
+        self.assertEqual(groups, expected_groups)
+
+    def test_parse(self):
+        self.assert_groups(b"1\n2\n\n3\n\n4\n5", [[1, 2], [3], [4, 5]])
+
+    def test_trailing_newlines(self):
+        self.assert_groups(b"1\n2\n\n3\n", [[1, 2], [3]])
+        self.assert_groups(b"1\n2\n\n3\n\n\n", [[1, 2], [3]])
+
+    def test_blank_lines(self):
+        # Each blank line ends a group: consecutive ones make empty groups
+        self.assert_groups(b"1\n\n\n2\n", [[1], [], [2]])
+        self.assert_groups(b"\n1\n", [[], [1]])
+        self.assert_groups(b"", [[]])
+
+    def test_reject_malformed(self):
+        with self.assertRaises(ValueError):
+            parse_int_groups(b"1 2\n\n3\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,22 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from runner.regression import load_baseline, save_baseline
+
+
+class TestSaveBaseline(unittest.TestCase):
+    def setUp(self):
+        baseline_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, baseline_dir)
+        self.baseline_path = os.path.join(baseline_dir, "bench", "baseline.json")
+
+    def test_save_subset_of_days(self):
+        save_baseline(self.baseline_path, 2022, {1: 10.0, 2: 20.0, 3: 30.0})
+        save_baseline(self.baseline_path, 2022, {2: 25.0, 3: None})
+        self.assertEqual(load_baseline(self.baseline_path), {1: 10.0, 2: 25.0, 3: 30.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import sys
+import unittest
+
+from runner.sandbox import CRASHED, OOM, RAISED, SUCCESS, run_isolated
+
+
+def import_missing_module():
+    # pylint: disable=import-outside-toplevel,unused-import,import-error
+    import missing_module
+
+
+def raise_value_error():
+    raise ValueError("Invalid input")
+
+
+def abort():
+    os.abort()
+
+
+def is_imported(module_name):
+    return module_name in sys.modules
+
+
+def allocate_too_much():
+    return bytearray(2 * 1024 * 1024 * 1024)
+
+
+class TestRunIsolated(unittest.TestCase):
+    def test_success(self):
+        self.assertEqual(run_isolated(sum, [1, 2]), (SUCCESS, 3))
+
+    def test_raised(self):
+        status, exc = run_isolated(raise_value_error, max_memory_mb=1000)
+        self.assertEqual(status, RAISED)
+        self.assertIsInstance(exc, ValueError)
+
+    def test_import_error_within_memory_limit(self):
+        # A missing module is not a lack of memory
+        status, exc = run_isolated(import_missing_module, max_memory_mb=1000)
+        self.assertEqual(status, RAISED)
+        self.assertIsInstance(exc, ImportError)
+
+    def test_abort_within_memory_limit(self):
+        self.assertEqual(run_isolated(abort, max_memory_mb=1000), (CRASHED, None))
+
+    def test_memory_error(self):
+        self.assertEqual(
+            run_isolated(allocate_too_much, max_memory_mb=1000), (OOM, None)
+        )
+
+    def test_preload(self):
+        self.assertEqual(
+            run_isolated(
+                is_imported, "colorsys", max_memory_mb=1000, preload=("colorsys",)
+            ),
+            (SUCCESS, True),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()